@@ -1,31 +1,58 @@
-import heapq
 from searchAlgorithm import SearchAlgorithm
+from priorityQueue import make_queue
 
 class AStar(SearchAlgorithm):
+    tie_breaks = ("shallow", "deep", "position")
+
+    def __init__(self, grid, start, goals, walls, terrain=None, queue="heap", movement=None, weight=1, tie_break="shallow"):
+        """
+        A* search with optional weighting and tie-breaking:
+        - weight: Heuristic weight (f = g + weight * h), paths cost at most weight times the optimum
+        - tie_break: Order of nodes with equal f: "shallow" (fewest moves first), "deep" (largest g
+          first, which runs straight across open plateaus) or "position" (lowest x, then y, first)
+        The bucket queue pops equal priorities in insertion order and ignores the tie-break.
+        """
+        super().__init__(grid, start, goals, walls, terrain, movement)
+        if tie_break not in self.tie_breaks:
+            raise ValueError(f"Unknown tie-break: {tie_break}. Choose from {list(self.tie_breaks)}.")
+        self.queue = queue # Frontier implementation: "heap", "indexed" or "bucket" (integer costs only)
+        self.weight = int(weight) if float(weight).is_integer() else weight # Whole weights keep integer priorities
+        self.tie_break = tie_break
+        self.duplicate_pops = 0 # Stale entries popped for already visited cells
+        self.peak_frontier = 0 # Largest number of entries held in the open list
+
     def search(self):
-        open_list = []
+        open_list = make_queue(self.queue)
         visited = set()
         self.nodes_visited = 0
+        self.duplicate_pops = 0
+        self.peak_frontier = 0
+        if not self.reachable_goals: # Start and goals lie in different connected components
+            return None, self.nodes_visited, [], self.visited_result()
 
         # Initialize the starting node and its f-cost
-        goal = self.get_closest_goal(self.start)
+        weight = self.weight
+        goal_distance = self.goal_distance # Distance to the closest goal, admissible with several goals
         g_costs = {self.start: 0}  # Cost from start to each node
-        f_cost = self.heuristic(self.start, goal) # Heuristic cost from start to goal
+        f_cost = weight * goal_distance(self.start) # Heuristic cost from start to the closest goal
 
         # Push the starting node into the open list with its f-cost and path
-        heapq.heappush(open_list, (f_cost, 0, self.start, []))
+        open_list.push((f_cost, 0, self.start, []))
 
         while open_list:
-            _, _, current, path = heapq.heappop(open_list) # Get the node with the lowest f-cost
+            self.peak_frontier = max(self.peak_frontier, len(open_list))
+            _, _, current, path = open_list.pop() # Get the node with the lowest f-cost
 
             if current in visited:
+                self.duplicate_pops += 1
                 continue
             self.nodes_visited += 1 # Only unique nodes are counted as visited
             visited.add(current)
+            self._track(open_list, visited)
 
             # Check if the current node is a goal
-            if current in self.goals:
-                return current, self.nodes_visited, path, list(visited)
+            if current in self.goal_set:
+                return current, self.nodes_visited, path, self.visited_result(visited)
 
             # Iterate through possible moves (UP, LEFT, DOWN, RIGHT)
             for dx, dy, move in self.directions:
@@ -33,18 +60,25 @@ class AStar(SearchAlgorithm):
                 neighbor = (nx, ny)
 
                 # Check if the neighbor is valid and not already visited
-                if not self.is_valid(neighbor) or neighbor in visited:
+                if not self.can_move(current, neighbor) or neighbor in visited:
                     continue
                 
-                # Calculate the cost to reach the neighbor
-                tentative_g = g_costs[current] + 1
+                # Calculate the cost to reach the neighbor (terrain cost of the cell entered, times the move length)
+                tentative_g = g_costs[current] + self.move_cost(current, neighbor)
                 if neighbor not in g_costs or tentative_g < g_costs[neighbor]:
                     g_costs[neighbor] = tentative_g
-                    f = tentative_g + self.heuristic(neighbor, goal) # f(n) = g(n) + h(n)
+                    f = tentative_g + weight * goal_distance(neighbor) # f(n) = g(n) + w * h(n)
 
-                    # Add the neighbor to the open list with its f-cost and path
-                    path_length = len(path) + 1
-                    heapq.heappush(open_list, (f, path_length, neighbor, path + [move]))
+                    # Add the neighbor to the open list with its f-cost, tie-break key and path
+                    open_list.push((f, self.tie_key(tentative_g, len(path) + 1), neighbor, path + [move]))
             
-        return None, self.nodes_visited, [], list(visited)
+        return None, self.nodes_visited, [], self.visited_result(visited)
+
+    def tie_key(self, g, path_length):
+        """Second sort key of a frontier entry, ordering nodes with equal f"""
+        if self.tie_break == "deep":
+            return -g
+        if self.tie_break == "position":
+            return 0 # Equal keys fall through to the position, the next entry field
+        return path_length
 
@@ -0,0 +1,157 @@
+import math
+
+class AlgorithmRanking:
+    metrics = ("time", "nodes", "memory")
+    floors = {"time": 0.001, "nodes": 1, "memory": 0.01} # Smallest values used in ratios (ms, nodes, KB)
+    failure_penalty = 10 # An unsolved test counts as this many times the worst ratio on that test
+    # Two-sided 95% Student t critical values by degrees of freedom, normal value beyond 30
+    t_values = [12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+                2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+                2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042]
+
+    def __init__(self):
+        """
+        Rank algorithms test by test instead of by raw averages:
+        - On each test, time, nodes visited and peak memory are divided by the best value any
+          algorithm achieved on that test, so every test counts the same whatever its scale
+        - Ratios are combined with geometric means and a 95% confidence interval
+        - A run solves a test when it finds a path on a reachable test or correctly reports
+          none on an unreachable one; unsolved runs get a penalty ratio (failure_penalty times
+          the worst ratio on that test)
+        - The optimality gap compares path length to BFS, which finds the shortest path
+        Only running sums are kept per algorithm and test type, not the rows themselves.
+        """
+        self.groups = {} # Test type (or "ALL") -> algorithm -> running sums
+
+    def _sums(self, group, algo):
+        """Running sums of one algorithm in one group"""
+        algorithms = self.groups.setdefault(group, {})
+        if algo not in algorithms:
+            algorithms[algo] = {"tests": 0, "solved": 0, "gap": [0, 0.0, 0.0], "score": [0, 0.0, 0.0],
+                                **{metric: [0, 0.0, 0.0] for metric in self.metrics}} # [n, sum, sum of squares]
+        return algorithms[algo]
+
+    @staticmethod
+    def _add(sums, value):
+        sums[0] += 1
+        sums[1] += value
+        sums[2] += value * value
+
+    def add_test(self, runs, test_type):
+        """
+        Add the runs of every algorithm on one test. Each run is a dict with algorithm, goal_reached,
+        path_length, time, nodes and memory (None when the run timed out or failed).
+        """
+        if not runs:
+            return
+        reachable = any(run["goal_reached"] for run in runs)
+        solved = [run for run in runs if run["time"] is not None and run["goal_reached"] == reachable]
+
+        # Best value of each metric on this test, among the runs that solved it
+        best = {}
+        for metric in self.metrics:
+            values = [max(run[metric], self.floors[metric]) for run in solved]
+            best[metric] = min(values) if values else None
+
+        # Shortest path length, as found by BFS
+        optimal = None
+        if reachable:
+            for run in solved:
+                if run["algorithm"] == "BFS":
+                    optimal = run["path_length"]
+
+        log_ratios = {run["algorithm"]: {} for run in runs}
+        for metric in self.metrics:
+            worst = 0.0
+            for run in solved:
+                ratio = math.log(max(run[metric], self.floors[metric]) / best[metric])
+                log_ratios[run["algorithm"]][metric] = ratio
+                worst = max(worst, ratio)
+            penalty = worst + math.log(self.failure_penalty)
+            for algo, ratios in log_ratios.items():
+                ratios.setdefault(metric, penalty) # Unsolved runs
+
+        solved_algorithms = {run["algorithm"] for run in solved}
+        for run in runs:
+            algo = run["algorithm"]
+            ratios = log_ratios[algo]
+            for group in (test_type, "ALL"):
+                sums = self._sums(group, algo)
+                sums["tests"] += 1
+                if algo in solved_algorithms:
+                    sums["solved"] += 1
+                    if optimal:
+                        self._add(sums["gap"], run["path_length"] / optimal - 1)
+                for metric in self.metrics:
+                    self._add(sums[metric], ratios[metric])
+                self._add(sums["score"], sum(ratios.values()) / len(ratios))
+
+    def _t_value(self, n):
+        return self.t_values[n - 2] if n - 2 < len(self.t_values) else 1.96
+
+    def _mean_interval(self, sums):
+        """Mean and 95% t interval of running sums, or (None, None, None) without data"""
+        n, total, squares = sums
+        if n == 0:
+            return None, None, None
+        mean = total / n
+        if n == 1:
+            return mean, mean, mean
+        variance = max(0.0, (squares - total * total / n) / (n - 1))
+        half = self._t_value(n) * math.sqrt(variance / n)
+        return mean, mean - half, mean + half
+
+    def _wilson(self, successes, n, z=1.96):
+        """95% Wilson score interval of a success rate"""
+        if n == 0:
+            return None, None, None
+        rate = successes / n
+        centre = (rate + z * z / (2 * n)) / (1 + z * z / n)
+        half = z * math.sqrt(rate * (1 - rate) / n + z * z / (4 * n * n)) / (1 + z * z / n)
+        return rate, max(0.0, centre - half), min(1.0, centre + half)
+
+    def summary(self, group="ALL"):
+        """
+        Ranked rows for one group, best first. Ratios are geometric means (1.0 = best on
+        every test) with their 95% interval; the score is the geometric mean of the three ratios.
+        """
+        rows = []
+        for algo, sums in self.groups.get(group, {}).items():
+            row = {"algorithm": algo, "tests": sums["tests"], "solved": self._wilson(sums["solved"], sums["tests"])}
+            for metric in self.metrics + ("score",):
+                row[metric] = tuple(math.exp(value) if value is not None else None
+                                    for value in self._mean_interval(sums[metric]))
+            gap, low, high = self._mean_interval(sums["gap"])
+            row["gap"] = (gap, max(0.0, low), high) if gap is not None else (None, None, None) # Paths are never shorter than BFS's
+            rows.append(row)
+        rows.sort(key=lambda row: row["score"][0])
+        for rank, row in enumerate(rows, 1):
+            row["rank"] = rank
+        return rows
+
+    def best(self, group="ALL", metric="score"):
+        """Algorithm with the lowest geometric mean ratio for a metric, or None without data"""
+        rows = [row for row in self.summary(group) if row[metric][0] is not None]
+        if not rows:
+            return None
+        return min(rows, key=lambda row: row[metric][0])["algorithm"]
+
+    @staticmethod
+    def format_interval(values, digits=2, percent=False):
+        """Format (value, low, high) as "value [low, high]" """
+        value, low, high = values
+        if value is None:
+            return "N/A"
+        scale, suffix = (100, "%") if percent else (1, "")
+        return f"{value * scale:.{digits}f}{suffix} [{low * scale:.{digits}f}, {high * scale:.{digits}f}]"
+
+    def print_table(self, group="ALL"):
+        """Print the ranking of one group"""
+        print(f"\n--- Algorithm ranking ({group}): geometric mean ratio to the best run per test, 95% intervals ---")
+        print(f"{'Rank':<6}{'Algorithm':<12}{'Solved':>24}{'Time Ratio':>24}{'Nodes Ratio':>24}"
+              f"{'Memory Ratio':>24}{'Optimality Gap':>26}{'Score':>8}")
+        for row in self.summary(group):
+            print(f"{row['rank']:<6}{row['algorithm']:<12}{self.format_interval(row['solved'], 1, True):>24}"
+                  f"{self.format_interval(row['time']):>24}{self.format_interval(row['nodes']):>24}"
+                  f"{self.format_interval(row['memory']):>24}{self.format_interval(row['gap'], 1, True):>26}"
+                  f"{row['score'][0]:>8.2f}")
@@ -0,0 +1,176 @@
+import heapq
+import time
+from aStar import AStar
+
+class ARAStar(AStar):
+    def __init__(self, grid, start, goals, walls, terrain=None, weight=3.0, weight_step=0.5,
+                 time_limit=None, node_limit=None, movement=None):
+        """
+        Anytime Repairing A*: a weighted A* search (f = g + weight * h) that finds a path quickly,
+        then lowers the weight and repairs its search to improve the path until the weight
+        reaches 1 (an optimal path) or the budget runs out.
+        - weight: Starting heuristic weight, the first path costs at most weight times the optimum
+        - weight_step: Amount the weight drops after each improved path
+        - time_limit: Seconds the search may run (None for no limit)
+        - node_limit: Node expansions the search may make (None for no limit)
+        """
+        super().__init__(grid, start, goals, walls, terrain, movement=movement)
+        self.weight = max(1.0, weight)
+        self.weight_step = weight_step if weight_step > 0 else 0.5
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        self.bound = None # Proven suboptimality bound of the returned path (1.0 = optimal)
+        self.budget_exhausted = False # The search stopped on its time or node budget
+        self.trajectory = [] # One entry per path found: weight, cost, bound, nodes, time (ms)
+
+    def search(self):
+        self.nodes_visited = 0
+        self.bound = None
+        self.budget_exhausted = False
+        self.trajectory = []
+        if not self.reachable_goals: # Start and goals lie in different connected components
+            return None, self.nodes_visited, [], self.visited_result()
+
+        self._started = time.perf_counter()
+        self._deadline = self._started + self.time_limit if self.time_limit is not None else None
+        self._g_costs = {self.start: 0}
+        self._parents = {self.start: (None, None)} # Cell -> (previous cell, move onto this cell)
+        self._heuristics = {} # Heuristic values are reused across iterations
+        self._open = {} # Open cell -> current key, stale heap entries are skipped
+        self._closed = set()
+        self._inconsistent = set() # Cells improved after being expanded in this iteration
+        self._visited = set()
+        self._best = (self.start, 0) if self.start in self.goal_set else (None, float('inf'))
+
+        weight = self.weight
+        self._open_list = []
+        self._push(self.start, weight)
+        while True:
+            if self._improve_path(weight):
+                bound = self._completed_bound(weight)
+                self._record(weight, bound)
+                if self._best[0] is None or bound == 1.0:
+                    break # Optimal path found, or every reachable cell searched without a path
+            else:
+                # Interrupted: the last proven bound still holds, and tightens with any cheaper path found since
+                if not self.trajectory:
+                    self._record(weight, None) # Path from an unfinished iteration, no bound proven yet
+                elif self._best[0] is not None:
+                    last = self.trajectory[-1]
+                    cost = self.path_cost(self._path_to(self._best[0]))
+                    if cost < last["cost"]:
+                        self._record(weight, last["bound"] * cost / last["cost"])
+                break
+
+            # Lower the weight (at least to the proven bound) and start the next iteration
+            # from the open and inconsistent cells
+            weight = max(1.0, min(weight - self.weight_step, bound))
+            cells = set(self._open) | self._inconsistent
+            self._open, self._open_list = {}, []
+            self._inconsistent = set()
+            self._closed = set()
+            for cell in cells:
+                self._push(cell, weight)
+
+        goal, _ = self._best
+        if goal is None:
+            return None, self.nodes_visited, [], self.visited_result(self._visited)
+        self.bound = self.trajectory[-1]["bound"] if self.trajectory else None
+        return goal, self.nodes_visited, self._path_to(goal), self.visited_result(self._visited)
+
+    def _h(self, cell):
+        h = self._heuristics.get(cell)
+        if h is None:
+            h = self._heuristics[cell] = self.goal_distance(cell)
+        return h
+
+    def _push(self, cell, weight):
+        h = self._h(cell)
+        key = self._g_costs[cell] + weight * h
+        self._open[cell] = key
+        heapq.heappush(self._open_list, (key, h, cell)) # Ties go to the cell nearer a goal
+
+    def _out_of_budget(self):
+        if self.node_limit is not None and self.nodes_visited >= self.node_limit:
+            return True
+        return self._deadline is not None and time.perf_counter() >= self._deadline
+
+    def _improve_path(self, weight):
+        """
+        Expand cells while one of them could still lead to a path cheaper than the best found
+        (by more than the weight). Returns False if the budget ran out first.
+        """
+        open_list = self._open_list
+        g_costs = self._g_costs
+        while open_list:
+            key, _, current = open_list[0]
+            if self._open.get(current) != key:
+                heapq.heappop(open_list) # Stale entry
+                continue
+            if key >= self._best[1]:
+                return True
+            if self._out_of_budget():
+                self.budget_exhausted = True
+                return False
+
+            heapq.heappop(open_list)
+            del self._open[current]
+            self._closed.add(current)
+            self._visited.add(current)
+            self.nodes_visited += 1
+            self._track(open_list, self._visited, paths=(self._parents,))
+
+            for dx, dy, move in self.directions:
+                neighbor = (current[0] + dx, current[1] + dy)
+                if not self.can_move(current, neighbor):
+                    continue
+                tentative_g = g_costs[current] + self.move_cost(current, neighbor)
+                if neighbor in g_costs and tentative_g >= g_costs[neighbor]:
+                    continue
+                g_costs[neighbor] = tentative_g
+                self._parents[neighbor] = (current, move)
+                if neighbor in self.goal_set and tentative_g < self._best[1]:
+                    self._best = (neighbor, tentative_g)
+                if neighbor in self._closed:
+                    self._inconsistent.add(neighbor) # Repaired in the next iteration
+                else:
+                    self._push(neighbor, weight)
+        return True
+
+    def _completed_bound(self, weight):
+        """
+        Suboptimality bound after a finished iteration: the weight, or better when the cheapest
+        unweighted f among the open and inconsistent cells is close to the path cost.
+        """
+        cost = self._best[1]
+        if self._best[0] is None or cost == 0:
+            return 1.0
+        lowest = min((self._g_costs[cell] + self._h(cell) for cell in (*self._open, *self._inconsistent)), default=None)
+        if lowest is None or lowest >= cost:
+            return 1.0 # Nothing left that could lead to a cheaper path
+        return max(1.0, min(weight, cost / lowest))
+
+    def _record(self, weight, bound):
+        goal = self._best[0]
+        if goal is None:
+            return
+        # Parent links may have been improved since the goal was reached, so the path can be cheaper than its g
+        path = self._path_to(goal)
+        self.trajectory.append({
+            "weight": weight,
+            "cost": self.path_cost(path),
+            "bound": bound,
+            "path_length": len(path),
+            "nodes": self.nodes_visited,
+            "time": (time.perf_counter() - self._started) * 1000
+        })
+
+    def _path_to(self, cell):
+        """Moves from the start to a cell, following the parent links"""
+        path = []
+        parent, move = self._parents[cell]
+        while parent is not None:
+            path.append(move)
+            parent, move = self._parents[parent]
+        path.reverse()
+        return path
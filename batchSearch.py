@@ -0,0 +1,125 @@
+import heapq
+from collections import deque
+from searchAlgorithm import SearchAlgorithm
+
+class BatchSearch(SearchAlgorithm):
+    def __init__(self, grid, starts, goals, walls, terrain=None, movement=None):
+        """
+        Route many agents to one goal set with a single search. The search runs backwards
+        from every goal at once and records, for each cell it settles, the move towards its
+        cheapest goal, so each agent's path is read off without searching again.
+        Agents starting on a wall or outside the grid get no path.
+        """
+        self.starts = list(starts)
+        super().__init__(grid, self.starts[0] if self.starts else None, goals, walls, terrain, movement)
+        self.next_move = {} # Settled cell -> (next cell towards the goal, move)
+        self.costs = {} # Settled cell -> cost of its cheapest goal
+        self.settled_at = {} # Start -> number of cells settled when it was reached
+
+    def search(self):
+        """Result of the first agent, in the usual (goal, nodes_visited, path, visited) format"""
+        return self.search_all()[0]
+
+    def search_all(self):
+        """
+        Run the shared search and return one (goal, nodes_visited, path, visited) tuple per start.
+        nodes_visited is the number of cells settled by the time that start was reached, and
+        every agent shares the same visited cells.
+        """
+        self.nodes_visited = 0
+        self.next_move, self.costs, self.settled_at = {}, {}, {}
+        if not self.starts:
+            return []
+
+        # Plain cells with straight moves cost 1 each, so a FIFO queue settles cells in cost order
+        if self.index.max_cost == 1 and not self.diagonal:
+            self._search_unit_cost()
+        else:
+            self._search_weighted()
+
+        visited = self.visited_result(self.costs)
+        return [self._agent_result(start, visited) for start in self.starts]
+
+    def _sources(self):
+        """Goals that can be stood on, without duplicates"""
+        sources = []
+        for goal in self.goals:
+            if self.is_valid(goal) and goal not in self.next_move:
+                self.next_move[goal] = (None, None)
+                sources.append(goal)
+        return sources
+
+    def _search_unit_cost(self):
+        """Multi-source BFS from the goals, stopping once every start is settled"""
+        waiting = {start for start in self.starts if self.is_valid(start)}
+        queue = deque()
+        for goal in self._sources():
+            self.costs[goal] = 0
+            queue.append(goal)
+
+        while queue and waiting:
+            current = queue.popleft()
+            self.nodes_visited += 1
+            if current in waiting:
+                waiting.discard(current)
+                self.settled_at[current] = self.nodes_visited
+            self._track(queue, self.costs)
+
+            cost = self.costs[current] + 1
+            for dx, dy, move in self.directions:
+                # The agent would step from the neighbour onto current with this move
+                neighbor = (current[0] - dx, current[1] - dy)
+                if neighbor not in self.costs and self.can_move(current, neighbor):
+                    self.costs[neighbor] = cost
+                    self.next_move[neighbor] = (current, move)
+                    queue.append(neighbor)
+
+    def _search_weighted(self):
+        """Multi-source Dijkstra from the goals over terrain costs and diagonal moves"""
+        waiting = {start for start in self.starts if self.is_valid(start)}
+        g_costs = {}
+        open_list = []
+        for goal in self._sources():
+            g_costs[goal] = 0
+            open_list.append((0, goal))
+        heapq.heapify(open_list)
+
+        while open_list and waiting:
+            cost, current = heapq.heappop(open_list)
+            if current in self.costs:
+                continue
+            self.costs[current] = cost
+            self.nodes_visited += 1
+            if current in waiting:
+                waiting.discard(current)
+                self.settled_at[current] = self.nodes_visited
+            self._track(open_list, self.costs)
+
+            for dx, dy, move in self.directions:
+                neighbor = (current[0] - dx, current[1] - dy)
+                # Moves are reversible, so the move into current is allowed whenever its reverse is
+                if neighbor in self.costs or not self.can_move(current, neighbor):
+                    continue
+                tentative_g = cost + self.move_cost(neighbor, current)
+                if neighbor not in g_costs or tentative_g < g_costs[neighbor]:
+                    g_costs[neighbor] = tentative_g
+                    self.next_move[neighbor] = (current, move)
+                    heapq.heappush(open_list, (tentative_g, neighbor))
+
+    def _agent_result(self, start, visited):
+        """Follow the recorded moves from one start down to its goal"""
+        if start not in self.settled_at:
+            return None, self.nodes_visited, [], visited
+
+        path = []
+        current = start
+        next_cell, move = self.next_move[current]
+        while next_cell is not None:
+            path.append(move)
+            current = next_cell
+            next_cell, move = self.next_move[current]
+        return current, self.settled_at[start], path, visited
+
+    def agent_path_cost(self, start):
+        """Cost of the path found for one start (None if it cannot reach a goal)"""
+        return self.costs.get(start) if start in self.settled_at else None
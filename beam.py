@@ -1,32 +1,40 @@
 from searchAlgorithm import SearchAlgorithm
 import heapq
+import time
 
 class Beam(SearchAlgorithm):
-    def __init__(self, grid, start, goals, walls, beam_width = 3):
-        super().__init__(grid, start, goals, walls)
+    def __init__(self, grid, start, goals, walls, beam_width = 3, terrain = None, movement = None):
+        super().__init__(grid, start, goals, walls, terrain, movement)
         self.beam_width = max(1, beam_width)  # Ensure beam width is at least 1
 
     def search(self):
-        closest_goal = self.get_closest_goal(self.start)
-        current_level = [(self.heuristic(self.start, closest_goal), self.start, [], None)]
         self.nodes_visited = 0
+        if not self.reachable_goals: # Start and goals lie in different connected components
+            return None, self.nodes_visited, [], self.visited_result()
+
+        closest_goal = self.get_closest_goal(self.start)
+        current_level = [(self.heuristic(self.start, closest_goal), self.start, None, None)]
         visited_nodes = set()
+        parents = {} # Position -> (parent position, move), recorded when a node is visited
 
         while current_level:
-            # Select top-k nodes for this level
-            current_level = heapq.nsmallest(self.beam_width, current_level)
+            # Bounded max-heap holding only the best beam_width candidates for the next level.
+            # Entries are (-h, -x, -y, move, parent) so the worst candidate sits at the top.
             next_level = []
+            positions_seen = set() # Only the first candidate for each position is kept
             
             # Process the current beam
-            for _, current, path, parent in current_level:
+            for _, current, move, parent in current_level:
                 if current in visited_nodes:
                     continue
                 self.nodes_visited += 1
                 visited_nodes.add(current)
+                parents[current] = (parent, move)
+                self._track(current_level, visited_nodes, paths=(parents,))
                 
                 # Check if we reached a goal
-                if current in self.goals:
-                    return current, self.nodes_visited, path, list(visited_nodes)
+                if current in self.goal_set:
+                    return current, self.nodes_visited, self._build_path(parents, current), self.visited_result(visited_nodes)
                 
                 # Generate all neighbors
                 for dx, dy, move in self.directions:
@@ -38,21 +46,67 @@ class Beam(SearchAlgorithm):
                         continue
                         
                     # Check if the move is valid
-                    if self.is_valid(neighbor) and neighbor not in visited_nodes:
+                    if self.can_move(current, neighbor) and neighbor not in visited_nodes and neighbor not in positions_seen:
+                        positions_seen.add(neighbor)
                         h = self.heuristic(neighbor, closest_goal)
-                        next_level.append((h, neighbor, path + [move], current))
+                        entry = (-h, -nx, -ny, move, current)
+                        if len(next_level) < self.beam_width:
+                            heapq.heappush(next_level, entry)
+                        elif entry > next_level[0]: # Better than the worst kept candidate
+                            heapq.heapreplace(next_level, entry)
             
-            # Select unique positions for the next beam
-            positions_seen = set()
-            filtered_next_level = []
-            
-            for entry in next_level:
-                position = entry[1]  # The position is the 2nd element
-                if position not in positions_seen: # Only add unique positions
-                    filtered_next_level.append(entry)
-                    positions_seen.add(position)
-            
-            current_level = filtered_next_level
+            # Order the selected candidates best first, as (h, position, move, parent)
+            current_level = sorted((-h, (-nx, -ny), move, parent) for h, nx, ny, move, parent in next_level)
 
         # No path found
-        return None, self.nodes_visited, [], list(visited_nodes)
\ No newline at end of file
+        return None, self.nodes_visited, [], self.visited_result(visited_nodes)
+
+    def sweep(self, beam_widths, tracker=None):
+        """
+        Run the search once per beam width on the same map, sharing the parsed grid and its index.
+        Returns one result per width with the path quality relative to the shortest path found by any width.
+        If a MemoryTracker is given, the memory of each run is measured as well.
+        """
+        results = []
+        for beam_width in beam_widths:
+            self.beam_width = max(1, beam_width)
+            if tracker is not None:
+                tracker.start()
+            start_time = time.perf_counter()
+
+            goal, nodes_visited, path, visited = self.search()
+
+            execution_time = (time.perf_counter() - start_time) * 1000
+            result = {
+                "beam_width": self.beam_width,
+                "goal": goal,
+                "nodes_visited": nodes_visited,
+                "path": path,
+                "visited": visited,
+                "execution_time": execution_time
+            }
+            if tracker is not None:
+                tracker.stop()
+                result.update(tracker.report())
+            results.append(result)
+
+        # Path length ratio against the best width (1.0 = shortest path found in the sweep)
+        found = [len(result["path"]) for result in results if result["goal"]]
+        shortest = min(found) if found else 0
+        for result in results:
+            if not result["goal"]:
+                result["path_ratio"] = None
+            else:
+                result["path_ratio"] = len(result["path"]) / shortest if shortest else 1.0
+
+        return results
+
+    def _build_path(self, parents, position):
+        """Follow parent links back to the start to recover the moves"""
+        path = []
+        parent, move = parents[position]
+        while parent is not None:
+            path.append(move)
+            parent, move = parents[parent]
+        path.reverse()
+        return path
\ No newline at end of file
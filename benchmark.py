@@ -0,0 +1,619 @@
+import math
+import multiprocessing
+import random
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from testCase import TestCase
+from gridIndex import GridIndex
+from sharedGridIndex import SharedGridIndex
+from memoryTracker import MemoryTracker
+from resultFile import ResultFile
+from bfs import BFS
+from iddfs import IDDFS
+from aStar import AStar
+from gbfs import GBFS
+from hpaStar import HPAStar
+from clusterGraph import ClusterGraph
+from dStarLite import DStarLite
+from batchSearch import BatchSearch
+from tourPlanner import TourPlanner
+from grid import Grid
+from movement import Movement
+from search import search_algorithms, load_algorithm
+
+class SearchDeadline:
+    def __init__(self, seconds, tracker=None, check_every=256):
+        """
+        Attached to a search as its memory tracker: passes samples on to an optional real
+        tracker and raises TimeoutError once the search runs past its time budget.
+        """
+        self.deadline = time.perf_counter() + seconds
+        self.tracker = tracker
+        self.check_every = check_every
+        self.calls = 0
+
+    def sample(self, frontier=(), visited=(), path_index=-1, paths=None):
+        if self.tracker is not None:
+            self.tracker.sample(frontier, visited, path_index, paths)
+        self.calls += 1
+        if self.calls % self.check_every == 0 and time.perf_counter() > self.deadline:
+            raise TimeoutError()
+
+def private_memory():
+    """Memory used by this process only (not shared with another process) in KB, Linux only"""
+    try:
+        with open("/proc/self/smaps_rollup") as file:
+            fields = dict(line.split(":", 1) for line in file if line.startswith("Private_"))
+    except OSError:
+        return None
+    return sum(int(value.split()[0]) for value in fields.values())
+
+_index_barrier = None
+
+def _init_index_worker(barrier):
+    global _index_barrier
+    _index_barrier = barrier
+
+def _index_worker_memory(handle, copy):
+    """
+    Attach to a shared GridIndex, or copy its arrays into this process like a worker that
+    builds its own index, then read every cell and return the private memory added in KB.
+    Waits for the other workers so each task runs in its own process.
+    """
+    before = private_memory()
+    index, memory = SharedGridIndex.attach(handle)
+    if copy:
+        index.blocked = bytearray(index.blocked)
+        for name in ("_components", "_diagonal_components"):
+            copied = array('i')
+            copied.frombytes(getattr(index, name).cast('B'))
+            setattr(index, name, copied)
+    # Read the whole index, so every page is mapped into this process
+    max(index.blocked), max(index.components), max(index.diagonal_components)
+    used = private_memory() - before if before is not None else None
+    _index_barrier.wait(60)
+    return used
+
+class Benchmark:
+    def __init__(self, seed=0, cases_per_size=3):
+        """
+        Initialize an in-process benchmark with:
+        - seed: Random seed so every algorithm sees the same generated grids
+        - cases_per_size: Number of grids generated for each grid size
+        """
+        self.seed = seed
+        self.cases_per_size = cases_per_size
+
+    def generate_cases(self, test_type, size, wall_ratio=0.2, terrain_regions=0, count=None):
+        """
+        Generate square test cases of the given type and size without writing them to disk.
+        - wall_ratio: Number of walls placed relative to the number of cells
+        - terrain_regions: Number of random terrain regions (step cost 2-9) added to each case
+        - count: Number of cases (default: cases_per_size)
+        The "perfect_maze" type carves a maze with one route between any two cells, which stays
+        solvable at sizes where the "maze" test type walls off its goals. The "scatter" type
+        places single-cell walls at random and stays fast to generate on very large grids.
+        """
+        random.seed(f"{self.seed}-{test_type}-{size}-{wall_ratio}-{terrain_regions}")
+        cases = []
+        for _ in range(count or self.cases_per_size):
+            if test_type == "perfect_maze":
+                case = self.generate_perfect_maze(size)
+            elif test_type == "scatter":
+                case = self.generate_scatter(size, wall_ratio)
+            else:
+                num_walls = max(3, int(size * size * wall_ratio))
+                case = TestCase(size, size, random.randint(1, 3), num_walls, test_type)
+
+            case.terrain = []
+            for _ in range(terrain_regions):
+                w, h = random.randint(1, size // 4 + 1), random.randint(1, size // 4 + 1)
+                case.terrain.append((random.randint(0, size - w), random.randint(0, size - h), w, h, random.randint(2, 9)))
+            cases.append(case)
+        return cases
+
+    def generate_perfect_maze(self, size):
+        """
+        Carve a maze with a randomised depth-first walk. Maze cells sit on even coordinates and
+        the cells between them are walls unless the walk passes through.
+        """
+        case = TestCase(size, size, random.randint(1, 3), 0, "random")
+        case.test_type = "perfect_maze"
+
+        # Move the start and goals onto maze cells
+        case.start = (case.start[0] - case.start[0] % 2, case.start[1] - case.start[1] % 2)
+        case.goals = [(gx - gx % 2, gy - gy % 2) for gx, gy in case.goals]
+
+        open_cells = {case.start}
+        stack = [case.start]
+        while stack:
+            x, y = stack[-1]
+            unvisited = [(x + dx, y + dy) for dx, dy in ((0, -2), (-2, 0), (0, 2), (2, 0))
+                         if 0 <= x + dx < size and 0 <= y + dy < size and (x + dx, y + dy) not in open_cells]
+            if not unvisited:
+                stack.pop()
+                continue
+            nx, ny = random.choice(unvisited)
+            open_cells.add(((x + nx) // 2, (y + ny) // 2)) # Knock down the wall in between
+            open_cells.add((nx, ny))
+            stack.append((nx, ny))
+
+        case.walls = [(x, y, 1, 1) for y in range(size) for x in range(size) if (x, y) not in open_cells]
+        return case
+
+    def generate_scatter(self, size, wall_ratio=0.2):
+        """
+        Scatter single-cell walls over wall_ratio of the cells, then place the start and goals
+        on open cells of one connected region so the goals are reachable.
+        """
+        case = TestCase(size, size, random.randint(1, 3), 0, "random")
+        case.test_type = "scatter"
+        cells = size * size
+        case.walls = [(cell % size, cell // size, 1, 1) for cell in sorted(random.sample(range(cells), int(cells * wall_ratio)))]
+
+        index = GridIndex.get((size, size), case.walls)
+        while True:
+            start = (random.randrange(size), random.randrange(size))
+            component = index.component(start)
+            if component == -1:
+                continue
+            goals = []
+            for _ in range(50 * case.num_goals):
+                goal = (random.randrange(size), random.randrange(size))
+                if goal != start and index.component(goal) == component and goal not in goals:
+                    goals.append(goal)
+                    if len(goals) == case.num_goals:
+                        break
+            if len(goals) == case.num_goals:
+                case.start, case.goals = start, goals
+                return case
+
+    def run_algorithm(self, algo_class, case, tracker=None, **options):
+        """
+        Run one algorithm on one test case and return its metrics.
+        - tracker: Optional memory tracker (or SearchDeadline) attached to the search
+        """
+        algo = algo_class(
+            grid = (case.rows, case.cols),
+            start = case.start,
+            goals = case.goals,
+            walls = case.walls,
+            terrain = case.terrain,
+            **options
+        )
+        algo.memory_tracker = tracker
+        start_time = time.perf_counter()
+        goal, nodes_visited, path, _ = algo.search()
+        execution_time = (time.perf_counter() - start_time) * 1000
+
+        return {
+            "goal_reached": goal is not None,
+            "nodes_visited": nodes_visited,
+            "path_length": len(path),
+            "path_cost": algo.path_cost(path),
+            "execution_time": execution_time,
+            "duplicate_pops": getattr(algo, "duplicate_pops", 0),
+            "peak_frontier": getattr(algo, "peak_frontier", 0)
+        }
+
+    def compare(self, algorithms, test_type, sizes, wall_ratio=0.2, terrain_regions=0):
+        """
+        Run every algorithm on the same grids for each size.
+        - algorithms: Mapping of name -> (algorithm class, constructor options)
+        Returns a list of rows with the averaged metrics per algorithm and size.
+        """
+        rows = []
+        for size in sizes:
+            cases = self.generate_cases(test_type, size, wall_ratio, terrain_regions)
+            for name, (algo_class, options) in algorithms.items():
+                results = [self.run_algorithm(algo_class, case, **options) for case in cases]
+                rows.append({
+                    "algorithm": name,
+                    "test_type": test_type,
+                    "size": size,
+                    "success_rate": sum(r["goal_reached"] for r in results) / len(results) * 100,
+                    "avg_nodes": sum(r["nodes_visited"] for r in results) / len(results),
+                    "avg_path": sum(r["path_length"] for r in results) / len(results),
+                    "avg_cost": sum(r["path_cost"] for r in results) / len(results),
+                    "avg_time": sum(r["execution_time"] for r in results) / len(results),
+                    "avg_duplicates": sum(r["duplicate_pops"] for r in results) / len(results),
+                    "avg_peak_frontier": sum(r["peak_frontier"] for r in results) / len(results)
+                })
+        return rows
+
+    def print_table(self, title, rows, columns=()):
+        """
+        Print benchmark rows as an aligned text table.
+        - columns: Extra (header, row key) pairs shown after the standard metrics
+        """
+        print(f"\n--- {title} ---")
+        header = f"{'Algorithm':<14}{'Type':<14}{'Size':>6}{'Success':>10}{'Avg Nodes':>12}{'Avg Path':>10}{'Avg Time (ms)':>16}"
+        print(header + "".join(f"{name:>16}" for name, _ in columns))
+        for row in rows:
+            line = (f"{row['algorithm']:<14}{row['test_type']:<14}{row['size']:>6}"
+                    f"{row['success_rate']:>9.0f}%{row['avg_nodes']:>12.1f}{row['avg_path']:>10.1f}{row['avg_time']:>16.3f}")
+            print(line + "".join(f"{row[key]:>16.1f}" for _, key in columns))
+
+    def iddfs_unreachable(self, sizes=(10, 20, 30, 40)):
+        """IDDFS on unreachable grids, where it must prove no goal can be reached, against BFS"""
+        rows = self.compare({
+            "BFS": (BFS, {}),
+            "IDDFS": (IDDFS, {})
+        }, "unreachable", sizes)
+        self.print_table("IDDFS on unreachable grids", rows)
+        return rows
+
+    def bucket_queue(self, sizes=(50, 100, 200)):
+        """A* and GBFS with a binary heap frontier against a bucket queue on large open grids and mazes"""
+        algorithms = {}
+        for name, algo_class in (("astar", AStar), ("gbfs", GBFS)):
+            for queue in ("heap", "bucket"):
+                algorithms[f"{name}-{queue}"] = (algo_class, {"queue": queue})
+
+        rows = self.compare(algorithms, "random", sizes, wall_ratio=0.05)
+        self.print_table("Heap against bucket queue on open grids", rows)
+        maze_rows = self.compare(algorithms, "perfect_maze", sizes)
+        self.print_table("Heap against bucket queue on mazes", maze_rows)
+        return rows + maze_rows
+
+    def decrease_key(self, sizes=(50, 100, 200)):
+        """A* with lazy deletion (stale heap entries skipped on pop) against an indexed heap with decrease-key"""
+        algorithms = {
+            "astar-heap": (AStar, {"queue": "heap"}),
+            "astar-indexed": (AStar, {"queue": "indexed"})
+        }
+        columns = (("Duplicate Pops", "avg_duplicates"), ("Peak Open List", "avg_peak_frontier"))
+
+        # Duplicates come from cells reached again at a lower cost, which needs uneven step costs
+        rows = self.compare(algorithms, "random", sizes, wall_ratio=0.05)
+        self.print_table("Lazy deletion against decrease-key on open grids", rows, columns)
+        weighted_rows = self.compare(algorithms, "random", sizes, wall_ratio=0.05, terrain_regions=20)
+        self.print_table("Lazy deletion against decrease-key on weighted grids", weighted_rows, columns)
+        return rows + weighted_rows
+
+    def tie_breaking(self, sizes=(50, 100, 200), weights=(1, 1.5, 2)):
+        """
+        A* nodes expanded by tie-break policy and heuristic weight on open grids (no walls),
+        where many nodes share the same f, and on random grids with 20% walls
+        """
+        algorithms = {}
+        for weight in weights:
+            for tie_break in AStar.tie_breaks:
+                algorithms[f"w{weight}-{tie_break}"] = (AStar, {"weight": weight, "tie_break": tie_break})
+        columns = (("Avg Cost", "avg_cost"),)
+
+        rows = self.compare(algorithms, "scatter", sizes, wall_ratio=0.0)
+        for row in rows:
+            row["test_type"] = "open"
+        self.print_table("A* tie-breaking and weights on open grids", rows, columns)
+        random_rows = self.compare(algorithms, "random", sizes)
+        self.print_table("A* tie-breaking and weights on random grids", random_rows, columns)
+        return rows + random_rows
+
+    def shared_memory(self, sizes=(1024,), worker_counts=(1, 2, 4, 8)):
+        """
+        Private memory of worker processes that each hold their own copy of a GridIndex against
+        workers attached to one SharedGridIndex. Copies grow with the number of workers, shared
+        indexes should stay flat. Private memory is read from /proc, so this needs Linux.
+        """
+        print("\n--- GridIndex copied into every worker against one shared index (private memory in KB) ---")
+        print(f"{'Size':>6}{'Workers':>9}{'Index (KB)':>12}{'Copy/Worker':>13}{'Copy Total':>12}{'Shared/Worker':>15}{'Shared Total':>14}")
+        rows = []
+        for size in sizes:
+            case = self.generate_cases("scatter", size, count=1)[0]
+            shared = SharedGridIndex(GridIndex((case.rows, case.cols), case.walls))
+            try:
+                for workers in worker_counts:
+                    row = {"size": size, "workers": workers, "index_size": shared.memory.size / 1024}
+                    for mode in ("copy", "shared"):
+                        barrier = multiprocessing.Barrier(workers)
+                        with ProcessPoolExecutor(workers, initializer=_init_index_worker, initargs=(barrier,)) as pool:
+                            used = list(pool.map(_index_worker_memory, [shared.handle] * workers, [mode == "copy"] * workers))
+                        if None in used:
+                            print("Private memory is only measured on Linux")
+                            return rows
+                        row[f"{mode}_per_worker"] = sum(used) / workers
+                        row[f"{mode}_total"] = sum(used)
+                    rows.append(row)
+                    print(f"{size:>6}{workers:>9}{row['index_size']:>12.0f}{row['copy_per_worker']:>13.0f}{row['copy_total']:>12.0f}"
+                          f"{row['shared_per_worker']:>15.0f}{row['shared_total']:>14.0f}")
+            finally:
+                shared.close()
+        return rows
+
+    def hpa(self, sizes=(100, 200, 400), cluster_size=10):
+        """
+        HPA* against flat A* on large open grids. The abstract graph is built once per map
+        (timed separately) and every HPA* query after that only searches the abstraction.
+        """
+        print(f"\n--- HPA* (cluster size {cluster_size}) against A* on open grids ---")
+        print(f"{'Size':>6}{'Build (ms)':>12}{'Abstract Nodes':>16}{'A* Nodes':>10}{'HPA* Nodes':>12}"
+              f"{'A* (ms)':>10}{'HPA* (ms)':>11}{'Path Ratio':>12}")
+        rows = []
+        for size in sizes:
+            results = []
+            for case in self.generate_cases("random", size, wall_ratio=0.05):
+                start_time = time.perf_counter()
+                graph = ClusterGraph.get((case.rows, case.cols), case.walls, case.terrain, cluster_size)
+                build_time = (time.perf_counter() - start_time) * 1000
+
+                flat = self.run_algorithm(AStar, case)
+                hierarchical = self.run_algorithm(HPAStar, case, cluster_size=cluster_size)
+                results.append((build_time, len(graph.edges), flat, hierarchical))
+
+            count = len(results)
+            row = {
+                "size": size,
+                "build_time": sum(r[0] for r in results) / count,
+                "abstract_nodes": sum(r[1] for r in results) / count,
+                "astar_nodes": sum(r[2]["nodes_visited"] for r in results) / count,
+                "hpa_nodes": sum(r[3]["nodes_visited"] for r in results) / count,
+                "astar_time": sum(r[2]["execution_time"] for r in results) / count,
+                "hpa_time": sum(r[3]["execution_time"] for r in results) / count,
+                "path_ratio": sum(r[3]["path_length"] / max(1, r[2]["path_length"]) for r in results) / count
+            }
+            rows.append(row)
+            print(f"{size:>6}{row['build_time']:>12.1f}{row['abstract_nodes']:>16.0f}{row['astar_nodes']:>10.0f}{row['hpa_nodes']:>12.0f}"
+                  f"{row['astar_time']:>10.2f}{row['hpa_time']:>11.2f}{row['path_ratio']:>12.3f}")
+        return rows
+
+    def movement(self, sizes=(50, 100, 200)):
+        """A*, GBFS and BFS with 4-connected against 8-connected movement (no corner cutting) on open grids"""
+        algorithms = {}
+        for name, algo_class in (("astar", AStar), ("gbfs", GBFS), ("bfs", BFS)):
+            for connectivity in (4, 8):
+                algorithms[f"{name}-{connectivity}"] = (algo_class, {"movement": Movement(connectivity)})
+
+        rows = self.compare(algorithms, "random", sizes, wall_ratio=0.05)
+        self.print_table("4-connected against 8-connected movement on open grids", rows, (("Avg Cost", "avg_cost"),))
+        return rows
+
+    def replan(self, sizes=(50, 100, 200), events=20):
+        """
+        D* Lite repairing its plan after each wall change against A* planning from scratch
+        on the new walls (search time only, the map index rebuild is not counted). Every event
+        adds a small wall or removes one added earlier.
+        """
+        print(f"\n--- D* Lite repair against A* replanning ({events} wall changes per grid) ---")
+        print(f"{'Size':>6}{'Initial (ms)':>14}{'Repair (ms)':>13}{'Repair Nodes':>14}{'Replan (ms)':>13}{'Replan Nodes':>14}")
+        rows = []
+        for size in sizes:
+            initial, repair, repair_nodes, replan, replan_nodes = [], [], [], [], []
+            for case in self.generate_cases("random", size, wall_ratio=0.05):
+                grid = Grid({
+                    "grid_size": (case.rows, case.cols),
+                    "initial_position": case.start,
+                    "goal_states": case.goals,
+                    "walls": case.walls,
+                    "terrain": case.terrain
+                })
+                incremental = DStarLite((case.rows, case.cols), case.start, case.goals, case.walls, case.terrain)
+                start_time = time.perf_counter()
+                incremental.search()
+                initial.append((time.perf_counter() - start_time) * 1000)
+
+                added = []
+                for _ in range(events):
+                    if added and random.random() < 0.3:
+                        change = ([], [added.pop(random.randrange(len(added)))])
+                    else:
+                        x, y = random.randrange(case.cols), random.randrange(case.rows)
+                        if (x, y) == case.start or (x, y) in case.goals:
+                            continue
+                        wall = (x, y, 1, random.randint(1, 3))
+                        added.append(wall)
+                        change = ([wall], [])
+                    blocked, opened = grid.apply_wall_diff(*change)
+
+                    start_time = time.perf_counter()
+                    _, nodes_visited, _, _ = incremental.update_walls(blocked, opened)
+                    repair.append((time.perf_counter() - start_time) * 1000)
+                    repair_nodes.append(nodes_visited)
+
+                    case.walls = grid.data["walls"]
+                    result = self.run_algorithm(AStar, case)
+                    replan.append(result["execution_time"])
+                    replan_nodes.append(result["nodes_visited"])
+
+            row = {
+                "size": size,
+                "initial_time": sum(initial) / len(initial),
+                "repair_time": sum(repair) / len(repair),
+                "repair_nodes": sum(repair_nodes) / len(repair_nodes),
+                "replan_time": sum(replan) / len(replan),
+                "replan_nodes": sum(replan_nodes) / len(replan_nodes)
+            }
+            rows.append(row)
+            print(f"{size:>6}{row['initial_time']:>14.2f}{row['repair_time']:>13.2f}{row['repair_nodes']:>14.1f}"
+                  f"{row['replan_time']:>13.2f}{row['replan_nodes']:>14.1f}")
+        return rows
+
+    def batch(self, sizes=(50, 100, 200), agents=50):
+        """
+        One reverse search from the goals answering every agent against a separate BFS and
+        A* search per agent, on open grids. Paths are checked to be as short as BFS's.
+        """
+        print(f"\n--- Batch search against per-agent searches ({agents} agents per grid) ---")
+        print(f"{'Size':>6}{'Batch (ms)':>12}{'BFS (ms)':>10}{'A* (ms)':>10}{'Batch Nodes':>13}{'A* Nodes':>10}"
+              f"{'Batch Agents/s':>16}{'A* Agents/s':>13}{'Same Length':>13}")
+        rows = []
+        for size in sizes:
+            batch_time, bfs_time, astar_time, batch_nodes, astar_nodes, same_length = 0, 0, 0, 0, 0, 0
+            cases = self.generate_cases("random", size, wall_ratio=0.05)
+            for case in cases:
+                grid, walls = (case.rows, case.cols), case.walls
+                blocked = set()
+                for x, y, w, h in walls:
+                    blocked.update((wx, wy) for wx in range(x, x + w) for wy in range(y, y + h))
+                starts = []
+                while len(starts) < agents:
+                    start = (random.randrange(case.cols), random.randrange(case.rows))
+                    if start not in blocked:
+                        starts.append(start)
+
+                start_time = time.perf_counter()
+                algo = BatchSearch(grid, starts, case.goals, walls, case.terrain)
+                results = algo.search_all()
+                batch_time += (time.perf_counter() - start_time) * 1000
+                batch_nodes += algo.nodes_visited
+
+                for start, (_, _, path, _) in zip(starts, results):
+                    case.start = start
+                    result = self.run_algorithm(BFS, case)
+                    bfs_time += result["execution_time"]
+                    same_length += len(path) == result["path_length"]
+                    result = self.run_algorithm(AStar, case)
+                    astar_time += result["execution_time"]
+                    astar_nodes += result["nodes_visited"]
+
+            count = len(cases)
+            row = {
+                "size": size,
+                "batch_time": batch_time / count,
+                "bfs_time": bfs_time / count,
+                "astar_time": astar_time / count,
+                "batch_nodes": batch_nodes / count,
+                "astar_nodes": astar_nodes / count,
+                "batch_throughput": agents * count / (batch_time / 1000),
+                "astar_throughput": agents * count / (astar_time / 1000),
+                "same_length": same_length / (agents * count) * 100
+            }
+            rows.append(row)
+            print(f"{size:>6}{row['batch_time']:>12.2f}{row['bfs_time']:>10.2f}{row['astar_time']:>10.2f}"
+                  f"{row['batch_nodes']:>13.0f}{row['astar_nodes']:>10.0f}{row['batch_throughput']:>16.0f}"
+                  f"{row['astar_throughput']:>13.0f}{row['same_length']:>12.0f}%")
+        return rows
+
+    def tour(self, sizes=(50, 100, 200), goal_counts=(8, 50, 200)):
+        """
+        Tour planning time on random grids for growing numbers of goals, split into the
+        distance searches, ordering the goals and searching the legs. The tour cost is compared
+        with the nearest neighbour order before 2-opt, and with NN + 2-opt when the order was exact.
+        """
+        print("\n--- Tour planning through every goal on random grids ---")
+        print(f"{'Size':>6}{'Goals':>7}{'Order':>8}{'Distances (ms)':>16}{'Ordering (ms)':>15}{'Legs (ms)':>11}"
+              f"{'Total (ms)':>12}{'Nodes':>10}{'Tour Cost':>11}{'NN Cost':>10}{'2-opt Cost':>12}")
+        rows = []
+        for size in sizes:
+            case = self.generate_cases("random", size, count=1)[0]
+            index = GridIndex((case.rows, case.cols), case.walls)
+            component = index.component(case.start)
+            cells = [(x, y) for y in range(case.rows) for x in range(case.cols) if index.component((x, y)) == component]
+            for goal_count in goal_counts:
+                goals = random.sample(cells, min(goal_count, len(cells)))
+                algo = TourPlanner((case.rows, case.cols), case.start, goals, case.walls, case.terrain)
+                algo.return_visited = False
+                start_time = time.perf_counter()
+                algo.search()
+                total_time = (time.perf_counter() - start_time) * 1000
+
+                distances = algo.distances
+                row = {
+                    "size": size,
+                    "goals": len(goals),
+                    "order": "exact" if algo.exact else "2-opt",
+                    **algo.timings,
+                    "total_time": total_time,
+                    "nodes_visited": algo.nodes_visited,
+                    "tour_cost": algo.tour_cost,
+                    "nn_cost": algo._order_cost(distances, algo._nearest_neighbour_order(distances)),
+                    "two_opt_cost": algo._order_cost(distances, algo._heuristic_order(distances))
+                }
+                rows.append(row)
+                print(f"{size:>6}{row['goals']:>7}{row['order']:>8}{row['distances']:>16.1f}{row['ordering']:>15.1f}"
+                      f"{row['paths']:>11.1f}{row['total_time']:>12.1f}{row['nodes_visited']:>10}{row['tour_cost']:>11}"
+                      f"{row['nn_cost']:>10}{row['two_opt_cost']:>12}")
+        return rows
+
+    def scaling(self, sizes=(32, 64, 128, 256, 512), test_types=("scatter", "perfect_maze"), time_budget=5.0,
+                output="scaling.csv"):
+        """
+        Run every algorithm on square grids of geometrically growing size and fit how its time,
+        nodes visited and peak memory grow with the number of cells: the slope of log(metric)
+        against log(cells), so 1.0 is linear and 2.0 quadratic. A search that runs past
+        time_budget seconds (or a recursive one that hits the recursion limit) stops that
+        algorithm from moving on to larger grids of that type.
+        Each run is timed without memory tracing, then repeated under tracemalloc for its peak
+        memory. The curves are written to output (CSV, or Excel for .xlsx) and summarised in a table.
+        """
+        options = {"beam": {"beam_width": 3}, "smastar": {"max_nodes": 1000}, "hpastar": {"cluster_size": 10}}
+        curves = ResultFile(output, sheet_title="Scaling")
+        curves.open(["Algorithm", "Test Type", "Size", "Cells", "Goal Reached", "Nodes Visited",
+                     "Execution Time (ms)", "Peak Memory (KB)", "Path Length"])
+
+        summary = []
+        for test_type in test_types:
+            points = {method: [] for method in search_algorithms} # Method -> [(cells, time, nodes, memory)]
+            stopped = set()
+            for size in sizes:
+                case = self.generate_cases(test_type, size, count=1)[0]
+                cells = size * size
+                for method in search_algorithms:
+                    if method in stopped:
+                        continue
+                    algo_class = load_algorithm(method)
+                    try:
+                        result = self.run_algorithm(algo_class, case, SearchDeadline(time_budget), **options.get(method, {}))
+                        tracker = MemoryTracker()
+                        tracker.start()
+                        try:
+                            self.run_algorithm(algo_class, case, SearchDeadline(time_budget * 10, tracker), **options.get(method, {}))
+                        finally:
+                            tracker.stop()
+                    except (TimeoutError, RecursionError) as e:
+                        stopped.add(method)
+                        reason = f"over {time_budget}s" if isinstance(e, TimeoutError) else "recursion limit reached"
+                        print(f"{method} on {test_type} {size}x{size}: {reason}, larger grids skipped")
+                        continue
+                    peak_memory = tracker.report()["peak_memory"]
+
+                    points[method].append((cells, result["execution_time"], result["nodes_visited"], peak_memory))
+                    curves.append([method, test_type, size, cells, result["goal_reached"], result["nodes_visited"],
+                                   round(result["execution_time"], 4), round(peak_memory, 2), result["path_length"]])
+
+            for method, method_points in points.items():
+                cell_counts = [point[0] for point in method_points]
+                summary.append({
+                    "algorithm": method,
+                    "test_type": test_type,
+                    "largest": int(math.sqrt(cell_counts[-1])) if cell_counts else 0,
+                    "time_exponent": self.fit_exponent(cell_counts, [point[1] for point in method_points]),
+                    "nodes_exponent": self.fit_exponent(cell_counts, [point[2] for point in method_points]),
+                    "memory_exponent": self.fit_exponent(cell_counts, [point[3] for point in method_points])
+                })
+        curves.close()
+
+        print(f"\n--- Growth exponents against the number of cells (1.0 = linear), curves in {output} ---")
+        print(f"{'Algorithm':<12}{'Type':<14}{'Largest':>9}{'Time':>8}{'Nodes':>8}{'Memory':>8}  Note")
+        for row in summary:
+            exponents = [row[key] for key in ("time_exponent", "nodes_exponent", "memory_exponent")]
+            # Searches that explore each cell a bounded number of times should grow about linearly
+            note = "worse than linear" if any(value is not None and value > 1.2 for value in exponents) else ""
+            values = "".join(f"{value:>8.2f}" if value is not None else f"{'N/A':>8}" for value in exponents)
+            print(f"{row['algorithm']:<12}{row['test_type']:<14}{row['largest']:>9}{values}  {note}")
+        return summary
+
+    @staticmethod
+    def fit_exponent(xs, ys):
+        """Least squares slope of log(y) against log(x), or None with fewer than two positive points"""
+        points = [(math.log(x), math.log(y)) for x, y in zip(xs, ys) if x > 0 and y > 0]
+        if len(points) < 2:
+            return None
+        mean_x = sum(x for x, _ in points) / len(points)
+        mean_y = sum(y for _, y in points) / len(points)
+        spread = sum((x - mean_x) ** 2 for x, _ in points)
+        if spread == 0:
+            return None
+        return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+if __name__ == "__main__":
+    # Run the named benchmark, e.g. python benchmark.py iddfs_unreachable
+    # An optional comma-separated list of grid sizes replaces the defaults: python benchmark.py scaling 32,64,128
+    benchmark = Benchmark()
+    name = sys.argv[1] if len(sys.argv) > 1 else "iddfs_unreachable"
+    if len(sys.argv) > 2:
+        getattr(benchmark, name)(tuple(int(size) for size in sys.argv[2].split(",")))
+    else:
+        getattr(benchmark, name)()
@@ -6,6 +6,8 @@ class BFS(SearchAlgorithm):
         queue = deque([(self.start, [])])  # Each element: (position, path_so_far)
         visited = set()
         self.nodes_visited = 0
+        if not self.reachable_goals: # Start and goals lie in different connected components
+            return None, self.nodes_visited, [], self.visited_result()
 
         while queue:
             current, path = queue.popleft()
@@ -14,14 +16,15 @@ class BFS(SearchAlgorithm):
                 continue
             self.nodes_visited += 1 # Only unique nodes are counted as visited
             visited.add(current)
+            self._track(queue, visited)
 
-            if current in self.goals:
-                return current, self.nodes_visited, path, list(visited)
+            if current in self.goal_set:
+                return current, self.nodes_visited, path, self.visited_result(visited)
 
             for dx, dy, move in self.directions:
                 nx, ny = current[0] + dx, current[1] + dy
                 neighbor = (nx, ny)
-                if self.is_valid(neighbor) and neighbor not in visited:
+                if self.can_move(current, neighbor) and neighbor not in visited:
                     queue.append((neighbor, path + [move]))
             
-        return None, self.nodes_visited, [], list(visited)
+        return None, self.nodes_visited, [], self.visited_result(visited)
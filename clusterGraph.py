@@ -0,0 +1,240 @@
+import hashlib
+import heapq
+import json
+import os
+from gridIndex import GridIndex
+from movement import Movement
+
+class ClusterGraph:
+    cache_size = 8 # Number of abstract graphs kept in memory
+    long_entrance = 6 # Entrances at least this wide get a transition at each end
+    _cache = {}
+
+    def __init__(self, index, cluster_size=10, movement=None):
+        """
+        Abstract graph used by hierarchical pathfinding (HPA*) on one map:
+        - The grid is split into cluster_size x cluster_size clusters
+        - Entrances: open cell pairs across a cluster border become abstract nodes linked by one step
+        - Intra-cluster edges: cheapest route between every pair of abstract nodes of a cluster,
+          searched inside that cluster and stored with its moves
+        Entrances are straight moves across a border. Diagonal moves only need their own
+        transitions where they squeeze between two walls, as every other diagonal crossing
+        has a straight one next to it.
+        """
+        self.index = index
+        self.cluster_size = cluster_size
+        self.movement = movement or Movement()
+        self.edges = {} # Abstract node -> {neighbor: (cost, moves)}
+        self.cluster_nodes = {} # Cluster (cx, cy) -> abstract nodes on its borders
+
+        self._build_entrances()
+        self._build_intra_edges()
+
+    @classmethod
+    def get(cls, grid, walls, terrain=(), cluster_size=10, cache_dir=None, movement=None):
+        """
+        Return the abstract graph for this map, building it on first use.
+        With a cache_dir the graph is also saved to disk and loaded from there by later runs.
+        """
+        movement = movement or Movement()
+        key = (tuple(grid), tuple(tuple(wall) for wall in walls), tuple(tuple(region) for region in terrain),
+               cluster_size, movement.key)
+        graph = cls._cache.get(key)
+        if graph is None:
+            index = GridIndex.get(grid, walls, terrain)
+            filename = None
+            if cache_dir:
+                filename = os.path.join(cache_dir, f"hpa-{hashlib.sha1(repr(key).encode()).hexdigest()}.json")
+
+            if filename and os.path.exists(filename):
+                graph = cls.load(filename, index, cluster_size, movement)
+            if graph is None:
+                graph = cls(index, cluster_size, movement)
+                if filename:
+                    graph.save(filename)
+
+            if len(cls._cache) >= cls.cache_size:
+                del cls._cache[next(iter(cls._cache))] # Drop the oldest graph
+            cls._cache[key] = graph
+        return graph
+
+    def save(self, filename):
+        """Write the abstract nodes and edges to a cache file, as JSON with tuples stored as lists"""
+        os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+        with open(filename, "w") as file:
+            json.dump({
+                "cluster_size": self.cluster_size,
+                "movement": list(self.movement.key),
+                # [x, y, [[neighbor x, neighbor y, cost, [moves]], ...]] per abstract node
+                "edges": [[x, y, [[nx, ny, cost, list(moves)] for (nx, ny), (cost, moves) in neighbors.items()]]
+                          for (x, y), neighbors in self.edges.items()],
+                # [cluster x, cluster y, [[x, y], ...]] per cluster
+                "cluster_nodes": [[cx, cy, [list(node) for node in nodes]] for (cx, cy), nodes in self.cluster_nodes.items()]
+            }, file)
+
+    @classmethod
+    def load(cls, filename, index, cluster_size, movement):
+        """
+        Read an abstract graph saved by save() for the map described by index. Returns None
+        when the file is unreadable or was saved for another cluster size or movement model,
+        so the caller builds the graph again.
+        """
+        try:
+            with open(filename) as file:
+                data = json.load(file)
+            if data["cluster_size"] != cluster_size or tuple(data["movement"]) != movement.key:
+                return None
+
+            def cell(x, y):
+                if type(x) is not int or type(y) is not int:
+                    raise ValueError("Cell coordinates must be integers")
+                return (x, y)
+
+            edges = {}
+            for x, y, neighbors in data["edges"]:
+                links = edges[cell(x, y)] = {}
+                for nx, ny, cost, moves in neighbors:
+                    if not isinstance(cost, (int, float)) or any(move not in movement.offsets for move in moves):
+                        raise ValueError("Invalid edge")
+                    links[cell(nx, ny)] = (cost, tuple(moves))
+            cluster_nodes = {cell(cx, cy): [cell(*node) for node in nodes] for cx, cy, nodes in data["cluster_nodes"]}
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        graph = cls.__new__(cls)
+        graph.index = index
+        graph.cluster_size = cluster_size
+        graph.movement = movement
+        graph.edges = edges
+        graph.cluster_nodes = cluster_nodes
+        return graph
+
+    def cluster_of(self, pos):
+        """Return the (cx, cy) cluster containing a position"""
+        return pos[0] // self.cluster_size, pos[1] // self.cluster_size
+
+    def edge_count(self):
+        """Number of directed edges in the abstract graph"""
+        return sum(len(neighbors) for neighbors in self.edges.values())
+
+    def _build_entrances(self):
+        """Scan every border between neighbouring clusters for entrances"""
+        size, rows, cols = self.cluster_size, self.index.rows, self.index.cols
+
+        # Vertical borders: cell (x, y) on the left, (x + 1, y) on the right
+        for x in range(size - 1, cols - 1, size):
+            for top in range(0, rows, size):
+                self._add_entrances([((x, y), (x + 1, y)) for y in range(top, min(top + size, rows))], "RIGHT", "LEFT")
+
+        # Horizontal borders: cell (x, y) above, (x, y + 1) below
+        for y in range(size - 1, rows - 1, size):
+            for left in range(0, cols, size):
+                self._add_entrances([((x, y), (x, y + 1)) for x in range(left, min(left + size, cols))], "DOWN", "UP")
+
+        if self.movement.squeezes:
+            # Diagonal pairs across a border whose cells only touch at a corner between two walls
+            for x in range(size - 1, cols - 1, size):
+                for y in range(rows - 1):
+                    self._add_squeeze((x, y), (x + 1, y + 1))
+                    self._add_squeeze((x, y + 1), (x + 1, y))
+            for y in range(size - 1, rows - 1, size):
+                for x in range(cols - 1):
+                    self._add_squeeze((x, y), (x + 1, y + 1))
+                    self._add_squeeze((x + 1, y), (x, y + 1))
+
+    def _add_entrances(self, border, forward, backward):
+        """
+        Split a border into runs of open cell pairs (entrances). A narrow entrance gets one
+        transition in its middle, a wide one a transition at each end.
+        """
+        runs, run = [], []
+        for a, b in border:
+            if self.index.is_open(a) and self.index.is_open(b):
+                run.append((a, b))
+            elif run:
+                runs.append(run)
+                run = []
+        if run:
+            runs.append(run)
+
+        for run in runs:
+            transitions = [run[len(run) // 2]] if len(run) < self.long_entrance else [run[0], run[-1]]
+            for a, b in transitions:
+                self._add_node(a)
+                self._add_node(b)
+                self.edges[a][b] = (self.index.cost(b), (forward,))
+                self.edges[b][a] = (self.index.cost(a), (backward,))
+
+    def _add_squeeze(self, a, b):
+        """Add a diagonal transition between two open cells if both cells beside it are walls"""
+        is_open = self.index.is_open
+        if not (is_open(a) and is_open(b)) or is_open((a[0], b[1])) or is_open((b[0], a[1])):
+            return
+        self._add_node(a)
+        self._add_node(b)
+        names, length = self.movement.names, self.movement.diagonal_length
+        self.edges[a][b] = (self.index.cost(b) * length, (names[(b[0] - a[0], b[1] - a[1])],))
+        self.edges[b][a] = (self.index.cost(a) * length, (names[(a[0] - b[0], a[1] - b[1])],))
+
+    def _add_node(self, pos):
+        """Register an abstract node with its cluster"""
+        if pos not in self.edges:
+            self.edges[pos] = {}
+            self.cluster_nodes.setdefault(self.cluster_of(pos), []).append(pos)
+
+    def _build_intra_edges(self):
+        """Link the abstract nodes of each cluster by their cheapest route inside the cluster"""
+        for cluster, nodes in self.cluster_nodes.items():
+            for node in nodes:
+                costs, parents = self.local_search(node)
+                for other in nodes:
+                    if other != node and other in costs:
+                        self.edges[node][other] = (costs[other], self.local_path(parents, other))
+
+    def local_search(self, source):
+        """
+        Dijkstra from source that never leaves its cluster.
+        Returns the cost of every cell reached and its (parent, move) link.
+        """
+        size, rows, cols = self.cluster_size, self.index.rows, self.index.cols
+        blocked, index, movement = self.index.blocked, self.index, self.movement
+        cx, cy = self.cluster_of(source)
+        left, top = cx * size, cy * size
+        right, bottom = min(left + size, cols), min(top + size, rows)
+
+        costs = {source: 0}
+        parents = {source: (None, None)}
+        open_list = [(0, source)]
+        done = set()
+        while open_list:
+            cost, current = heapq.heappop(open_list)
+            if current in done:
+                continue
+            done.add(current)
+
+            for dx, dy, move in movement.directions:
+                nx, ny = current[0] + dx, current[1] + dy
+                if left <= nx < right and top <= ny < bottom and not blocked[ny * cols + nx]:
+                    neighbor = (nx, ny)
+                    if dx and dy:
+                        if not movement.allows_diagonal(index.is_open, current, neighbor):
+                            continue
+                        new_cost = cost + index.cost(neighbor) * movement.diagonal_length
+                    else:
+                        new_cost = cost + index.cost(neighbor)
+                    if neighbor not in costs or new_cost < costs[neighbor]:
+                        costs[neighbor] = new_cost
+                        parents[neighbor] = (current, move)
+                        heapq.heappush(open_list, (new_cost, neighbor))
+
+        return costs, parents
+
+    def local_path(self, parents, pos):
+        """Follow (parent, move) links from local_search back to its source"""
+        moves = []
+        parent, move = parents[pos]
+        while parent is not None:
+            moves.append(move)
+            parent, move = parents[parent]
+        moves.reverse()
+        return tuple(moves)
@@ -0,0 +1,171 @@
+import heapq
+from searchAlgorithm import SearchAlgorithm
+
+class DStarLite(SearchAlgorithm):
+    def __init__(self, grid, start, goals, walls, terrain=None, movement=None):
+        super().__init__(grid, start, goals, walls, terrain, movement)
+        # Own copy of the occupancy bitmap (used by is_valid), so wall updates never touch the shared GridIndex
+        self.blocked = bytearray(self.index.blocked)
+        self.g = {}   # Cost-to-goal estimate per cell (missing = infinity)
+        self.rhs = {} # One-step lookahead of g per cell (missing = infinity)
+        self.open_keys = {} # Cell -> current key in the open list
+        self.open_list = []
+        self.km = 0 # Key modifier, grows as the start moves
+        self.expanded = set()
+
+    def search(self):
+        """
+        Plan from scratch. The search runs backwards from every goal towards the start,
+        so the costs it keeps stay valid for later wall updates and start moves.
+        """
+        self.g, self.rhs, self.open_keys, self.open_list = {}, {}, {}, []
+        self.km = 0
+        for goal in self.goal_set:
+            if self.is_valid(goal):
+                self.rhs[goal] = 0
+                self._push(goal)
+        return self.replan()
+
+    def update_walls(self, blocked=(), opened=()):
+        """
+        Repair the plan after wall changes.
+        - blocked: cells that became walls
+        - opened: cells that became free
+        Only cells whose cost-to-goal changes are searched again.
+        """
+        rows, cols = self.grid
+        changed = []
+        for (x, y), value in [(cell, 1) for cell in blocked] + [(cell, 0) for cell in opened]:
+            if 0 <= x < cols and 0 <= y < rows and self.blocked[y * cols + x] != value:
+                self.blocked[y * cols + x] = value
+                changed.append((x, y))
+
+        for cell in changed:
+            self._update_vertex(cell)
+            for neighbor in self._neighbors(cell):
+                # Its move into the changed cell, or a diagonal move past its corner, has changed
+                self._update_vertex(neighbor)
+        return self.replan()
+
+    def move_start(self, pos):
+        """Move the start (e.g. the robot took a step) while keeping the existing plan"""
+        self.km += self.heuristic(self.start, pos)
+        self.start = pos
+
+    def replan(self):
+        """Bring the plan up to date and return the usual (goal, nodes_visited, path, visited) result"""
+        self.nodes_visited = 0
+        self.expanded = set()
+        self._compute_shortest_path()
+
+        visited = self.visited_result(cell for cell in self.expanded if self.is_valid(cell)) # Cells that became walls are left out
+        path = self._extract_path()
+        if path is None:
+            return None, self.nodes_visited, [], visited
+        goal, moves = path
+        return goal, self.nodes_visited, moves, visited
+
+    def _neighbors(self, pos):
+        """In-bounds neighbours of a position, walls included"""
+        rows, cols = self.grid
+        for dx, dy, _ in self.directions:
+            nx, ny = pos[0] + dx, pos[1] + dy
+            if 0 <= nx < cols and 0 <= ny < rows:
+                yield (nx, ny)
+
+    def _calculate_key(self, pos):
+        """Priority of a cell: (min(g, rhs) + h(start, cell) + km, min(g, rhs))"""
+        best = min(self.g.get(pos, float('inf')), self.rhs.get(pos, float('inf')))
+        if self.diagonal:
+            # Rounded so float noise from diagonal moves cannot split keys that are equal
+            return (round(best + self.heuristic(self.start, pos) + self.km, 9), round(best, 9))
+        return (best + self.heuristic(self.start, pos) + self.km, best)
+
+    def _push(self, pos):
+        """Queue a cell with its current key; older entries for it become stale"""
+        key = self._calculate_key(pos)
+        self.open_keys[pos] = key
+        heapq.heappush(self.open_list, (key, pos))
+
+    def _top(self):
+        """Drop stale entries and return the lowest live (key, cell), or None"""
+        while self.open_list:
+            key, pos = self.open_list[0]
+            if self.open_keys.get(pos) == key:
+                return key, pos
+            heapq.heappop(self.open_list)
+        return None
+
+    def _update_vertex(self, pos):
+        """Recompute rhs of a cell from its successors and requeue it if it is inconsistent"""
+        inf = float('inf')
+        if pos in self.goal_set and self.is_valid(pos):
+            self.rhs[pos] = 0
+        else:
+            best = inf
+            if self.is_valid(pos):
+                for neighbor in self._neighbors(pos):
+                    if self.can_move(pos, neighbor):
+                        best = min(best, self.move_cost(pos, neighbor) + self.g.get(neighbor, inf))
+            self.rhs[pos] = best
+
+        self.open_keys.pop(pos, None)
+        if self.g.get(pos, inf) != self.rhs.get(pos, inf):
+            self._push(pos)
+
+    def _compute_shortest_path(self):
+        """Expand inconsistent cells until the start is consistent and no cheaper key is queued"""
+        inf = float('inf')
+        while True:
+            top = self._top()
+            start_key = self._calculate_key(self.start)
+            if top is None or (top[0] >= start_key and self.rhs.get(self.start, inf) == self.g.get(self.start, inf)):
+                return
+
+            key, current = top
+            new_key = self._calculate_key(current)
+            if key < new_key: # The start moved since this cell was queued
+                self._push(current)
+                continue
+
+            heapq.heappop(self.open_list)
+            del self.open_keys[current]
+            self.nodes_visited += 1
+            self.expanded.add(current)
+            self._track(self.open_list, self.expanded)
+
+            if self.g.get(current, inf) > self.rhs.get(current, inf):
+                self.g[current] = self.rhs[current] # Cost went down: settle it
+                for neighbor in self._neighbors(current):
+                    self._update_vertex(neighbor)
+            else:
+                self.g[current] = inf # Cost went up: reset and let it be recomputed
+                self._update_vertex(current)
+                for neighbor in self._neighbors(current):
+                    self._update_vertex(neighbor)
+
+    def _extract_path(self):
+        """Follow the cheapest successor from the start down to a goal, or None without a path"""
+        inf = float('inf')
+        if not self.is_valid(self.start) or self.g.get(self.start, inf) == inf:
+            return None
+
+        current = self.start
+        moves = []
+        rows, cols = self.grid
+        for _ in range(rows * cols):
+            if current in self.goal_set:
+                return current, moves
+
+            best, best_move, best_cost = None, None, inf
+            for dx, dy, move in self.directions:
+                neighbor = (current[0] + dx, current[1] + dy)
+                if self.can_move(current, neighbor):
+                    cost = self.move_cost(current, neighbor) + self.g.get(neighbor, inf)
+                    if cost < best_cost:
+                        best, best_move, best_cost = neighbor, move, cost
+            if best is None:
+                return None
+            moves.append(best_move)
+            current = best
+        return None
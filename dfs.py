@@ -4,15 +4,17 @@ class DFS(SearchAlgorithm):
     def search(self):
         visited = set()
         self.nodes_visited = 0
+        if not self.reachable_goals: # Start and goals lie in different connected components
+            return None, self.nodes_visited, [], self.visited_result()
 
         # Start DFS from the initial position
         result = self._dfs(self.start, [], visited)
         if result: # Found a goal
             goal, path = result
-            visited_grid = list(visited)
+            visited_grid = self.visited_result(visited)
             return goal, self.nodes_visited, path, visited_grid
         else:
-            return None, self.nodes_visited, [], list(visited)
+            return None, self.nodes_visited, [], self.visited_result(visited)
 
     def _dfs(self, current, path, visited):
         if current in visited: # Already visited this node
@@ -20,16 +22,17 @@ class DFS(SearchAlgorithm):
         
         visited.add(current) # Mark the current node as visited
         self.nodes_visited += 1 
+        self._track(visited=visited, paths=(path,))
 
-        if current in self.goals: # Check if current node is a goal
+        if current in self.goal_set: # Check if current node is a goal
             return current, path
 
-        for dx, dy, move in self.directions:  # Respect order: UP, LEFT, DOWN, RIGHT
+        for dx, dy, move in self.directions:  # Respect order: UP, LEFT, DOWN, RIGHT (then diagonals)
             nx, ny = current[0] + dx, current[1] + dy
             neighbor = (nx, ny)
 
             # Check if the neighbor is valid and not visited
-            if self.is_valid(neighbor) and neighbor not in visited:
+            if self.can_move(current, neighbor) and neighbor not in visited:
                 result = self._dfs(neighbor, path + [move], visited) # Apply DFS recursively, adding the move to the path
                 if result:
                     return result  # Found goal, return early
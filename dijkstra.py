@@ -0,0 +1,52 @@
+from searchAlgorithm import SearchAlgorithm
+from priorityQueue import make_queue
+
+class Dijkstra(SearchAlgorithm):
+    def __init__(self, grid, start, goals, walls, terrain=None, queue="heap", movement=None):
+        super().__init__(grid, start, goals, walls, terrain, movement)
+        self.queue = queue # Frontier implementation: "heap", "indexed" or "bucket" (integer costs only)
+        self.duplicate_pops = 0 # Stale entries popped for already visited cells
+        self.peak_frontier = 0 # Largest number of entries held in the open list
+
+    def search(self):
+        # Priority queue: (cost_so_far, path_length, position, path_so_far)
+        open_list = make_queue(self.queue)
+        visited = set()
+        self.nodes_visited = 0
+        self.duplicate_pops = 0
+        self.peak_frontier = 0
+        if not self.reachable_goals: # Start and goals lie in different connected components
+            return None, self.nodes_visited, [], self.visited_result()
+
+        g_costs = {self.start: 0}  # Cheapest known cost from start to each node
+        open_list.push((0, 0, self.start, []))
+
+        while open_list:
+            self.peak_frontier = max(self.peak_frontier, len(open_list))
+            _, _, current, path = open_list.pop() # Get the cheapest node
+
+            if current in visited:
+                self.duplicate_pops += 1
+                continue
+            self.nodes_visited += 1 # Only unique nodes are counted as visited
+            visited.add(current)
+            self._track(open_list, visited)
+
+            # The first goal popped is the cheapest goal to reach
+            if current in self.goal_set:
+                return current, self.nodes_visited, path, self.visited_result(visited)
+
+            for dx, dy, move in self.directions:
+                nx, ny = current[0] + dx, current[1] + dy
+                neighbor = (nx, ny)
+
+                if not self.can_move(current, neighbor) or neighbor in visited:
+                    continue
+
+                # Moving onto a cell costs that cell's terrain cost, times the move length
+                tentative_g = g_costs[current] + self.move_cost(current, neighbor)
+                if neighbor not in g_costs or tentative_g < g_costs[neighbor]:
+                    g_costs[neighbor] = tentative_g
+                    open_list.push((tentative_g, len(path) + 1, neighbor, path + [move]))
+
+        return None, self.nodes_visited, [], self.visited_result(visited)
@@ -1,17 +1,19 @@
-import re
-
 class FileReader:
     def __init__(self, filename = None):
         self.filename = filename
         self.data = None
         
+    def _integers(self, text):
+        # Extract every run of digits from text (same as re.findall(r'\d+'), without importing re).
+        return "".join(char if char.isdecimal() else " " for char in text).split()
+
     def _parse_list(self, text):
         # Extract a list of integers from text.
-        return list(map(int, re.findall(r'\d+', text)))
+        return list(map(int, self._integers(text)))
         
     def _parse_tuple(self, text):
         # Extract a tuple of integers from text.
-        return tuple(map(int, re.findall(r'\d+', text)))
+        return tuple(map(int, self._integers(text)))
         
     def parse_input_file(self, filename=None):
         # Parse the input file and store the data.
@@ -46,11 +48,18 @@ class FileReader:
                 else:
                     raise ValueError(f"Invalid goal state: {goal_str}")
             
-            # Parse walls
+            # Parse walls (x,y,w,h) and optional terrain cost regions: terrain (x,y,w,h,cost)
             walls = []
+            terrain = []
             for wall_line in lines[3:]:
                 wall = self._parse_tuple(wall_line)
-                if len(wall) >= 4:
+                if wall_line.lower().startswith("terrain"):
+                    if len(wall) != 5:
+                        raise ValueError(f"Invalid terrain: {wall_line} (needs terrain (x,y,w,h,cost))")
+                    if wall[4] < 1:
+                        raise ValueError(f"Invalid terrain cost: {wall_line} (cost must be at least 1)")
+                    terrain.append((wall[0], wall[1], wall[2], wall[3], wall[4]))
+                elif len(wall) >= 4:
                     walls.append((wall[0], wall[1], wall[2], wall[3]))
                 else:
                     raise ValueError(f"Invalid wall: {wall_line} (needs 4 values)")
@@ -59,7 +68,8 @@ class FileReader:
                 "grid_size": (grid_size[0], grid_size[1]),
                 "initial_position": (initial_position[0], initial_position[1]),
                 "goal_states": goal_states,
-                "walls": walls
+                "walls": walls,
+                "terrain": terrain
             }
             
             return self.data
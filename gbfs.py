@@ -1,34 +1,41 @@
-import heapq
 from searchAlgorithm import SearchAlgorithm
+from priorityQueue import make_queue
 
 class GBFS(SearchAlgorithm):
+    def __init__(self, grid, start, goals, walls, terrain=None, queue="heap", movement=None):
+        super().__init__(grid, start, goals, walls, terrain, movement)
+        self.queue = queue # Frontier implementation: "heap" or "bucket"
+
     def search(self):
         # Priority queue: (heuristic, position, path_so_far)
-        open_list = []
+        open_list = make_queue(self.queue)
         visited = set()
         self.nodes_visited = 0
+        if not self.reachable_goals: # Start and goals lie in different connected components
+            return None, self.nodes_visited, [], self.visited_result()
 
         # Pick the closest goal to guide the heuristic
         goal = self.get_closest_goal(self.start)
-        heapq.heappush(open_list, (self.heuristic(self.start, goal), self.start, []))
+        open_list.push((self.heuristic(self.start, goal), self.start, []))
 
         while open_list:
-            _, current, path = heapq.heappop(open_list)
+            _, current, path = open_list.pop()
 
             if current in visited:
                 continue
             self.nodes_visited += 1 # Only unique nodes are counted as visited
             visited.add(current)
+            self._track(open_list, visited)
 
-            if current in self.goals:
-                return current, self.nodes_visited, path, list(visited)
+            if current in self.goal_set:
+                return current, self.nodes_visited, path, self.visited_result(visited)
 
             for dx, dy, move in self.directions:
                 nx, ny = current[0] + dx, current[1] + dy
                 neighbor = (nx, ny)
 
-                if self.is_valid(neighbor) and neighbor not in visited:
+                if self.can_move(current, neighbor) and neighbor not in visited:
                     h = self.heuristic(neighbor, goal)
-                    heapq.heappush(open_list, (h, neighbor, path + [move]))
+                    open_list.push((h, neighbor, path + [move]))
                 
-        return None, self.nodes_visited, [], list(visited)
+        return None, self.nodes_visited, [], self.visited_result(visited)
@@ -0,0 +1,81 @@
+import math
+
+class GoalIndex:
+    linear_limit = 16 # Up to this many goals a plain loop is faster than the buckets
+
+    def __init__(self, goals, distance):
+        """
+        Nearest-goal lookups over a fixed goal list. Goals are binned into a grid of square
+        buckets sized for about one goal each; a query scans rings of buckets outward from
+        the query cell and stops once no unscanned bucket can hold a closer goal.
+        distance(a, b) must never be below the Chebyshev distance, which holds for the
+        Manhattan and octile heuristics. Ties go to the goal listed first, as in a plain loop.
+        """
+        self.goals = list(goals)
+        self.distance = distance
+        self.buckets = None
+        if len(self.goals) <= self.linear_limit:
+            return
+
+        self.min_x = min(x for x, _ in self.goals)
+        self.min_y = min(y for _, y in self.goals)
+        span = max(max(x for x, _ in self.goals) - self.min_x, max(y for _, y in self.goals) - self.min_y) + 1
+        self.size = max(2, int(span / math.sqrt(len(self.goals))))
+        self.buckets = {} # (bucket x, bucket y) -> [(order, goal)]
+        for order, goal in enumerate(self.goals):
+            self.buckets.setdefault(self._bucket(goal), []).append((order, goal))
+        self.columns = max(bx for bx, _ in self.buckets) + 1
+        self.rows = max(by for _, by in self.buckets) + 1
+
+    def _bucket(self, pos):
+        return (pos[0] - self.min_x) // self.size, (pos[1] - self.min_y) // self.size
+
+    def nearest(self, pos):
+        """Return (goal, distance) of the nearest goal, or (None, None) without goals"""
+        if not self.goals:
+            return None, None
+        if self.buckets is None:
+            return self._nearest_linear(pos)
+
+        distance = self.distance
+        bx, by = self._bucket(pos)
+        # Rings beyond this radius lie outside every bucket
+        last_ring = max(bx, self.columns - 1 - bx, by, self.rows - 1 - by)
+        best = None # (distance, order, goal)
+        for ring in range(last_ring + 1):
+            for bucket in self._ring(bx, by, ring):
+                for order, goal in self.buckets.get(bucket, ()):
+                    candidate = (distance(pos, goal), order, goal)
+                    if best is None or candidate < best:
+                        best = candidate
+            # Cells in the next ring are more than ring * size cells away on some axis
+            if best is not None and best[0] <= ring * self.size:
+                break
+        return best[2], best[0]
+
+    def _ring(self, bx, by, ring):
+        """Bucket coordinates at Chebyshev distance ring from (bx, by), clipped to the bucket grid"""
+        if ring == 0:
+            if 0 <= bx < self.columns and 0 <= by < self.rows:
+                yield bx, by
+            return
+        left, right = max(0, bx - ring), min(self.columns - 1, bx + ring)
+        for y in (by - ring, by + ring):
+            if 0 <= y < self.rows:
+                for x in range(left, right + 1):
+                    yield x, y
+        top, bottom = max(0, by - ring + 1), min(self.rows - 1, by + ring - 1)
+        for x in (bx - ring, bx + ring):
+            if 0 <= x < self.columns:
+                for y in range(top, bottom + 1):
+                    yield x, y
+
+    def _nearest_linear(self, pos):
+        closest_goal = self.goals[0]
+        min_distance = self.distance(pos, closest_goal)
+        for goal in self.goals:
+            current_distance = self.distance(pos, goal)
+            if current_distance < min_distance:
+                min_distance = current_distance
+                closest_goal = goal
+        return closest_goal, min_distance
@@ -1,10 +1,16 @@
+from pathEncoding import PathEncoding
+
 class Grid:
     def __init__(self, data=None):
         self.data = data
         self.wall_cells = set()
+        self.cost_cells = {}
+        self._base_rows = None # Terrain, walls and goals: one string per row, one character per cell
+        self._base_lines = None # The same rows spaced out for printing
         
         if data:
             self._calculate_wall_cells()
+            self._calculate_cost_cells()
             
     def _calculate_wall_cells(self):
         """Pre-calculate all wall cells for faster lookups."""
@@ -14,32 +20,118 @@ class Grid:
                 for dy in range(h):
                     self.wall_cells.add((x + dx, y + dy))
 
-    def visualize_map(self):
-        """Visualize the basic grid map."""
-        if not self.data:
-            raise ValueError("No data provided for visualization.")
-            
-        rows, cols = self.data["grid_size"]
-        grid = [["." for _ in range(cols)] for _ in range(rows)]
+    def _calculate_cost_cells(self):
+        """Pre-calculate the terrain cost of every cell that does not cost 1."""
+        self.cost_cells = {}
+        for x, y, w, h, cost in self.data.get("terrain", []):
+            for dx in range(w):
+                for dy in range(h):
+                    self.cost_cells[(x + dx, y + dy)] = cost
+        # Later regions may reset cells back to plain cost
+        self.cost_cells = {cell: cost for cell, cost in self.cost_cells.items() if cost != 1}
+
+    def apply_wall_diff(self, added=(), removed=()):
+        """
+        Add and remove wall rectangles (x, y, w, h) without rebuilding wall_cells.
+        Returns (blocked, opened): the cells that became walls and the cells that became free.
+        """
+        walls = list(self.data["walls"])
+        for wall in removed:
+            if tuple(wall) not in walls:
+                raise ValueError(f"Wall {tuple(wall)} is not on the map")
+            walls.remove(tuple(wall))
+
+        # A removed cell stays a wall while another wall still covers it
+        opened = set()
+        for x, y, w, h in removed:
+            overlapping = [(ox, oy, ow, oh) for ox, oy, ow, oh in walls
+                           if ox < x + w and x < ox + ow and oy < y + h and y < oy + oh]
+            for dx in range(w):
+                for dy in range(h):
+                    cx, cy = x + dx, y + dy
+                    if not any(ox <= cx < ox + ow and oy <= cy < oy + oh for ox, oy, ow, oh in overlapping):
+                        opened.add((cx, cy))
+
+        blocked = set()
+        for x, y, w, h in added:
+            walls.append((x, y, w, h))
+            for dx in range(w):
+                for dy in range(h):
+                    cell = (x + dx, y + dy)
+                    if cell in opened:
+                        opened.discard(cell) # Removed and added back, so nothing changes
+                    elif cell not in self.wall_cells:
+                        blocked.add(cell)
+
+        self.data["walls"] = walls # New list, so searches holding the old one are unaffected
+        self.wall_cells -= opened
+        self.wall_cells |= blocked
+        self._base_rows = self._base_lines = None # Walls changed, draw the base layer again
+        return blocked, opened
+
+    def _cost_symbol(self, cost):
+        """Symbol for a terrain cell: its cost as a digit, or ~ above 9."""
+        return str(cost) if cost <= 9 else "~"
+
+    def _base_layer(self):
+        """
+        Draw terrain, walls and goals once per grid and keep the rows as immutable strings.
+        Every view is this layer plus a few cells drawn over it.
+        """
+        if self._base_rows is None:
+            rows, cols = self.data["grid_size"]
+            grid = [["." for _ in range(cols)] for _ in range(rows)]
+
+            # Mark terrain costs
+            for (x, y), cost in self.cost_cells.items():
+                if 0 <= y < rows and 0 <= x < cols:
+                    grid[y][x] = self._cost_symbol(cost)
+
+            # Mark walls
+            for (x, y) in self.wall_cells:
+                if 0 <= y < rows and 0 <= x < cols:
+                    grid[y][x] = "#"
+
+            # Mark goals, which are drawn over everything else
+            for (gx, gy) in self.data["goal_states"]:
+                if 0 <= gy < rows and 0 <= gx < cols:
+                    grid[gy][gx] = "G"
+
+            self._base_rows = tuple("".join(row) for row in grid)
+            self._base_lines = tuple(" ".join(row) for row in grid)
+        return self._base_rows
 
-        # Mark walls
-        for (x, y) in self.wall_cells:
+    def _draw(self, changed, cells, symbol):
+        """
+        Draw a symbol on cells over the base layer. changed maps a row number to its characters,
+        copied from the base layer the first time one of its cells is drawn.
+        """
+        base = self._base_layer()
+        rows, cols = self.data["grid_size"]
+        for x, y in cells:
             if 0 <= y < rows and 0 <= x < cols:
-                grid[y][x] = "#"
+                row = changed.get(y)
+                if row is None:
+                    row = changed[y] = list(base[y])
+                row[x] = symbol
 
-        # Mark goals
-        for (gx, gy) in self.data["goal_states"]:
-            if 0 <= gy < rows and 0 <= gx < cols:
-                grid[gy][gx] = "G"
+    def _print_rows(self, changed):
+        """Print the grid: rows with drawn cells rebuilt, the others straight from the cache"""
+        lines = list(self._base_lines)
+        for y, row in changed.items():
+            lines[y] = " ".join(row)
+        print("\n".join(lines))
 
-        # Mark initial position (after goals/walls to override)
-        ix, iy = self.data["initial_position"]
-        if 0 <= iy < rows and 0 <= ix < cols:
-            grid[iy][ix] = "S"
+    def visualize_map(self):
+        """Visualize the basic grid map."""
+        if not self.data:
+            raise ValueError("No data provided for visualization.")
 
+        # Initial position drawn over goals and walls
+        changed = {}
+        self._draw(changed, [self.data["initial_position"]], "S")
         print("\nGrid Map:")
-        for row in grid:
-            print(" ".join(row))
+        self._print_rows(changed)
 
     def visualize_solution(self, path, visited = None):
         """Visualize a solution path on the grid."""
@@ -49,56 +141,46 @@ class Grid:
             
         # Convert path from directions to coordinates if needed
         coords = self._path_to_coordinates(path)
-        
-        rows, cols = self.data["grid_size"]
-        grid = [["." for _ in range(cols)] for _ in range(rows)]
-
-        # Mark walls
-        for (x, y) in self.wall_cells:
-            if 0 <= y < rows and 0 <= x < cols:
-                grid[y][x] = "#"
 
-        # Mark visited nodes
+        # Visited cells, then the path over them: S for the start, P for the steps
+        changed = {}
         if visited:
-            for (x, y) in visited:
-                if 0 <= y < rows and 0 <= x < cols:
-                    grid[y][x] = "+"
-
-        reached_goals = []
+            self._draw(changed, visited, "+")
+        if coords:
+            self._draw(changed, coords[:1], "S")
+            self._draw(changed, coords[1:], "P")
 
-        # Mark path
-        for i, (x, y) in enumerate(coords):
-            if 0 <= y < rows and 0 <= x < cols:
-                # Use different symbols for start, end, and path steps
-                if i == 0:
-                    grid[y][x] = "S"  # Start position
-                elif (x, y) in self.data["goal_states"]:
-                    grid[y][x] = "G"  # Goal position
-                else:
-                    grid[y][x] = "P"  # Path step
-        
-        # Mark remaining goals that weren't reached
+        # Goals stay on top, reached or not
+        cols = self.data["grid_size"][1]
         for (gx, gy) in self.data["goal_states"]:
-            if (gx, gy) not in reached_goals and 0 <= gy < rows and 0 <= gx < cols:
-                grid[gy][gx] = "G"  # Unreached goal
+            row = changed.get(gy)
+            if row is not None and 0 <= gx < cols:
+                row[gx] = "G"
 
-        # Print the grid
-        for row in grid:
-            print(" ".join(row))
+        self._print_rows(changed)
         print("\nS = Start  G = Goal  P = Path  + = Visited  # = Wall")
+        if self.cost_cells:
+            print("2-9 = Terrain cost  ~ = Terrain cost above 9")
         
     def _path_to_coordinates(self, path):
         """Convert a path to coordinates."""
         # If path is already coordinates, return it
         if path and isinstance(path[0], tuple):
             return path
+
+        # Expand run-length encoded moves ("RIGHT*12 DOWN*4"), plain moves pass through
+        path = PathEncoding.decode(path)
             
         # Convert direction strings to coordinates
         moves = {
             'up': (0, -1),
             'down': (0, 1),
             'left': (-1, 0),
-            'right': (1, 0)
+            'right': (1, 0),
+            'up-left': (-1, -1),
+            'up-right': (1, -1),
+            'down-left': (-1, 1),
+            'down-right': (1, 1)
         }
         
         x, y = self.data["initial_position"]
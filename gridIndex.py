@@ -0,0 +1,137 @@
+from array import array
+from collections import deque
+
+class GridIndex:
+    cache_size = 8 # Number of maps kept in the shared cache
+    _cache = {}
+
+    def __init__(self, grid, walls, terrain=()):
+        """
+        Precomputed lookups for one map:
+        - blocked: occupancy bitmap, one byte per cell (row-major), 1 = wall
+        - costs: step cost of entering each cell, or None when every cell costs 1
+        - components: connected-component label per cell, labelled on first use
+        - diagonal_components: the same when diagonal moves may squeeze between walls
+        """
+        self.rows, self.cols = grid
+        self.blocked = bytearray(self.rows * self.cols)
+        self.costs = None
+        self.max_cost = 1
+        self._components = None
+        self._diagonal_components = None
+
+        for wx, wy, w, h in walls:
+            # Clip walls to the grid bounds
+            for y in range(max(0, wy), min(self.rows, wy + h)):
+                for x in range(max(0, wx), min(self.cols, wx + w)):
+                    self.blocked[y * self.cols + x] = 1
+
+        if terrain:
+            # Later terrain regions override earlier ones
+            self.costs = array('I', [1]) * (self.rows * self.cols)
+            for tx, ty, w, h, cost in terrain:
+                for y in range(max(0, ty), min(self.rows, ty + h)):
+                    for x in range(max(0, tx), min(self.cols, tx + w)):
+                        self.costs[y * self.cols + x] = cost
+            self.max_cost = max(self.costs)
+
+    @staticmethod
+    def key(grid, walls, terrain=()):
+        """Cache key of a map"""
+        return (tuple(grid), tuple(tuple(wall) for wall in walls), tuple(tuple(region) for region in terrain))
+
+    @classmethod
+    def get(cls, grid, walls, terrain=()):
+        """Return the cached index for this map, building it on first use"""
+        key = cls.key(grid, walls, terrain)
+        index = cls._cache.get(key)
+        if index is None:
+            index = cls(grid, walls, terrain)
+            cls.install(key, index)
+        return index
+
+    @classmethod
+    def install(cls, key, index):
+        """Cache an index built elsewhere (such as one attached from shared memory) under a map key"""
+        if key not in cls._cache and len(cls._cache) >= cls.cache_size:
+            del cls._cache[next(iter(cls._cache))] # Drop the oldest map
+        cls._cache[key] = index
+
+    @classmethod
+    def uninstall(cls, index):
+        """Drop an index from the cache, under whatever keys it was installed"""
+        for key in [key for key, cached in cls._cache.items() if cached is index]:
+            del cls._cache[key]
+
+    def is_open(self, pos):
+        """Check if a position is within the grid and not a wall"""
+        x, y = pos
+        return 0 <= x < self.cols and 0 <= y < self.rows and not self.blocked[y * self.cols + x]
+
+    def cost(self, pos):
+        """Return the cost of stepping onto a position (1 unless terrain says otherwise)"""
+        if self.costs is None:
+            return 1
+        x, y = pos
+        return self.costs[y * self.cols + x]
+
+    @property
+    def components(self):
+        """Connected-component label per cell (-1 for walls), labelled once with a flood fill"""
+        if self._components is None:
+            self._components = self._label_components()
+        return self._components
+
+    @property
+    def diagonal_components(self):
+        """Component labels where cells touching only at a corner are connected as well"""
+        if self._diagonal_components is None:
+            self._diagonal_components = self._label_components(diagonal=True)
+        return self._diagonal_components
+
+    def _label_components(self, diagonal=False):
+        """
+        Flood fill every open cell, giving each 4-connected region its own label
+        (8-connected with diagonal=True). Diagonal moves that are not allowed to squeeze between
+        two walls always have a straight detour, so they never join 4-connected regions.
+        """
+        rows, cols, blocked = self.rows, self.cols, self.blocked
+        labels = array('i', [-1]) * (rows * cols)
+        label = 0
+
+        for cell in range(rows * cols):
+            if blocked[cell] or labels[cell] != -1:
+                continue
+
+            labels[cell] = label
+            queue = deque([cell])
+            while queue:
+                current = queue.popleft()
+                x = current % cols
+                for neighbor, inside in ((current - cols, current >= cols),
+                                         (current + cols, current < (rows - 1) * cols),
+                                         (current - 1, x > 0),
+                                         (current + 1, x < cols - 1)):
+                    if inside and not blocked[neighbor] and labels[neighbor] == -1:
+                        labels[neighbor] = label
+                        queue.append(neighbor)
+                if diagonal:
+                    up, down = current >= cols, current < (rows - 1) * cols
+                    for neighbor, inside in ((current - cols - 1, up and x > 0),
+                                             (current - cols + 1, up and x < cols - 1),
+                                             (current + cols - 1, down and x > 0),
+                                             (current + cols + 1, down and x < cols - 1)):
+                        if inside and not blocked[neighbor] and labels[neighbor] == -1:
+                            labels[neighbor] = label
+                            queue.append(neighbor)
+            label += 1
+
+        return labels
+
+    def component(self, pos, diagonal=False):
+        """Return the component label of a position, or -1 for walls and out-of-bounds cells"""
+        if not self.is_open(pos):
+            return -1
+        x, y = pos
+        labels = self.diagonal_components if diagonal else self.components
+        return labels[y * self.cols + x]
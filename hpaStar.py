@@ -0,0 +1,99 @@
+import heapq
+from searchAlgorithm import SearchAlgorithm
+from clusterGraph import ClusterGraph
+
+class HPAStar(SearchAlgorithm):
+    def __init__(self, grid, start, goals, walls, cluster_size=10, terrain=None, cache_dir=None, movement=None):
+        super().__init__(grid, start, goals, walls, terrain, movement)
+        self.cluster_size = max(2, cluster_size)
+        self.cache_dir = cache_dir # Optional directory holding precomputed abstract graphs
+        self.abstract_graph = None
+
+    def search(self):
+        self.nodes_visited = 0
+        if not self.reachable_goals: # Start and goals lie in different connected components
+            return None, self.nodes_visited, [], self.visited_result()
+
+        # Precomputed once per map and cluster size, then shared by every query
+        graph = ClusterGraph.get(self.grid, self.walls, self.terrain, self.cluster_size, self.cache_dir, self.movement)
+        self.abstract_graph = graph
+
+        # Temporary edges linking the start and goals to the abstract nodes of their clusters
+        goals = set(self.reachable_goals)
+        extra_edges = self.connect_start(graph, goals)
+        for node, edges in self.connect_goals(graph, goals).items():
+            extra_edges.setdefault(node, {}).update(edges)
+
+        # A* over the abstract graph: entries are (f, g, position)
+        open_list = [(self.goal_distance(self.start), 0, self.start)]
+        g_costs = {self.start: 0}
+        parents = {self.start: (None, ())} # Abstract node -> (previous node, moves in between)
+        visited = set()
+
+        while open_list:
+            _, g, current = heapq.heappop(open_list)
+
+            if current in visited:
+                continue
+            self.nodes_visited += 1
+            visited.add(current)
+            self._track(open_list, visited, paths=(parents,))
+
+            if current in goals:
+                return current, self.nodes_visited, self.refine_path(parents, current), self.visited_result(visited)
+
+            for neighbor, (cost, moves) in self.abstract_edges(graph, extra_edges, current):
+                if neighbor in visited:
+                    continue
+                tentative_g = g + cost
+                if neighbor not in g_costs or tentative_g < g_costs[neighbor]:
+                    g_costs[neighbor] = tentative_g
+                    parents[neighbor] = (current, moves)
+                    heapq.heappush(open_list, (tentative_g + self.goal_distance(neighbor), tentative_g, neighbor))
+
+        return None, self.nodes_visited, [], self.visited_result(visited)
+
+    def connect_start(self, graph, goals):
+        """Edges from the start to every abstract node and goal it can reach inside its cluster"""
+        costs, parents = graph.local_search(self.start)
+        cluster = graph.cluster_of(self.start)
+        targets = graph.cluster_nodes.get(cluster, []) + [goal for goal in goals if graph.cluster_of(goal) == cluster]
+
+        edges = {}
+        for target in targets:
+            if target != self.start and target in costs:
+                edges[target] = (costs[target], graph.local_path(parents, target))
+        return {self.start: edges}
+
+    def connect_goals(self, graph, goals):
+        """Edges from the abstract nodes of each goal's cluster to the goals they can reach inside it"""
+        goal_clusters = {}
+        for goal in goals:
+            goal_clusters.setdefault(graph.cluster_of(goal), []).append(goal)
+
+        extra_edges = {}
+        for cluster, cluster_goals in goal_clusters.items():
+            for node in graph.cluster_nodes.get(cluster, []):
+                costs, parents = graph.local_search(node)
+                for goal in cluster_goals:
+                    if goal != node and goal in costs:
+                        extra_edges.setdefault(node, {})[goal] = (costs[goal], graph.local_path(parents, goal))
+        return extra_edges
+
+    def abstract_edges(self, graph, extra_edges, node):
+        """Yield (neighbor, (cost, moves)) for the precomputed and temporary edges of a node"""
+        yield from graph.edges.get(node, {}).items()
+        yield from extra_edges.get(node, {}).items()
+
+    def refine_path(self, parents, node):
+        """Expand the abstract path into grid moves by joining the moves stored on each edge"""
+        segments = []
+        parent, moves = parents[node]
+        while parent is not None:
+            segments.append(moves)
+            parent, moves = parents[parent]
+
+        path = []
+        for moves in reversed(segments):
+            path.extend(moves)
+        return path
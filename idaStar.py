@@ -0,0 +1,96 @@
+from searchAlgorithm import SearchAlgorithm
+
+class IDAStar(SearchAlgorithm):
+    def __init__(self, grid, start, goals, walls, terrain=None, movement=None, table_size=16384):
+        """
+        Iterative deepening A*: depth-first searches bounded by an f-cost threshold, which is
+        raised to the smallest f-cost that went over it until a goal is reached.
+        - table_size: Most cells whose lowest g is remembered within an iteration (0 for none).
+          Cells beyond it are only checked against the current path, so memory stays bounded
+          but they may be searched again through other routes.
+        """
+        super().__init__(grid, start, goals, walls, terrain, movement)
+        self.table_size = max(0, table_size)
+
+    def search(self):
+        self.nodes_visited = 0
+        if not self.reachable_goals: # Start and goals lie in different connected components
+            return None, self.nodes_visited, [], self.visited_result()
+
+        all_visited = set() # Track all visited nodes across iterations
+
+        bound = self.goal_distance(self.start) # First f-cost threshold
+
+        while True:
+            result, next_bound = self.bounded_search(bound, all_visited)
+            if result:
+                found_goal, path = result
+                return found_goal, self.nodes_visited, path, self.visited_result(all_visited)
+
+            # No node was cut off by the bound, so every reachable cell has been searched
+            if next_bound == float('inf'):
+                return None, self.nodes_visited, [], self.visited_result(all_visited)
+            bound = next_bound
+
+    def bounded_search(self, bound, all_visited):
+        """
+        Iterative depth-first search that prunes nodes with f(n) = g(n) + h(n) above the bound,
+        where h is the distance to the closest goal. The current path is stored, plus the lowest
+        g of up to table_size cells so cells reached again by an equal or longer route are not
+        searched twice. Moves back onto the current path are skipped.
+        Returns: ((goal_position, path) or None, smallest f-cost that exceeded the bound)
+        """
+        next_bound = float('inf')
+        table_size = self.table_size
+        best_g = {} # Lowest g per cell in this iteration, for at most table_size cells
+        on_path = {self.start}
+        path = []
+        stack = [(self.start, 0, iter(self.directions))] # Each element: (position, g, remaining moves)
+
+        self.nodes_visited += 1
+        all_visited.add(self.start)
+        if self.start in self.goal_set:
+            return (self.start, []), next_bound
+
+        while stack:
+            current, current_g, moves = stack[-1]
+
+            for dx, dy, move in moves:
+                nx, ny = current[0] + dx, current[1] + dy
+                neighbor = (nx, ny)
+
+                if not self.can_move(current, neighbor):
+                    continue
+                if neighbor in on_path:
+                    continue # Would loop back onto the current path
+                g = current_g + self.move_length(current, neighbor) # Terrain costs are ignored
+                known = best_g.get(neighbor)
+                if known is not None and known <= g:
+                    continue
+
+                f = g + self.goal_distance(neighbor)
+                if f > bound:
+                    next_bound = min(next_bound, f) # Candidate threshold for the next iteration
+                    continue
+
+                if known is not None or len(best_g) < table_size:
+                    best_g[neighbor] = g
+                on_path.add(neighbor)
+                self.nodes_visited += 1
+                all_visited.add(neighbor)
+                path.append(move)
+
+                if neighbor in self.goal_set:
+                    return (neighbor, list(path)), next_bound
+
+                stack.append((neighbor, g, iter(self.directions)))
+                self._track(stack, all_visited, paths=(path,))
+                break
+            else:
+                # All moves from the current node are exhausted, backtrack
+                stack.pop()
+                on_path.discard(current)
+                if path:
+                    path.pop()
+
+        return None, next_bound
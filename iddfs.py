@@ -1,59 +1,79 @@
 from searchAlgorithm import SearchAlgorithm
 
 class IDDFS(SearchAlgorithm):
+    def __init__(self, grid, start, goals, walls, terrain=None, movement=None):
+        super().__init__(grid, start, goals, walls, terrain, movement)
+        self.cutoff_hit = False # True if the last depth limit cut off a cell not reached before
+
     def search(self):
-        depth = 0 
+        depth = 0
         self.nodes_visited = 0
         max_depth = self.grid[0] * self.grid[1] # Limit according to row * cols to prevent infinite loops
         all_visited = set() # Track all visited nodes across iterations
+        min_depth = {self.start: 0} # Transposition table: cell -> minimal depth it was reached at
+        if not self.reachable_goals: # Start and goals lie in different connected components
+            return None, self.nodes_visited, [], self.visited_result()
 
         while depth <= max_depth:
             # Create fresh visited set for each depth iteration
             visited = set([self.start])
             self.nodes_visited += 1
             all_visited.add(self.start)
-            
+            self.cutoff_hit = False
+
             # Call recursive depth-limited search
-            result = self.depth_limited_search(self.start, [], depth, visited, all_visited)
+            result = self.depth_limited_search(self.start, [], depth, visited, min_depth, all_visited)
             if result:
                 goal, path = result
-                return goal, self.nodes_visited, path, list(all_visited)
+                return goal, self.nodes_visited, path, self.visited_result(all_visited)
+
+            # The depth limit hid no new cells, so every reachable cell has been searched
+            if not self.cutoff_hit:
+                return None, self.nodes_visited, [], self.visited_result(all_visited)
             depth += 1
-        
+
         print(f"No path found within the maximum depth limit. (Depth = {max_depth})")
-        return None, self.nodes_visited, [], list(all_visited)
+        return None, self.nodes_visited, [], self.visited_result(all_visited)
 
-    def depth_limited_search(self, current, path_so_far, limit, visited, all_visited):
+    def depth_limited_search(self, current, path_so_far, limit, visited, min_depth, all_visited):
         """
         Recursive depth-limited search implementation.
+        Cells are only entered at the minimal depth recorded in earlier iterations, so each
+        iteration expands every cell once instead of once per path reaching it.
         Returns: (goal_position, path) or None if not found
         """
         # Check if current is a goal
-        if current in self.goals:
+        if current in self.goal_set:
             return current, path_so_far
-        
-        # Stop if depth limit reached
-        if limit <= 0:
-            return None
-        
+
+        depth = len(path_so_far) + 1 # Depth of the neighbors
+
         # Try each direction
         for dx, dy, move in self.directions:
             nx, ny = current[0] + dx, current[1] + dy
             neighbor = (nx, ny)
-            
-            # Only explore valid unvisited positions
-            if self.is_valid(neighbor) and neighbor not in visited:
+
+            # Only explore valid unvisited positions that cannot be reached at a smaller depth
+            if self.can_move(current, neighbor) and neighbor not in visited and min_depth.get(neighbor, depth) >= depth:
+                # Stop if depth limit reached, remembering whether a new cell lies beyond it
+                if limit <= 0:
+                    if neighbor not in min_depth:
+                        self.cutoff_hit = True
+                    continue
+
                 # Mark as visited immediately when discovered
                 self.nodes_visited += 1
                 visited.add(neighbor)
+                min_depth[neighbor] = depth
                 all_visited.add(neighbor)
-                
+                self._track(visited=all_visited, paths=(path_so_far,))
+
                 # Explore recursively with reduced depth limit
-                result = self.depth_limited_search(neighbor, path_so_far + [move], limit - 1, visited, all_visited)
-                
+                result = self.depth_limited_search(neighbor, path_so_far + [move], limit - 1, visited, min_depth, all_visited)
+
                 # If goal found, propagate result back up the call stack
                 if result:
                     return result
-        
+
         # No path found within this branch
-        return None
\ No newline at end of file
+        return None
@@ -0,0 +1,101 @@
+import gc
+import sys
+from itertools import islice
+
+try:
+    import resource  # Only available on Unix platforms
+except ImportError:
+    resource = None
+
+class MemoryTracker:
+    def __init__(self, sample_ratio=64, sample_size=32):
+        """
+        Track memory used by a single search run:
+        - peak traced memory (tracemalloc) during the search, not just after it returns
+        - peak resident set size of the process (when the resource module is available)
+        - sampled per-structure sizes for the frontier, visited set and stored paths, when the
+          tracker is attached to the search as its memory_tracker
+        """
+        self.sample_ratio = max(1, sample_ratio)
+        self.sample_size = max(1, sample_size) # Entries measured per structure, the rest are estimated
+        self.reset()
+
+    def reset(self):
+        """Clear all measurements from a previous run"""
+        self.samples = 0
+        self.skip = 0
+        self.baseline = 0
+        self.current = 0
+        self.peak = 0
+        self.peak_rss = None
+        self.peak_structures = {"frontier": 0, "visited": 0, "path": 0}
+
+    def start(self):
+        """Start tracing memory, measured relative to the current allocation level"""
+        self.reset()
+        import tracemalloc  # Imported on first use, it pulls in several modules
+        gc.collect()  # Run garbage collection before starting the search
+        tracemalloc.start()
+        self.baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    def stop(self):
+        """Stop tracing and record the final and peak memory usage"""
+        import tracemalloc
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.current = current - self.baseline
+        self.peak = max(0, peak - self.baseline)
+        self.peak_rss = self._peak_rss()
+
+    def sample(self, frontier=(), visited=(), path_index=-1, paths=None):
+        """
+        Record the size of the live search structures.
+        Paths are read from each frontier entry at path_index unless given explicitly.
+        Only the first sample_size entries of each structure are measured and the rest are
+        estimated from their mean size, and the next size / sample_ratio calls are skipped,
+        so a measurement costs O(sample_size) and most calls cost nothing.
+        """
+        if self.skip > 0:
+            self.skip -= 1
+            return
+        self.samples += 1
+        self.skip = (len(frontier) + len(visited)) // self.sample_ratio
+
+        frontier_bytes = sys.getsizeof(frontier) + self._entries_size(frontier, len(frontier))
+        visited_bytes = sys.getsizeof(visited) + self._entries_size(visited, len(visited))
+        if paths is None:
+            path_bytes = self._entries_size((entry[path_index] for entry in frontier), len(frontier))
+        else:
+            path_bytes = self._entries_size(paths, len(paths))
+
+        peaks = self.peak_structures
+        peaks["frontier"] = max(peaks["frontier"], frontier_bytes)
+        peaks["visited"] = max(peaks["visited"], visited_bytes)
+        peaks["path"] = max(peaks["path"], path_bytes)
+
+    def _entries_size(self, entries, count):
+        """Size of count entries, measured on the first sample_size and scaled up"""
+        sizes = [sys.getsizeof(entry) for entry in islice(entries, self.sample_size)]
+        if not sizes:
+            return 0
+        return sum(sizes) * count // len(sizes)
+
+    def _peak_rss(self):
+        """Return the peak resident set size of this process in bytes, or None if unavailable"""
+        if resource is None:
+            return None
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS reports bytes
+        return peak if sys.platform == "darwin" else peak * 1024
+
+    def report(self):
+        """Return all measurements converted to KB"""
+        report = {
+            "memory_used": self.current / 1024,
+            "peak_memory": self.peak / 1024,
+            "peak_rss": self.peak_rss / 1024 if self.peak_rss is not None else None,
+        }
+        for name, size in self.peak_structures.items():
+            report[f"peak_{name}"] = size / 1024
+        return report
@@ -0,0 +1,62 @@
+import math
+
+class Movement:
+    straight_moves = [(0, -1, "UP"), (-1, 0, "LEFT"), (0, 1, "DOWN"), (1, 0, "RIGHT")]
+    diagonal_moves = [(-1, -1, "UP-LEFT"), (1, -1, "UP-RIGHT"), (-1, 1, "DOWN-LEFT"), (1, 1, "DOWN-RIGHT")]
+    corner_rules = ("never", "single", "always")
+    diagonal_length = math.sqrt(2)
+
+    def __init__(self, connectivity=4, corner_cutting="never"):
+        """
+        Movement model shared by the search algorithms:
+        - connectivity: 4 (straight moves only) or 8 (straight and diagonal moves)
+        - corner_cutting: when a diagonal move may pass the corner of a wall
+          "never": both cells beside the move must be open
+          "single": at least one of them must be open
+          "always": the move may squeeze between two walls
+        """
+        if connectivity not in (4, 8):
+            raise ValueError(f"Invalid connectivity: {connectivity}. Choose 4 or 8.")
+        if corner_cutting not in self.corner_rules:
+            raise ValueError(f"Invalid corner cutting rule: {corner_cutting}. Choose from {list(self.corner_rules)}.")
+
+        self.connectivity = connectivity
+        self.corner_cutting = corner_cutting
+        self.diagonal = connectivity == 8
+        # Straight moves keep their UP, LEFT, DOWN, RIGHT order, diagonal moves come after them
+        self.directions = self.straight_moves + (self.diagonal_moves if self.diagonal else [])
+        self.offsets = {move: (dx, dy) for dx, dy, move in self.straight_moves + self.diagonal_moves}
+        self.names = {(dx, dy): move for move, (dx, dy) in self.offsets.items()}
+
+    @property
+    def key(self):
+        """Hashable description, used in cache keys"""
+        return (self.connectivity, self.corner_cutting)
+
+    @property
+    def squeezes(self):
+        """True when diagonal moves connect open cells that only touch at a corner between two walls"""
+        return self.diagonal and self.corner_cutting == "always"
+
+    def allows_diagonal(self, is_open, pos, neighbor):
+        """Apply the corner-cutting rule to a diagonal move between two open cells"""
+        if self.corner_cutting == "always":
+            return True
+        side_a = is_open((neighbor[0], pos[1]))
+        side_b = is_open((pos[0], neighbor[1]))
+        if self.corner_cutting == "never":
+            return side_a and side_b
+        return side_a or side_b
+
+    def length(self, pos, neighbor):
+        """Length of one move: 1 straight, sqrt(2) diagonally"""
+        if pos[0] == neighbor[0] or pos[1] == neighbor[1]:
+            return 1
+        return self.diagonal_length
+
+    def distance(self, a, b):
+        """Manhattan distance for 4-connected movement, octile distance for 8-connected movement"""
+        dx, dy = abs(a[0] - b[0]), abs(a[1] - b[1])
+        if not self.diagonal:
+            return dx + dy
+        return max(dx, dy) + (self.diagonal_length - 1) * min(dx, dy)
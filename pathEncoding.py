@@ -0,0 +1,39 @@
+class PathEncoding:
+    separator = "*"
+
+    @staticmethod
+    def encode(path):
+        """
+        Run-length encode a list of moves: repeated moves are written once with their count,
+        e.g. RIGHT RIGHT RIGHT DOWN -> "RIGHT*3 DOWN". Single moves keep their plain name.
+        """
+        runs = []
+        previous, count = None, 0
+        for move in path:
+            if move == previous:
+                count += 1
+                continue
+            if previous is not None:
+                runs.append(previous if count == 1 else f"{previous}{PathEncoding.separator}{count}")
+            previous, count = move, 1
+        if previous is not None:
+            runs.append(previous if count == 1 else f"{previous}{PathEncoding.separator}{count}")
+        return " ".join(runs)
+
+    @staticmethod
+    def decode(encoded):
+        """
+        Expand an encoded path (a string, or a list of runs) back into the list of moves.
+        Plain moves pass through unchanged, so a list of moves decodes to itself.
+        """
+        runs = encoded.split() if isinstance(encoded, str) else encoded
+        path = []
+        for run in runs:
+            move, separator, count = run.partition(PathEncoding.separator)
+            if not separator:
+                path.append(run)
+                continue
+            if not count.isdigit() or int(count) < 1:
+                raise ValueError(f"Invalid path run: {run} (needs MOVE*count with a count of at least 1)")
+            path.extend([move] * int(count))
+        return path
@@ -0,0 +1,81 @@
+import math
+from movement import Movement
+
+class PathSmoother:
+    def __init__(self, index):
+        """
+        Any-angle smoothing of grid paths by line-of-sight pruning: path cells are dropped
+        while a straight line from the last kept cell still only crosses open cells.
+        - index: GridIndex of the map, used for its occupancy bitmap
+        Lines may not pass exactly through a corner between two cells unless both cells beside
+        the corner are open, so a smoothed path never grazes a wall corner. Terrain costs are
+        ignored: the waypoints are shorter in distance, not necessarily cheaper.
+        """
+        self.index = index
+        self.offsets = Movement().offsets
+
+    def coordinates(self, start, path):
+        """Cells visited by a list of moves, starting with the start"""
+        x, y = start
+        cells = [(x, y)]
+        for move in path:
+            dx, dy = self.offsets[move]
+            x, y = x + dx, y + dy
+            cells.append((x, y))
+        return cells
+
+    def smooth(self, start, path):
+        """
+        Waypoints of the smoothed path: the start, the cells where the path has to turn and
+        the goal. Consecutive waypoints either see each other or are one move of the path apart.
+        """
+        cells = self.coordinates(start, path)
+        waypoints = [cells[0]]
+        anchor = 0
+        for i in range(2, len(cells)):
+            if not self.line_of_sight(cells[anchor], cells[i]):
+                anchor = i - 1
+                waypoints.append(cells[anchor])
+        if len(cells) > 1:
+            waypoints.append(cells[-1])
+        return waypoints
+
+    def line_of_sight(self, a, b):
+        """
+        True if the segment between the centres of cells a and b only crosses open cells.
+        Walks every cell the segment passes through with integer steps (no rounding).
+        """
+        is_open = self.index.is_open
+        x, y = a
+        dx, dy = abs(b[0] - x), abs(b[1] - y)
+        step_x = 1 if b[0] > x else -1
+        step_y = 1 if b[1] > y else -1
+        error = dx - dy # Which cell border the segment crosses next, scaled by 2 * dx * dy
+        remaining = dx + dy
+        if not is_open((x, y)):
+            return False
+        while remaining > 0:
+            if error > 0:
+                x += step_x
+                error -= 2 * dy
+                remaining -= 1
+            elif error < 0:
+                y += step_y
+                error += 2 * dx
+                remaining -= 1
+            else:
+                # Exactly through a corner: both cells beside it must be open
+                if not is_open((x + step_x, y)) or not is_open((x, y + step_y)):
+                    return False
+                x += step_x
+                y += step_y
+                error += 2 * (dx - dy)
+                remaining -= 2
+            if not is_open((x, y)):
+                return False
+        return True
+
+    @staticmethod
+    def length(waypoints):
+        """Euclidean length of a list of waypoints"""
+        return sum(math.dist(a, b) for a, b in zip(waypoints, waypoints[1:]))
@@ -0,0 +1,151 @@
+import heapq
+from collections import deque
+
+class BinaryHeapQueue:
+    def __init__(self):
+        """Priority queue backed by a binary heap, works with any comparable priorities"""
+        self.heap = []
+
+    def push(self, entry):
+        """Add an entry, ordered by the whole tuple (priority first)"""
+        heapq.heappush(self.heap, entry)
+
+    def pop(self):
+        """Remove and return the entry with the lowest priority"""
+        return heapq.heappop(self.heap)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __iter__(self):
+        return iter(self.heap)
+
+class IndexedHeapQueue:
+    def __init__(self):
+        """
+        Binary heap with decrease-key. Entries are keyed by their position, the second to last
+        element of every frontier entry (position, path_so_far), and each position is queued at
+        most once: pushing a queued position replaces its entry only if the new one sorts first.
+        The heap therefore never holds more entries than there are open cells.
+        """
+        self.heap = []
+        self.index = {} # Position -> index of its entry in the heap
+
+    def push(self, entry):
+        """Add an entry, or lower the priority of the entry already queued for its position"""
+        i = self.index.get(entry[-2])
+        if i is None:
+            self.heap.append(entry)
+            i = len(self.heap) - 1
+        elif entry < self.heap[i]:
+            self.heap[i] = entry
+        else:
+            return # The queued entry is at least as good
+        self._sift_up(i)
+
+    def pop(self):
+        """Remove and return the entry with the lowest priority"""
+        heap = self.heap
+        last = heap.pop()
+        if not heap:
+            del self.index[last[-2]]
+            return last
+        top = heap[0]
+        heap[0] = last
+        self.index[last[-2]] = 0
+        del self.index[top[-2]]
+        self._sift_down(0)
+        return top
+
+    def _sift_up(self, i):
+        """Move the entry at i towards the root until its parent sorts first"""
+        heap, index = self.heap, self.index
+        entry = heap[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if not entry < heap[parent]:
+                break
+            heap[i] = heap[parent]
+            index[heap[i][-2]] = i
+            i = parent
+        heap[i] = entry
+        index[entry[-2]] = i
+
+    def _sift_down(self, i):
+        """Move the entry at i towards the leaves until both children sort after it"""
+        heap, index = self.heap, self.index
+        size = len(heap)
+        entry = heap[i]
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            if not heap[child] < entry:
+                break
+            heap[i] = heap[child]
+            index[heap[i][-2]] = i
+            i = child
+        heap[i] = entry
+        index[entry[-2]] = i
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __iter__(self):
+        return iter(self.heap)
+
+class BucketQueue:
+    def __init__(self):
+        """
+        Bucket queue (Dial's algorithm) for small non-negative integer priorities.
+        Entries are stored in one bucket per priority value, so push and pop are O(1)
+        when priorities never drop below the last popped one (Dijkstra, A* with a consistent
+        heuristic). Lower priorities are still handled by moving the cursor back.
+        Entries with equal priority come out in insertion order, so ties are broken
+        deterministically without comparing positions or path lists.
+        """
+        self.buckets = []
+        self.cursor = 0 # Lowest bucket that may be non-empty
+        self.size = 0
+
+    def push(self, entry):
+        """Add an entry to the bucket of its integer priority (entry[0])"""
+        priority = entry[0]
+        if not isinstance(priority, int) or priority < 0:
+            raise ValueError(f"Bucket queue needs non-negative integer priorities, got {priority}")
+        while len(self.buckets) <= priority:
+            self.buckets.append(deque())
+        self.buckets[priority].append(entry)
+        self.cursor = min(self.cursor, priority)
+        self.size += 1
+
+    def pop(self):
+        """Remove and return an entry with the lowest priority (first in, first out)"""
+        if not self.size:
+            raise IndexError("pop from an empty bucket queue")
+        while not self.buckets[self.cursor]:
+            self.cursor += 1
+        self.size -= 1
+        return self.buckets[self.cursor].popleft()
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        for bucket in self.buckets:
+            yield from bucket
+
+# Frontier implementations selectable by name
+PRIORITY_QUEUES = {
+    "heap": BinaryHeapQueue,
+    "indexed": IndexedHeapQueue,
+    "bucket": BucketQueue
+}
+
+def make_queue(name="heap"):
+    """Create a priority queue by name"""
+    if name not in PRIORITY_QUEUES:
+        raise ValueError(f"Unknown priority queue: {name}. Choose from {list(PRIORITY_QUEUES.keys())}.")
+    return PRIORITY_QUEUES[name]()
@@ -0,0 +1,61 @@
+import csv
+import os
+
+class ResultFile:
+    def __init__(self, filename, sheet_title="Search Results"):
+        """
+        Results file written one row at a time:
+        - .csv files are plain CSV, written with the csv module (no extra libraries needed)
+        - anything else is an Excel workbook in openpyxl's write-only mode, which streams rows
+          to disk instead of holding every cell in memory
+        """
+        self.filename = filename
+        self.sheet_title = sheet_title
+        self.is_csv = os.path.splitext(filename)[1].lower() == ".csv"
+        self._file = None
+        self._writer = None
+        self._workbook = None
+        self._sheet = None
+
+    def open(self, header):
+        """Start a new file with a header row"""
+        if self.is_csv:
+            self._file = open(self.filename, "w", newline="", encoding="utf-8")
+            self._writer = csv.writer(self._file)
+        else:
+            from openpyxl import Workbook  # Only needed for Excel output
+            self._workbook = Workbook(write_only=True)
+            self._sheet = self._workbook.create_sheet(self.sheet_title)
+        self.append(header)
+
+    def append(self, row):
+        """Write one row"""
+        if self.is_csv:
+            self._writer.writerow(row)
+        else:
+            self._sheet.append(row)
+
+    def close(self):
+        """Finish the file (a write-only workbook is only saved here)"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._workbook is not None:
+            self._workbook.save(self.filename)
+            self._workbook = None
+
+    def rows(self):
+        """Yield the data rows of an existing file, header skipped, one at a time"""
+        if self.is_csv:
+            with open(self.filename, newline="", encoding="utf-8") as file:
+                reader = csv.reader(file)
+                next(reader, None)
+                yield from reader
+        else:
+            import openpyxl
+            workbook = openpyxl.load_workbook(self.filename, read_only=True)
+            try:
+                sheet = workbook[self.sheet_title]
+                yield from sheet.iter_rows(min_row=2, values_only=True)
+            finally:
+                workbook.close()
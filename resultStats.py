@@ -0,0 +1,164 @@
+from algorithmRanking import AlgorithmRanking
+
+class ResultStats:
+    columns = ["Input File", "Test Type", "Algorithm", "Goal Reached", "Nodes Visited",
+               "Path Length", "Execution Time", "Beam Width", "Memory Used (KB)", "Peak Memory (KB)"]
+    bounded_algorithms = ("ASTAR", "IDASTAR", "SMASTAR") # Compared in the memory-bounded search section
+
+    def __init__(self):
+        """
+        Running totals for the test suite report, updated one result row at a time so a
+        run over thousands of maps never keeps its rows in memory:
+        - by_type: test type -> algorithm -> totals over successful runs
+        - bounded: totals for A*, IDA* and SMA* including peak memory
+        - beam: beam width -> totals for beam search
+        - ranking: per-test ratios between algorithms (rows of one test file are held until
+          the next file starts, so rows must arrive grouped by file; call finish() at the end)
+        """
+        self.rows = 0
+        self.by_type = {}
+        self.bounded = {algo: {"runs": 0, "successes": 0, "total_nodes": 0, "total_peak_memory": 0.0}
+                        for algo in self.bounded_algorithms}
+        self.beam = {}
+        self.ranking = AlgorithmRanking()
+        self._test_file = None
+        self._test_type = None
+        self._test_runs = []
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Aggregate rows read back from a results file"""
+        stats = cls()
+        for row in rows:
+            stats.add(row)
+        stats.finish()
+        return stats
+
+    @staticmethod
+    def empty_totals():
+        """Totals of an algorithm that has not been run"""
+        return {"runs": 0, "successes": 0, "total_time": 0.0, "total_nodes": 0, "total_path_length": 0, "total_memory": 0.0}
+
+    def totals(self, test_type, algo):
+        """Totals of one algorithm on one test type (zero if it has no results)"""
+        return self.by_type.get(test_type, {}).get(algo, self.empty_totals())
+
+    def overall(self, algo):
+        """Totals of one algorithm across all test types"""
+        overall = self.empty_totals()
+        for algorithms in self.by_type.values():
+            for key, value in algorithms.get(algo, {}).items():
+                overall[key] += value
+        return overall
+
+    def add(self, row):
+        """Add one result row, laid out as in columns"""
+        self.rows += 1
+        test_type, algo, goal_reached = row[1], row[2], row[3] == "Yes"
+        self._add_run(row)
+
+        try:
+            nodes = self._parse_count(row[4])
+            path_length = self._parse_count(row[5])
+            time_val = self._parse_time(row[6])
+            memory_val = self._parse_memory(row[8])
+
+            # Rows that cannot be parsed (timeouts, errors) are left out of the per-type totals
+            totals = self.by_type.setdefault(test_type, {}).setdefault(algo, self.empty_totals())
+            totals["runs"] += 1
+            if goal_reached:
+                totals["successes"] += 1
+                totals["total_time"] += time_val
+                totals["total_nodes"] += nodes
+                totals["total_path_length"] += path_length
+                totals["total_memory"] += memory_val
+        except Exception:
+            pass # Skip problematic data
+
+        if algo in self.bounded:
+            bounded = self.bounded[algo]
+            bounded["runs"] += 1
+            if goal_reached:
+                try:
+                    nodes = self._parse_count(row[4])
+                    peak_val = self._parse_memory(row[9] if len(row) > 9 else None)
+                    bounded["successes"] += 1
+                    bounded["total_nodes"] += nodes
+                    bounded["total_peak_memory"] += peak_val
+                except Exception:
+                    pass
+
+        if algo == "BEAM":
+            width = int(row[7]) if str(row[7]).isdigit() else row[7] # CSV files hold the width as text
+            beam = self.beam.setdefault(width, {"runs": 0, "successes": 0, "total_time": 0, "total_nodes": 0,
+                                                "total_path": 0, "total_memory": 0})
+            beam["runs"] += 1
+            if goal_reached:
+                beam["successes"] += 1
+                try:
+                    nodes = self._parse_count(row[4])
+                    path_length = self._parse_count(row[5])
+                    time_val = self._parse_time(row[6])
+                    memory_val = self._parse_memory(row[8])
+                    beam["total_time"] += time_val
+                    beam["total_nodes"] += nodes
+                    beam["total_path"] += path_length
+                    beam["total_memory"] += memory_val
+                except Exception:
+                    pass
+
+    def _add_run(self, row):
+        """Hold a row for the ranking until its test file is complete"""
+        if row[0] != self._test_file:
+            self.finish()
+            self._test_file, self._test_type = row[0], row[1]
+
+        algo = row[2] if row[2] != "BEAM" else f"BEAM-{row[7]}" # Each beam width is ranked on its own
+        run = {"algorithm": algo, "goal_reached": row[3] == "Yes", "path_length": 0, "time": None, "nodes": None, "memory": None}
+        if row[3] in ("Yes", "No"): # Timeouts and errors stay unsolved
+            try:
+                run["path_length"] = self._parse_count(row[5])
+                run["nodes"] = self._parse_count(row[4])
+                run["memory"] = self._parse_memory(row[9] if len(row) > 9 else None)
+                run["time"] = self._parse_time(row[6])
+            except Exception:
+                run["time"] = None
+        self._test_runs.append(run)
+
+    def finish(self):
+        """Pass the held rows of the last test file on to the ranking"""
+        if self._test_runs:
+            self.ranking.add_test(self._test_runs, self._test_type)
+        self._test_runs = []
+
+    def _parse_count(self, value):
+        """Nodes visited or path length ("N/A" counts as 0)"""
+        return int(value) if value not in ["N/A", None, ""] else 0
+
+    def _parse_time(self, value):
+        """Execution time such as "1.234ms" or "30s+", in ms"""
+        if value and isinstance(value, str):
+            if "ms" in value:
+                return float(value.replace("ms", ""))
+            elif "s" in value:
+                return float(value.replace("s", "")) * 1000.0
+        return 0.0
+
+    def _parse_memory(self, value):
+        """Memory such as "12.50 KB", in KB"""
+        if value and isinstance(value, str) and "KB" in value:
+            return float(value.split()[0])
+        return 0.0
+
+    def print_summary(self, algorithms):
+        """Print the overall averages per algorithm, for runs without a Word report"""
+        print(f"\n{'Algorithm':<12}{'Runs':>6}{'Success':>10}{'Avg Time (ms)':>16}{'Avg Nodes':>12}{'Avg Path':>10}{'Avg Memory (KB)':>18}")
+        for algo in sorted(a.upper() for a in algorithms):
+            stats = self.overall(algo)
+            successes = stats["successes"]
+            success_rate = f"{stats['successes'] / stats['runs'] * 100:.1f}%" if stats["runs"] > 0 else "N/A"
+            avg_time = f"{stats['total_time'] / successes:.2f}" if successes > 0 else "N/A"
+            avg_nodes = f"{stats['total_nodes'] / successes:.1f}" if successes > 0 else "N/A"
+            avg_path = f"{stats['total_path_length'] / successes:.1f}" if successes > 0 else "N/A"
+            avg_memory = f"{stats['total_memory'] / successes:.2f}" if successes > 0 else "N/A"
+            print(f"{algo:<12}{stats['runs']:>6}{success_rate:>10}{avg_time:>16}{avg_nodes:>12}{avg_path:>10}{avg_memory:>18}")
@@ -1,35 +1,82 @@
+import importlib
 import sys
 import time
-import tracemalloc
-import gc
 from fileReader import FileReader
+from memoryTracker import MemoryTracker
+from movement import Movement
 from grid import Grid
-from dfs import DFS
-from bfs import BFS
-from gbfs import GBFS
-from aStar import AStar
-from iddfs import IDDFS
-from beam import Beam
+from pathEncoding import PathEncoding
+from pathSmoother import PathSmoother
+
+# Search methods by command line name: (module, class), imported only once the method is chosen
+search_algorithms = {
+    "dfs": ("dfs", "DFS"),
+    "bfs": ("bfs", "BFS"),
+    "gbfs": ("gbfs", "GBFS"),
+    "astar": ("aStar", "AStar"),
+    "iddfs" : ("iddfs", "IDDFS"),
+    "beam" : ("beam", "Beam"),
+    "idastar" : ("idaStar", "IDAStar"),
+    "smastar" : ("smaStar", "SMAStar"),
+    "dijkstra" : ("dijkstra", "Dijkstra"),
+    "hpastar" : ("hpaStar", "HPAStar"),
+    "dstarlite" : ("dStarLite", "DStarLite"),
+    "arastar" : ("araStar", "ARAStar"),
+    "tour" : ("tourPlanner", "TourPlanner")
+}
+
+def load_algorithm(method):
+    """Import the module of a search method and return its class"""
+    module_name, class_name = search_algorithms[method]
+    return getattr(importlib.import_module(module_name), class_name)
 
 def main():
     try:
+        # Split --name=value options from the positional arguments
+        args = [arg for arg in sys.argv if not arg.startswith("--")]
+        options = dict(arg[2:].split("=", 1) for arg in sys.argv if arg.startswith("--") and "=" in arg)
+
         # Check arguments - update usage message
-        if len(sys.argv) < 3 or len(sys.argv) > 4:
-            print("\nUsage: python search.py <filename> <method> [beam width]")
-            print("Methods: dfs, bfs, gbfs, astar, iddfs, beam")
+        if len(args) < 3 or len(args) > 4:
+            print("\nUsage: python search.py <filename> <method> [beam width(s) | node budget | cluster size | time budget] [--option=value ...]")
+            print("Methods: dfs, bfs, gbfs, astar, iddfs, beam, idastar, smastar, dijkstra, hpastar, dstarlite, arastar, tour")
             print ("Example: python search.py input.txt astar\n")
             print("To test program: python testSuites.py\n")
             print("Note: beam width is only required when using method beam search method, 'beam'")
+            print("      a comma-separated list of widths (e.g. 1,3,5,7) runs a beam width sweep")
+            print("Note: node budget is only used by the memory-bounded A* method, 'smastar'")
+            print("Note: cluster size is only used by the hierarchical A* method, 'hpastar'")
+            print("Note: time budget (ms) is only used by the anytime A* method, 'arastar', which returns its best path when it runs out")
+            print("Note: 'tour' visits every goal instead of stopping at the first one reached")
+            print("Options: --queue=heap|indexed|bucket  priority queue used by astar, gbfs and dijkstra (bucket needs integer costs)")
+            print("         --cache=<directory>  where hpastar saves and reloads its precomputed cluster graphs")
+            print("         --add=x,y,w,h;...  --remove=x,y,w,h;...  wall changes dstarlite repairs its plan for")
+            print("         --movement=4|8  straight moves only, or diagonal moves as well (default 4)")
+            print("         --corners=never|single|always  when diagonal moves may cut a wall corner (default never)")
+            print("         --weight=W  heuristic weight of astar (default 1, paths cost at most W times the optimum) or starting weight of arastar (default 3)")
+            print("         --tie-break=shallow|deep|position  order of astar nodes with equal f (default shallow)")
+            print("         --step=0.5  --nodes=N  weight decrease and node budget of arastar")
+            print("         --memory=on|off  measure memory during the search (default on, off starts and runs faster)")
+            print("         --path=moves|rle  print every move, or runs of repeated moves such as RIGHT*12 (default moves)")
+            print("         --smooth=on|off  also print any-angle waypoints, keeping only the cells where the path turns (default off)")
+            print("         --visited=on|off  return and draw the visited cells (default on, off skips building them)")
             sys.exit(1)
 
-        filename = sys.argv[1]
-        method = sys.argv[2].lower()
+        filename = args[1]
+        method = args[2].lower()
 
         beam_width = 3 # Default beam width
+        beam_widths = None # Several widths run as one sweep on the same parsed map
         if method == "beam":
-            if len(sys.argv) == 4:
+            if len(args) == 4 and "," in args[3]:
+                try:
+                    beam_widths = [int(width) for width in args[3].split(",") if width.strip()]
+                    beam_width = beam_widths[0]
+                except ValueError:
+                    print("Invalid beam width list, using default (3)")
+            elif len(args) == 4:
                 try:
-                    beam_width = int(sys.argv[3])
+                    beam_width = int(args[3])
                     if beam_width < 1:
                         print("Beam width must be at least 1, using default (3)")
                 except ValueError:
@@ -37,6 +84,34 @@ def main():
             else:
                 print("Beam width not provided, using default (3)")
 
+        node_budget = 1000 # Default number of nodes SMA* may hold in memory
+        if method == "smastar":
+            if len(args) == 4:
+                try:
+                    node_budget = int(args[3])
+                    if node_budget < 2:
+                        print("Node budget must be at least 2, using 2")
+                except ValueError:
+                    print("Invalid node budget value, using default (1000)")
+            else:
+                print("Node budget not provided, using default (1000)")
+
+        cluster_size = 10 # Default width and height of an HPA* cluster
+        if method == "hpastar" and len(args) == 4:
+            try:
+                cluster_size = int(args[3])
+                if cluster_size < 2:
+                    print("Cluster size must be at least 2, using 2")
+            except ValueError:
+                print("Invalid cluster size value, using default (10)")
+
+        time_budget = None # Milliseconds ARA* may search before returning its best path
+        if method == "arastar" and len(args) == 4:
+            try:
+                time_budget = float(args[3])
+            except ValueError:
+                print("Invalid time budget value, searching until the path is optimal")
+
         # Parse the input file
         file_reader = FileReader()
         data = file_reader.parse_input_file(filename)
@@ -46,40 +121,49 @@ def main():
         print("\n--- Initial Grid Map ---")
         grid.visualize_map()
         
-        search_algorithms = {
-            "dfs": DFS,
-            "bfs": BFS,
-            "gbfs": GBFS,
-            "astar": AStar,
-            "iddfs" : IDDFS,
-            "beam" : Beam
-        }
-
         if method not in search_algorithms:
             print(f"Invalid search method: {method}. Choose from {list(search_algorithms.keys())}.")
             sys.exit(1)
 
-        # Initialize & run the search algorithms
-        algo_class = search_algorithms[method]
+        # Extra constructor arguments for the chosen method
+        movement = Movement(int(options.get("movement", 4)), options.get("corners", "never"))
+        algo_options = {"terrain": data["terrain"], "movement": movement}
         if method == "beam":
+            algo_options["beam_width"] = beam_width
+        elif method == "smastar":
+            algo_options["max_nodes"] = node_budget
+        elif method == "hpastar":
+            algo_options["cluster_size"] = cluster_size
+            algo_options["cache_dir"] = options.get("cache")
+        elif method == "arastar":
+            algo_options["weight"] = float(options.get("weight", 3.0))
+            algo_options["weight_step"] = float(options.get("step", 0.5))
+            algo_options["time_limit"] = time_budget / 1000 if time_budget is not None else None
+            algo_options["node_limit"] = int(options["nodes"]) if "nodes" in options else None
+        if method in ("astar", "gbfs", "dijkstra"):
+            algo_options["queue"] = options.get("queue", "heap")
+        if method == "astar":
+            algo_options["weight"] = float(options.get("weight", 1))
+            algo_options["tie_break"] = options.get("tie-break", "shallow")
+
+        # Initialize & run the search algorithms
+        algo_class = load_algorithm(method)
+        def create_algorithm():
             algo = algo_class(
                 grid = data["grid_size"],
                 start = data["initial_position"],
                 goals = data["goal_states"],
                 walls = data["walls"],
-                beam_width = beam_width
-            )
-        else:
-            algo = algo_class(
-                grid = data["grid_size"],
-                start = data["initial_position"],
-                goals = data["goal_states"],
-                walls = data["walls"]
+                **algo_options
             )
+            algo.return_visited = options.get("visited", "on") != "off"
+            return algo
+        algo = create_algorithm()
         
-        gc.collect()  # Run garbage collection before starting the search
-        tracemalloc.start()  # Start memory tracking
-        baseline = tracemalloc.get_traced_memory()[0]  # Get memory usage
+        if beam_widths:
+            run_beam_sweep(algo, filename, beam_widths)
+            return
+
         start_time = time.perf_counter()  # Start time tracking
 
         goal, nodes_visited, path, visited_grid = algo.search() # Run the search algorithm
@@ -87,9 +171,16 @@ def main():
         end_time = time.perf_counter()  # End time tracking
         execution_time = (end_time - start_time) * 1000 # Calculate execution time
 
-        current = tracemalloc.get_traced_memory()[0]  # Get memory usage
-        tracemalloc.stop()  # Stop memory tracking
-        memory_used = (current - baseline) / 1024  # Convert to KB
+        tracker = None
+        if options.get("memory", "on") != "off": # --memory=off skips the second, traced run
+            # Memory is measured on a second run, so tracemalloc and sampling stay out of the timed one
+            tracker = MemoryTracker()
+            measured = create_algorithm()
+            measured.memory_tracker = tracker  # Sample frontier, visited and path sizes during the search
+            tracker.start()  # Start memory tracking
+            measured.search()
+            tracker.stop()  # Stop memory tracking
+            memory = tracker.report()  # All values in KB
         
         # Display results
         print(f"\n--- Search Results ({method.upper()}) ---")
@@ -97,21 +188,143 @@ def main():
         print(f"Algorithm: {method.upper()}")
         print(f"Nodes visited: {nodes_visited}")
         print(f"Execution time: {execution_time:.4f} ms")
-        print(f"Memory used: {memory_used:.4f} KB")
+        if tracker:
+            print(f"Memory used: {memory['memory_used']:.4f} KB")
+            print(f"Peak memory: {memory['peak_memory']:.4f} KB")
+            if memory["peak_rss"] is not None:
+                print(f"Peak RSS: {memory['peak_rss']:.4f} KB")
+            print(f"Peak frontier: {memory['peak_frontier']:.4f} KB")
+            print(f"Peak visited: {memory['peak_visited']:.4f} KB")
+            print(f"Peak path storage: {memory['peak_path']:.4f} KB")
+        if method == "smastar":
+            print(f"Peak nodes in memory: {algo.peak_nodes} (budget {algo.max_nodes}, pruned {algo.nodes_pruned})")
+        if method in ("astar", "dijkstra"):
+            print(f"Peak open list entries: {algo.peak_frontier} (duplicate pops {algo.duplicate_pops})")
+        if method == "hpastar" and algo.abstract_graph is not None:
+            graph = algo.abstract_graph
+            print(f"Abstract graph: {len(graph.edges)} nodes, {graph.edge_count()} edges (cluster size {graph.cluster_size})")
+        if method == "arastar":
+            print_anytime_trajectory(algo)
+        if method == "tour":
+            print_tour(algo)
         
         if goal:
             print(f"Goal reached: {goal}")
-            print(f"Path: {' '.join(path)}")
+            print_path(path, options.get("path", "moves"))
+            if data["terrain"] or movement.diagonal:
+                print(f"Path cost: {round(algo.path_cost(path), 4)}")
+            if options.get("smooth", "off") == "on":
+                print_smoothed_path(algo, path)
             
             # Visualize the solution path on the grid
             print("\n--- Solution Path ---")
             grid.visualize_solution(path, visited_grid)
+        elif method == "arastar" and algo.budget_exhausted:
+            print("No path found within the budget")
+            grid.visualize_solution([], visited_grid)
         else:
             print("No goal is reachable")
             grid.visualize_solution([], visited_grid)
 
+        # Wall changes given on the command line are repaired incrementally
+        if method == "dstarlite" and ("add" in options or "remove" in options):
+            run_wall_update(algo, grid, parse_walls(options.get("add", "")), parse_walls(options.get("remove", "")))
+
     except Exception as e:
         print(f"Error: {e}")
 
+def run_beam_sweep(algo, filename, beam_widths):
+    """Run beam search for several widths on one map and print the width/quality/time tradeoff"""
+    results = algo.sweep(beam_widths, MemoryTracker())
+
+    print(f"\n--- Beam Width Sweep ---")
+    print(f"File: {filename}")
+    for result in results:
+        path_ratio = f"{result['path_ratio']:.2f}" if result["path_ratio"] is not None else "N/A"
+        goal = result["goal"] if result["goal"] else "None"
+        print(f"Beam width {result['beam_width']} - Nodes visited: {result['nodes_visited']}"
+              f" | Execution time: {result['execution_time']:.4f} ms"
+              f" | Memory used: {result['memory_used']:.4f} KB"
+              f" | Peak memory: {result['peak_memory']:.4f} KB"
+              f" | Path length: {len(result['path'])}"
+              f" | Path ratio: {path_ratio}"
+              f" | Goal reached: {goal}")
+
+def print_path(path, path_format):
+    """Print the moves of a path, or their run-length encoding with --path=rle"""
+    if path_format == "rle":
+        print(f"Path: {PathEncoding.encode(path)} ({len(path)} moves)")
+    else:
+        print(f"Path: {' '.join(path)}")
+
+def print_smoothed_path(algo, path):
+    """Print the any-angle waypoints of a path and how much shorter they are"""
+    smoother = PathSmoother(algo.index)
+    waypoints = smoother.smooth(algo.start, path)
+    cells = smoother.coordinates(algo.start, path)
+    grid_length = sum(algo.move_length(a, b) for a, b in zip(cells, cells[1:]))
+    print(f"Smoothed path: {' '.join(f'({x},{y})' for x, y in waypoints)}")
+    print(f"Waypoints: {len(waypoints)} | Length: {round(smoother.length(waypoints), 4)} (grid path {round(grid_length, 4)})")
+
+def print_anytime_trajectory(algo):
+    """Print each path ARA* found with its cost, suboptimality bound, nodes and time"""
+    bound = f"{algo.bound:.3f}" if algo.bound is not None else "unknown"
+    stopped = "budget ran out" if algo.budget_exhausted else "search finished"
+    print(f"Suboptimality bound: {bound} ({stopped})")
+    for entry in algo.trajectory:
+        entry_bound = f"{entry['bound']:.3f}" if entry["bound"] is not None else "unknown"
+        print(f"Weight {entry['weight']:.2f} - Path cost: {round(entry['cost'], 4)}"
+              f" | Path length: {entry['path_length']}"
+              f" | Bound: {entry_bound}"
+              f" | Nodes visited: {entry['nodes']}"
+              f" | Time: {entry['time']:.4f} ms")
+
+def print_tour(algo):
+    """Print the order a tour visits the goals in, its cost and where the time went"""
+    if not algo.order:
+        return
+    order = "exact" if algo.exact else "nearest neighbour + 2-opt"
+    print(f"Tour: {len(algo.order)} goals, cost {round(algo.tour_cost, 4)} ({order} order)")
+    print(f"Visiting order: {' -> '.join(str(goal) for goal in algo.order)}")
+    print(f"Distances: {algo.timings['distances']:.4f} ms | Ordering: {algo.timings['ordering']:.4f} ms"
+          f" | Leg paths: {algo.timings['paths']:.4f} ms")
+    if algo.skipped_goals:
+        print(f"Unreachable goals skipped: {' '.join(str(goal) for goal in algo.skipped_goals)}")
+
+def parse_walls(text):
+    """Parse semicolon-separated x,y,w,h wall rectangles"""
+    walls = []
+    for part in text.split(";"):
+        if not part.strip():
+            continue
+        values = [int(value) for value in part.split(",")]
+        if len(values) != 4:
+            raise ValueError(f"Invalid wall: {part} (needs x,y,w,h)")
+        walls.append(tuple(values))
+    return walls
+
+def run_wall_update(algo, grid, added, removed):
+    """Apply wall changes to the grid, repair the incremental plan and print the result"""
+    blocked, opened = grid.apply_wall_diff(added, removed)
+
+    start_time = time.perf_counter()
+    goal, nodes_visited, path, visited_grid = algo.update_walls(blocked, opened)
+    execution_time = (time.perf_counter() - start_time) * 1000
+
+    print(f"\n--- Replanned After Wall Changes ---")
+    print(f"Walls added: {len(added)} | Walls removed: {len(removed)}")
+    print(f"Cells blocked: {len(blocked)} | Cells opened: {len(opened)}")
+    print(f"Nodes visited: {nodes_visited}")
+    print(f"Execution time: {execution_time:.4f} ms")
+    if goal:
+        print(f"Goal reached: {goal}")
+        print(f"Path: {' '.join(path)}")
+        if grid.cost_cells or algo.diagonal:
+            print(f"Path cost: {round(algo.path_cost(path), 4)}")
+        grid.visualize_solution(path, visited_grid)
+    else:
+        print("No goal is reachable")
+        grid.visualize_solution([], visited_grid)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,51 +1,109 @@
 from abc import ABC, abstractmethod
+from goalIndex import GoalIndex
+from gridIndex import GridIndex
+from movement import Movement
+from visitedCells import VisitedCells
 
 class SearchAlgorithm(ABC):
-    def __init__(self, grid, start, goals, walls):
-        """Initialize the search algorithm with grid, start position, goals, and walls."""
+    def __init__(self, grid, start, goals, walls, terrain=None, movement=None):
+        """Initialize the search algorithm with grid, start position, goals, walls, optional terrain costs and movement model."""
         self.grid = grid
         self.start = start
         self.goals = goals
+        self.goal_set = frozenset(goals) # Goal tests hash the position instead of scanning the list
         self.walls = walls
+        self.terrain = terrain or [] # (x, y, width, height, cost) regions, other cells cost 1
         self.nodes_visited = 0
-        self.directions = [(0, -1, "UP"), (-1, 0, "LEFT"), (0, 1, "DOWN"), (1, 0, "RIGHT")]
+        self.movement = movement or Movement() # 4-connected unless told otherwise
+        self.directions = self.movement.directions
+        self.diagonal = self.movement.diagonal
+        self.memory_tracker = None # Optional MemoryTracker sampling the search structures
+        self.return_visited = True # False skips the visited cells of the result (None instead), e.g. for a server
+        self.index = GridIndex.get(grid, walls, self.terrain) # Cached occupancy bitmap, costs and components
+        self.blocked = self.index.blocked # Shared with every search on this map, never modified
+
+        # Goals in another connected component than the start can never be reached
+        squeezes = self.movement.squeezes # Diagonal squeezes between walls join more cells
+        start_component = self.index.component(start, squeezes)
+        if start_component == -1:
+            self.reachable_goals = list(goals) # Start on a wall or outside the grid, nothing to compare
+        else:
+            self.reachable_goals = [goal for goal in goals if self.index.component(goal, squeezes) == start_component]
+        self._goal_index = None
+
+    def _track(self, frontier=(), visited=(), path_index=-1, paths=None):
+        """Report the live frontier, visited set and paths to the memory tracker, if one is attached"""
+        if self.memory_tracker is not None:
+            self.memory_tracker.sample(frontier, visited, path_index, paths)
+
+    def visited_result(self, visited=()):
+        """Visited cells for a search result: a compact VisitedCells bitmap, or None if return_visited is off"""
+        if not self.return_visited:
+            return None
+        return VisitedCells(self.grid, visited)
 
     def is_valid(self, pos):
         """Check if a position is valid (within grid bounds and not a wall)"""
         x, y = pos
         rows, cols = self.grid
-        if not (0 <= x < cols and 0 <= y < rows):
-            return False
-        for wx, wy, w, h in self.walls:
-            if wx <= x < wx + w and wy <= y < wy + h:
-                return False
-        return True
+        return 0 <= x < cols and 0 <= y < rows and not self.blocked[y * cols + x]
     
+    def can_move(self, pos, neighbor):
+        """Check if a single move onto a neighbouring cell is allowed (bounds, walls and corner cutting)"""
+        x, y = neighbor
+        rows, cols = self.grid
+        if not (0 <= x < cols and 0 <= y < rows) or self.blocked[y * cols + x]:
+            return False
+        if pos[0] == x or pos[1] == y:
+            return True # Straight move
+        return self.movement.allows_diagonal(self.is_valid, pos, neighbor)
+
+    def step_cost(self, pos):
+        """Cost of moving onto a position (1 on plain cells)"""
+        return self.index.cost(pos)
+
+    def move_length(self, pos, neighbor):
+        """Length of a move, ignoring terrain: 1 straight, sqrt(2) diagonally"""
+        return self.movement.length(pos, neighbor)
+
+    def move_cost(self, pos, neighbor):
+        """Cost of a move: the terrain cost of the cell entered, scaled by the move length"""
+        if pos[0] == neighbor[0] or pos[1] == neighbor[1]:
+            return self.index.cost(neighbor)
+        return self.index.cost(neighbor) * self.movement.diagonal_length
+
+    def path_cost(self, path):
+        """Total cost of a path given as a list of moves from the start"""
+        moves = self.movement.offsets
+        x, y = self.start
+        cost = 0
+        for move in path:
+            dx, dy = moves[move]
+            cost += self.move_cost((x, y), (x + dx, y + dy))
+            x, y = x + dx, y + dy
+        return cost
+
     def heuristic(self, a, b):
-        """Calculate Manhattan distance heuristic (Absolute distance between two points)"""
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+        """
+        Manhattan distance for 4-connected movement, octile distance for 8-connected movement.
+        Both are admissible as every step costs at least its length.
+        """
+        return self.movement.distance(a, b)
     
+    @property
+    def goal_index(self):
+        """Spatial index of the reachable goals, built on first use"""
+        if self._goal_index is None:
+            self._goal_index = GoalIndex(self.reachable_goals, self.heuristic)
+        return self._goal_index
+
     def get_closest_goal(self, pos):
-        """Find the closest goal from a position using the heuristic"""
-        # Handle edge case
-        if not self.goals:
-            return None
-            
-        # Initialize with the first goal
-        closest_goal = self.goals[0]
-        min_distance = self.heuristic(pos, closest_goal)
-        
-        # Check each goal to find the closest one
-        for goal in self.goals:
-            # Calculate Manhattan distance
-            current_distance = self.heuristic(pos, goal)
-
-            # Update if we found a closer goal
-            if current_distance < min_distance:
-                min_distance = current_distance
-                closest_goal = goal
-                
-        return closest_goal
+        """Find the closest reachable goal from a position using the heuristic (None without one)"""
+        return self.goal_index.nearest(pos)[0]
+
+    def goal_distance(self, pos):
+        """Heuristic distance to the closest reachable goal, admissible for the whole goal set"""
+        return self.goal_index.nearest(pos)[1]
 
     @abstractmethod
     def search(self):
@@ -0,0 +1,406 @@
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from fileReader import FileReader
+from gridIndex import GridIndex
+from movement import Movement
+from pathEncoding import PathEncoding
+from pathSmoother import PathSmoother
+from search import search_algorithms, load_algorithm
+from sharedGridIndex import SharedGridIndex
+
+class SearchCancelled(Exception):
+    """Raised inside a worker when its search was cancelled or timed out"""
+
+class SearchWatchdog:
+    def __init__(self, flags, slot, check_every=256):
+        """
+        Attached to a search in place of a MemoryTracker: every check_every expanded nodes it
+        looks at the cancel flag of its slot and stops the search once the flag is set.
+        """
+        self.flags = flags
+        self.slot = slot
+        self.check_every = check_every
+        self.calls = 0
+
+    def sample(self, frontier=(), visited=(), path_index=-1, paths=None):
+        self.calls += 1
+        if self.calls % self.check_every == 0 and self.flags[self.slot]:
+            raise SearchCancelled()
+
+# Worker process state: cancel flags shared with the service, and the maps parsed by this worker
+# and the shared memory blocks it attached to, both by the name of the map's shared block
+_worker_flags = None
+_worker_maps = {}
+_worker_indexes = {}
+
+def _init_worker(flags):
+    """Process pool initializer, keeps the shared cancel flags for the searches of this worker"""
+    global _worker_flags
+    _worker_flags = flags
+
+def map_digest(data):
+    """Fingerprint of a parsed map's size, walls and terrain, the same in every process"""
+    key = GridIndex.key(data["grid_size"], data["walls"], data["terrain"])
+    return hashlib.sha1(repr(key).encode()).hexdigest()
+
+def _load_map(job):
+    """
+    Parse a map once per worker for each time the service loaded it. The parse must match
+    the map the service loaded, or the shared index would not fit the walls the search sees.
+    """
+    version = job["index"]["name"] # A new shared block on every load
+    data = _worker_maps.get(version)
+    if data is None:
+        data = FileReader().parse_input_file(job["file"])
+        if map_digest(data) != job["digest"]:
+            raise ValueError(f"Map file {job['file']} changed since it was loaded, load it again")
+        _worker_maps[version] = data
+    return data
+
+def _drop_unloaded(live):
+    """Forget the maps and detach the shared blocks of maps the service no longer has loaded"""
+    for version in [version for version in _worker_maps if version not in live]:
+        del _worker_maps[version]
+    for name in [name for name in _worker_indexes if name not in live]:
+        index, memory = _worker_indexes.pop(name)
+        GridIndex.uninstall(index)
+        SharedGridIndex.detach(index, memory)
+
+def _attach_index(data, handle):
+    """
+    Put the service's shared GridIndex of a map in this worker's index cache, so searches
+    read the bitmap, costs and components from shared memory instead of building a copy
+    """
+    attached = _worker_indexes.get(handle["name"])
+    if attached is None:
+        try:
+            attached = SharedGridIndex.attach(handle)
+        except FileNotFoundError:
+            return # Map unloaded or reloaded since the job was queued, the worker builds its own index
+        _worker_indexes[handle["name"]] = attached
+    # Installed on every job, the worker's cache may have dropped it for other maps since
+    GridIndex.install(GridIndex.key(data["grid_size"], data["walls"], data["terrain"]), attached[0])
+
+def run_search(job):
+    """
+    Run one search in a worker process. The map and any HPA* cluster graph stay cached in
+    the worker, so repeated queries on a map skip parsing, and the GridIndex is shared by
+    every worker through shared memory.
+    """
+    _drop_unloaded(job["live"])
+    data = _load_map(job)
+    _attach_index(data, job["index"])
+    options = dict(job["options"])
+    movement = Movement(int(options.pop("movement", 4)), options.pop("corners", "never"))
+
+    algo = load_algorithm(job["method"])(
+        grid = data["grid_size"],
+        start = tuple(job["start"]) if job.get("start") else data["initial_position"],
+        goals = [tuple(goal) for goal in job["goals"]] if job.get("goals") else data["goal_states"],
+        walls = data["walls"],
+        terrain = data["terrain"],
+        movement = movement,
+        **options
+    )
+    algo.memory_tracker = SearchWatchdog(_worker_flags, job["slot"])
+    algo.return_visited = False # Not sent back to the client
+
+    start_time = time.perf_counter()
+    goal, nodes_visited, path, _ = algo.search()
+    execution_time = (time.perf_counter() - start_time) * 1000
+
+    result = {
+        "goal": list(goal) if goal else None,
+        "nodes_visited": nodes_visited,
+        "path": PathEncoding.encode(path) if job.get("path_format") == "rle" else path,
+        "path_cost": round(algo.path_cost(path), 4),
+        "execution_time": execution_time
+    }
+    if job.get("smooth") and goal: # Any-angle waypoints for clients that steer between them
+        result["waypoints"] = [list(cell) for cell in PathSmoother(algo.index).smooth(algo.start, path)]
+    if job["method"] == "arastar": # Anytime search: how good the path is and how it improved
+        result["bound"] = algo.bound
+        result["budget_exhausted"] = algo.budget_exhausted
+        result["trajectory"] = algo.trajectory
+    if job["method"] == "tour": # Every goal visited: in which order, and the ones that could not be reached
+        result["order"] = [list(goal) for goal in algo.order]
+        result["skipped_goals"] = [list(goal) for goal in algo.skipped_goals]
+    return result
+
+class SearchService:
+    def __init__(self, workers=None, max_in_flight=256, latency_window=1000):
+        """
+        Local search server speaking line-delimited JSON over TCP or a Unix socket:
+        - workers: Number of worker processes running searches (default: CPU count)
+        - max_in_flight: Most searches queued or running at once
+        - latency_window: Number of recent requests per method kept for latency percentiles
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.max_in_flight = max_in_flight
+        self.latency_window = latency_window
+        self.maps = {} # Map name -> {"file", "digest", "data", "shared" (SharedGridIndex)}
+        self.in_flight = {} # Request id -> (pool future, asyncio future, cancel flag slot)
+        self.cancel_requested = set() # Request ids a client asked to cancel
+        self.latencies = {} # Method -> recent request latencies in ms
+        self.cancel_flags = multiprocessing.Array('b', max_in_flight, lock=False)
+        self.free_slots = list(range(max_in_flight))
+        self.pool = None
+
+    def start_pool(self):
+        """Start the worker processes (done once, before serving)"""
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(self.workers, initializer=_init_worker, initargs=(self.cancel_flags,))
+
+    def shutdown(self):
+        """Stop the worker processes, dropping queued searches, and free the shared map indexes"""
+        if self.pool is not None:
+            for slot in range(self.max_in_flight):
+                self.cancel_flags[slot] = 1
+            self.pool.shutdown(wait=True, cancel_futures=True)
+            self.pool = None
+        for name in list(self.maps):
+            self.unload_map(name)
+
+    async def serve(self, host="127.0.0.1", port=8765, socket_path=None):
+        """Accept connections until cancelled"""
+        self.start_pool()
+        if socket_path:
+            server = await asyncio.start_unix_server(self.handle_client, path=socket_path)
+        else:
+            server = await asyncio.start_server(self.handle_client, host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.shutdown()
+
+    async def handle_client(self, reader, writer):
+        """Read one JSON request per line; requests run concurrently and answer as they finish"""
+        write_lock = asyncio.Lock()
+        tasks = set()
+
+        async def answer(line):
+            try:
+                request = json.loads(line)
+                response = await self.handle_request(request)
+            except json.JSONDecodeError as e:
+                request, response = {}, {"ok": False, "error": f"Invalid JSON: {e}"}
+            if "id" in request:
+                response["id"] = request["id"]
+            async with write_lock:
+                writer.write((json.dumps(response) + "\n").encode())
+                await writer.drain()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if line.strip():
+                    task = asyncio.create_task(answer(line))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except ConnectionError:
+            pass # Client went away, its searches still finish
+        finally:
+            writer.close()
+
+    async def handle_request(self, request):
+        """Dispatch one request by its "op" field and return the response"""
+        op = request.get("op")
+        try:
+            if op == "load":
+                return self.load_map(request["file"], request.get("map"))
+            if op == "unload":
+                return {"ok": self.unload_map(request["map"])}
+            if op == "maps":
+                return {"ok": True, "maps": {name: entry["file"] for name, entry in self.maps.items()}}
+            if op == "search":
+                return await self.search(request)
+            if op == "cancel":
+                return {"ok": self.cancel(request["target"])}
+            if op == "stats":
+                return {"ok": True, **self.stats()}
+            if op == "ping":
+                return {"ok": True}
+            return {"ok": False, "error": f"Unknown op: {op}"}
+        except KeyError as e:
+            return {"ok": False, "error": f"Missing field: {e}"}
+        except (OSError, ValueError) as e:
+            return {"ok": False, "error": str(e)}
+
+    def load_map(self, filename, name=None):
+        """
+        Parse and validate a map file and register it under a name (default: the file path).
+        Its GridIndex is built once here and published in shared memory for the workers.
+        """
+        data = FileReader().parse_input_file(filename)
+        name = name or filename
+        shared = SharedGridIndex(GridIndex(data["grid_size"], data["walls"], data["terrain"]))
+        self.unload_map(name)
+        self.maps[name] = {"file": os.path.abspath(filename), "digest": map_digest(data), "data": data, "shared": shared}
+        rows, cols = data["grid_size"]
+        return {"ok": True, "map": name, "grid_size": [rows, cols], "walls": len(data["walls"])}
+
+    def unload_map(self, name):
+        """Forget a map and free its shared index, returns False if it was not loaded"""
+        entry = self.maps.pop(name, None)
+        if entry is None:
+            return False
+        entry["shared"].close()
+        return True
+
+    async def search(self, request):
+        """Run a search in the worker pool, answering with an error on timeout or cancellation"""
+        method = request.get("method", "astar")
+        if method not in search_algorithms:
+            return {"ok": False, "error": f"Invalid search method: {method}. Choose from {list(search_algorithms.keys())}."}
+        entry = self.maps.get(request.get("map"))
+        if entry is None:
+            return {"ok": False, "error": f"Unknown map: {request.get('map')} (load it first)"}
+        if not self.free_slots:
+            return {"ok": False, "error": "Too many searches in flight"}
+
+        received = time.perf_counter()
+        slot = self.free_slots.pop()
+        self.cancel_flags[slot] = 0
+        job = {
+            "file": entry["file"],
+            "digest": entry["digest"],
+            "method": method,
+            "options": request.get("options", {}),
+            "start": request.get("start"),
+            "goals": request.get("goals"),
+            "path_format": request.get("path_format", "moves"),
+            "smooth": bool(request.get("smooth")),
+            "index": entry["shared"].handle,
+            "live": [loaded["shared"].handle["name"] for loaded in self.maps.values()], # Workers detach the others
+            "slot": slot
+        }
+
+        loop = asyncio.get_running_loop()
+        pool_future = self.pool.submit(run_search, job)
+        # The slot is reused only once the worker is done with it, even after a timeout
+        pool_future.add_done_callback(lambda _: loop.call_soon_threadsafe(self.free_slots.append, slot))
+        result_future = asyncio.wrap_future(pool_future)
+        request_id = request.get("id")
+        if request_id is not None:
+            self.in_flight[request_id] = (pool_future, result_future, slot)
+
+        try:
+            result = await asyncio.wait_for(result_future, request.get("timeout"))
+        except asyncio.TimeoutError:
+            self.cancel_flags[slot] = 1 # Stop the worker if the search already started
+            return {"ok": False, "error": "Search timed out"}
+        except SearchCancelled:
+            return {"ok": False, "error": "Search cancelled"}
+        except asyncio.CancelledError:
+            if request_id in self.cancel_requested:
+                return {"ok": False, "error": "Search cancelled"}
+            # The handler itself was cancelled (shutdown or client gone): stop the worker and pass it on
+            self.cancel_flags[slot] = 1
+            raise
+        except Exception as e:
+            return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        finally:
+            if request_id is not None:
+                self.in_flight.pop(request_id, None)
+                self.cancel_requested.discard(request_id)
+
+        latency = (time.perf_counter() - received) * 1000
+        self.latencies.setdefault(method, deque(maxlen=self.latency_window)).append(latency)
+        return {"ok": True, "latency": latency, **result}
+
+    def cancel(self, request_id):
+        """Cancel a queued or running search, returns False if it is not in flight"""
+        entry = self.in_flight.get(request_id)
+        if entry is None:
+            return False
+        pool_future, result_future, slot = entry
+        self.cancel_requested.add(request_id)
+        self.cancel_flags[slot] = 1 # Running: the worker stops at its next check
+        pool_future.cancel() # Queued: never starts
+        result_future.cancel()
+        return True
+
+    def stats(self):
+        """Latency percentiles per method over the recent requests, in ms"""
+        methods = {}
+        for method, latencies in self.latencies.items():
+            ordered = sorted(latencies)
+            methods[method] = {
+                "count": len(ordered),
+                "p50": self.percentile(ordered, 50),
+                "p90": self.percentile(ordered, 90),
+                "p99": self.percentile(ordered, 99),
+                "max": ordered[-1]
+            }
+        return {"methods": methods, "in_flight": self.max_in_flight - len(self.free_slots), "workers": self.workers}
+
+    @staticmethod
+    def percentile(ordered, percent):
+        """Nearest-rank percentile of an already sorted list"""
+        if not ordered:
+            return None
+        rank = max(1, -(-len(ordered) * percent // 100)) # Ceiling of n * p / 100
+        return ordered[rank - 1]
+
+async def send_requests(requests, host="127.0.0.1", port=8765, socket_path=None):
+    """Send requests over one connection and return the responses in the order they arrive"""
+    if socket_path:
+        reader, writer = await asyncio.open_unix_connection(socket_path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+    for request in requests:
+        writer.write((json.dumps(request) + "\n").encode())
+    await writer.drain()
+
+    responses = []
+    for _ in requests:
+        line = await reader.readline()
+        if not line:
+            break
+        responses.append(json.loads(line))
+    writer.close()
+    await writer.wait_closed()
+    return responses
+
+def main():
+    # python searchService.py serve [--port=8765] [--host=127.0.0.1] [--socket=path] [--workers=N]
+    # python searchService.py query '<json request>' ... [--port=8765] [--socket=path]
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    options = dict(arg[2:].split("=", 1) for arg in sys.argv[1:] if arg.startswith("--") and "=" in arg)
+    host = options.get("host", "127.0.0.1")
+    port = int(options.get("port", 8765))
+    socket_path = options.get("socket")
+
+    if not args or args[0] not in ("serve", "query"):
+        print("\nUsage: python searchService.py serve [--port=8765] [--host=127.0.0.1] [--socket=path] [--workers=N]")
+        print("       python searchService.py query '<json request>' ... [--port=8765] [--socket=path]")
+        print("Example: python searchService.py query '{\"op\": \"load\", \"file\": \"input.txt\", \"map\": \"demo\"}'\n")
+        sys.exit(1)
+
+    if args[0] == "serve":
+        service = SearchService(workers=int(options["workers"]) if "workers" in options else None)
+        where = socket_path or f"{host}:{port}"
+        print(f"Search service listening on {where} with {service.workers} workers")
+        try:
+            asyncio.run(service.serve(host, port, socket_path))
+        except KeyboardInterrupt:
+            pass
+    else:
+        requests = [json.loads(arg) for arg in args[1:]]
+        for response in asyncio.run(send_requests(requests, host, port, socket_path)):
+            print(json.dumps(response))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import sys
+from multiprocessing import shared_memory
+from gridIndex import GridIndex
+
+class SharedGridIndex:
+    def __init__(self, index):
+        """
+        Copy a GridIndex into one shared memory block that other processes attach to without
+        copying it. The block holds, for every cell in row-major order:
+        - components and diagonal_components: 4-byte signed labels, labelled here first
+        - costs: 4-byte unsigned step costs (only when the map has terrain)
+        - blocked: 1 byte per cell, 1 = wall
+        The owner must call close() once no process needs the map any more.
+        """
+        cells = index.rows * index.cols
+        arrays = [("components", index.components), ("diagonal_components", index.diagonal_components)]
+        if index.costs is not None:
+            arrays.append(("costs", index.costs))
+        arrays.append(("blocked", index.blocked)) # Last, so the 4-byte arrays stay aligned
+
+        offsets = {}
+        size = 0
+        for name, values in arrays:
+            offsets[name] = size
+            size += cells * (1 if name == "blocked" else 4)
+
+        self.memory = shared_memory.SharedMemory(create=True, size=max(1, size))
+        for name, values in arrays:
+            data = memoryview(values).cast('B')
+            self.memory.buf[offsets[name]:offsets[name] + len(data)] = data
+            data.release()
+
+        # Everything another process needs to attach, small enough to send with every job
+        self.handle = {
+            "name": self.memory.name,
+            "rows": index.rows,
+            "cols": index.cols,
+            "max_cost": index.max_cost,
+            "offsets": offsets
+        }
+
+    @staticmethod
+    def attach(handle):
+        """
+        Map a published index into this process. Returns (index, memory): the GridIndex reads
+        straight from the shared block, which must stay open while the index is used.
+        """
+        if sys.version_info >= (3, 13):
+            memory = shared_memory.SharedMemory(name=handle["name"], track=False) # The owner unlinks it
+        else:
+            memory = shared_memory.SharedMemory(name=handle["name"])
+        rows, cols, offsets = handle["rows"], handle["cols"], handle["offsets"]
+        cells = rows * cols
+
+        def view(name, width, format):
+            start = offsets[name]
+            return memory.buf[start:start + cells * width].cast(format)
+
+        index = GridIndex.__new__(GridIndex) # Filled in from the shared block instead of built
+        index.rows, index.cols = rows, cols
+        index.blocked = view("blocked", 1, 'B')
+        index.costs = view("costs", 4, 'I') if "costs" in offsets else None
+        index.max_cost = handle["max_cost"]
+        index._components = view("components", 4, 'i')
+        index._diagonal_components = view("diagonal_components", 4, 'i')
+        return index, memory
+
+    @staticmethod
+    def detach(index, memory):
+        """Unmap an index attached with attach(); the index must not be used afterwards"""
+        for view in (index.blocked, index.costs, index._components, index._diagonal_components):
+            if view is not None:
+                view.release()
+        memory.close()
+
+    def close(self):
+        """Release and remove the shared block (processes still attached keep their mapping)"""
+        if self.memory is not None:
+            self.memory.close()
+            self.memory.unlink()
+            self.memory = None
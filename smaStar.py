@@ -0,0 +1,175 @@
+import heapq
+from itertools import count
+from searchAlgorithm import SearchAlgorithm
+
+class SMANode:
+    __slots__ = ("position", "g", "f", "parent", "move", "depth", "children", "forgotten", "key", "in_open")
+
+    def __init__(self, position, g, f, parent=None, move=None):
+        """A search tree node held in memory by SMA*"""
+        self.position = position
+        self.g = g
+        self.f = f
+        self.parent = parent
+        self.move = move
+        self.depth = parent.depth + 1 if parent is not None else 0 # Number of moves from the start
+        self.children = 0 # Number of successors currently held in memory
+        self.forgotten = None # Move -> f-cost of each pruned successor, created on first prune
+        self.key = f # Priority in the open list (f-cost, or best forgotten f-cost when reopened)
+        self.in_open = False
+
+class SMAStar(SearchAlgorithm):
+    def __init__(self, grid, start, goals, walls, max_nodes=1000, terrain=None, movement=None):
+        super().__init__(grid, start, goals, walls, terrain, movement)
+        self.max_nodes = max(2, max_nodes)  # Node budget, must hold at least the start and one successor
+        self.peak_nodes = 0 # Most nodes held in memory at once
+        self.nodes_pruned = 0
+
+    def search(self):
+        """
+        Simplified memory-bounded A*: at most max_nodes search nodes are kept in memory.
+        When the budget is exceeded, the worst leaf is pruned and its f-cost is remembered
+        by its parent, which is reopened so the subtree can be regenerated if it becomes promising.
+        """
+        self.nodes_visited = 0
+        self.peak_nodes = 0
+        self.nodes_pruned = 0
+        if not self.reachable_goals: # Start and goals lie in different connected components
+            return None, self.nodes_visited, [], self.visited_result()
+        visited = set()
+        order = count() # Insertion counter, keeps heap entries comparable
+
+        root = SMANode(self.start, 0, self.goal_distance(self.start)) # h: distance to the closest goal
+        nodes = {self.start: root} # All nodes currently held in memory
+        open_list = [] # (key, -g, order, node): lowest f-cost first, deepest on ties
+        leaves = [] # (-key, g, order, node): highest f-cost first, shallowest on ties
+        self._push_open(open_list, root, root.f, order)
+
+        while open_list:
+            key, _, _, node = heapq.heappop(open_list)
+            if not node.in_open or key != node.key or nodes.get(node.position) is not node:
+                continue # Stale entry (node was pruned, replaced or reprioritized)
+            if key == float('inf'):
+                break # Only dead ends remain
+            node.in_open = False
+
+            current = node.position
+            self.nodes_visited += 1 # Re-expansions are counted, they are the price of bounded memory
+            visited.add(current)
+            self._track(open_list, visited, paths=())
+
+            if current in self.goal_set:
+                return current, self.nodes_visited, self._build_path(node), self.visited_result(visited)
+
+            for dx, dy, move in self.directions:
+                nx, ny = current[0] + dx, current[1] + dy
+                neighbor = (nx, ny)
+                if not self.can_move(current, neighbor):
+                    continue
+
+                g = node.g + self.move_length(current, neighbor) # Terrain costs are ignored
+                existing = nodes.get(neighbor)
+                if existing is not None and existing.g <= g:
+                    continue # Already held in memory with an equal or cheaper path
+
+                # Regenerate a pruned successor with the f-cost it had when it was forgotten
+                forgotten = node.forgotten.pop(move, None) if node.forgotten else None
+                if forgotten == float('inf'):
+                    node.forgotten[move] = forgotten # Known dead end, leave it pruned
+                    continue
+
+                if node.depth + 1 >= self.max_nodes - 1 and neighbor not in self.goal_set:
+                    f = float('inf') # The path to its successors would not fit in memory
+                else:
+                    # Pathmax keeps f non-decreasing along a path
+                    f = max(node.f, g + self.goal_distance(neighbor), forgotten or 0)
+                if existing is None:
+                    child = SMANode(neighbor, g, f, node, move)
+                    nodes[neighbor] = child
+                else:
+                    # Found a cheaper path to a node in memory, move it under the current node
+                    child = existing
+                    self._detach(child, leaves, order)
+                    child.g, child.f, child.parent, child.move = g, f, node, move
+                    child.depth = node.depth + 1
+                node.children += 1
+                self._push_open(open_list, child, f, order)
+                self._push_leaf(leaves, child, order)
+
+            if node.children == 0:
+                # Dead end, or every successor is held elsewhere with a cheaper path
+                self._push_leaf(leaves, node, order)
+
+            self.peak_nodes = max(self.peak_nodes, len(nodes))
+            while len(nodes) > self.max_nodes:
+                if not self._prune_worst_leaf(nodes, leaves, open_list, order):
+                    break
+
+        return None, self.nodes_visited, [], self.visited_result(visited)
+
+    def _push_open(self, open_list, node, key, order):
+        """Add or reprioritize a node in the open list"""
+        node.key = key
+        node.in_open = True
+        heapq.heappush(open_list, (key, -node.g, next(order), node))
+
+    def _leaf_key(self, node):
+        """
+        f-cost used to rank a leaf for pruning and remembered by its parent once pruned.
+        A closed leaf is only worth its own forgotten successors, if it has none it goes first.
+        """
+        if node.in_open:
+            return node.key
+        return min(node.forgotten.values()) if node.forgotten else float('inf')
+
+    def _push_leaf(self, leaves, node, order):
+        """Register a node as a pruning candidate"""
+        heapq.heappush(leaves, (-self._leaf_key(node), node.g, next(order), node))
+
+    def _detach(self, node, leaves, order):
+        """Remove a node from its parent's successors"""
+        parent = node.parent
+        if parent is not None:
+            parent.children -= 1
+            if parent.children == 0:
+                self._push_leaf(leaves, parent, order)
+
+    def _prune_worst_leaf(self, nodes, leaves, open_list, order):
+        """
+        Forget the shallowest leaf with the highest f-cost.
+        Its parent remembers the f-cost and is reopened so the leaf can be regenerated later.
+        Returns False if there is no leaf left to prune.
+        """
+        while leaves:
+            neg_key, _, _, node = heapq.heappop(leaves)
+            if (nodes.get(node.position) is not node or node.children or node.parent is None
+                    or -neg_key != self._leaf_key(node)):
+                continue # Stale entry, interior node or the start node
+
+            del nodes[node.position]
+            node.in_open = False
+            self.nodes_pruned += 1
+
+            parent = node.parent
+            if parent.forgotten is None:
+                parent.forgotten = {}
+            parent.forgotten[node.move] = -neg_key
+            self._detach(node, leaves, order)
+
+            # Reopen the parent so the forgotten subtree is regenerated once it is the most promising
+            best_forgotten = min(parent.forgotten.values())
+            if best_forgotten != float('inf') and not parent.in_open:
+                self._push_open(open_list, parent, max(parent.f, best_forgotten), order)
+                if parent.children == 0:
+                    self._push_leaf(leaves, parent, order)
+            return True
+        return False
+
+    def _build_path(self, node):
+        """Follow parent links back to the start to recover the moves"""
+        path = []
+        while node.parent is not None:
+            path.append(node.move)
+            node = node.parent
+        path.reverse()
+        return path
@@ -1,21 +1,24 @@
 import os
 import random
 import subprocess
-from openpyxl import Workbook
+import sys
 from testCase import TestCase
-from docx import Document
+from resultFile import ResultFile
+from resultStats import ResultStats
 
 class TestSuite:
-    def __init__(self, test_dir="tests", output_file="testResult.xlsx"):
+    def __init__(self, test_dir="tests", output_file="testResult.xlsx", report=True):
         """
         Initialize a test suite with:
         - test_dir: Directory to store test files
-        - output_file: Excel file to store results
+        - output_file: Excel file to store results (a .csv name writes plain CSV instead)
+        - report: Whether to write the Word report after the run (off for headless runs)
         - algorithms: List of search algorithms to test
         """
         self.test_dir = test_dir
         self.output_file = output_file
-        self.algorithms = ["dfs", "bfs", "gbfs", "astar", "iddfs", "beam"]
+        self.report = report
+        self.algorithms = ["dfs", "bfs", "gbfs", "astar", "iddfs", "beam", "idastar", "smastar", "dijkstra", "hpastar", "dstarlite"]
         self.tests = []
 
     def generate_tests(self, num_tests):
@@ -102,15 +105,15 @@ class TestSuite:
     def run_tests(self):
         """
         Run all tests with all algorithms and save results to Excel file.
-        For beam search, test with 4 different beam widths.
+        For beam search, test with 4 different beam widths in a single sweep per test.
+        Rows are streamed to the results file and folded into the report totals as they
+        arrive, so memory use does not grow with the number of tests.
         """
-        workbook = Workbook()
-        sheet = workbook.active
-        sheet.title = "Search Results"
-        sheet.append(["Input File", "Test Type", "Algorithm", "Goal Reached", "Nodes Visited", 
-                    "Path Length", "Execution Time", "Beam Width", "Memory Used (KB)"])
+        results = ResultFile(self.output_file)
+        results.open(ResultStats.columns)
+        stats = ResultStats()
 
-        total_tests = len(self.tests) * (len(self.algorithms) - 1 + 4)  # 4 beam widths for beam search
+        total_tests = len(self.tests) * len(self.algorithms)  # Beam widths share a single sweep run
         current = 0
 
         for test_file in self.tests:
@@ -121,11 +124,12 @@ class TestSuite:
                 if algo == "beam":
                     # Test beam search with different widths
                     beam_widths = [1, 3, 5, 7]  # Fixed values covering narrow to wider beams
+                    current += 1
+                    print(f"[{current}/{total_tests}] Running {algo.upper()} (widths={beam_widths}) on {os.path.basename(test_file)}")
+                    sweep_results = self._run_beam_sweep(test_file, beam_widths)
                     for beam_width in beam_widths:
-                        current += 1
-                        print(f"[{current}/{total_tests}] Running {algo.upper()} (width={beam_width}) on {os.path.basename(test_file)}")
-                        result = self._run_algorithm(test_file, algo, beam_width)
-                        sheet.append([
+                        result = sweep_results[beam_width]
+                        row = [
                             os.path.basename(test_file),
                             test_type,
                             algo.upper(),
@@ -134,13 +138,16 @@ class TestSuite:
                             result["path_length"],
                             result["execution_time"],
                             beam_width,
-                            result["memory_used"]
-                        ])
+                            result["memory_used"],
+                            result["peak_memory"]
+                        ]
+                        results.append(row)
+                        stats.add(row)
                 else:
                     current += 1
                     print(f"[{current}/{total_tests}] Running {algo.upper()} on {os.path.basename(test_file)}")
                     result = self._run_algorithm(test_file, algo)
-                    sheet.append([
+                    row = [
                         os.path.basename(test_file),
                         test_type,
                         algo.upper(),
@@ -149,17 +156,28 @@ class TestSuite:
                         result["path_length"],
                         result["execution_time"],
                         "N/A",
-                        result["memory_used"]
-                    ])
-        
-        # Add algorithm complexity analysis
-        self.generate_word_report(workbook)
+                        result["memory_used"],
+                        result["peak_memory"]
+                    ]
+                    results.append(row)
+                    stats.add(row)
 
-        workbook.save(self.output_file)
+        stats.finish()
+        results.close()
         print(f"✅ All tests completed. Results saved to '{self.output_file}'")
+        stats.print_summary(self.algorithms)
+        stats.ranking.print_table()
+
+        # Add algorithm complexity analysis
+        if self.report:
+            self.generate_word_report(stats)
 
-    def generate_word_report(self, workbook=None):
-        """Generate a detailed Word document report of algorithm performance"""
+    def generate_word_report(self, stats=None):
+        """
+        Generate a detailed Word document report of algorithm performance.
+        Without stats the totals are read back from the results file, one row at a time.
+        """
+        from docx import Document  # Reporting libraries are only imported when a report is written
         # Create a new Word document
         doc = Document()
         
@@ -167,7 +185,7 @@ class TestSuite:
         doc.add_heading('Search Algorithm Performance Analysis', 0)
         
         # Add introduction
-        doc.add_paragraph('This report presents a comparative analysis of search algorithms for pathfinding in grid-based environments. The algorithms tested include BFS, DFS, GBFS, A*, IDDFS, and Beam Search with multiple beam widths.')
+        doc.add_paragraph('This report presents a comparative analysis of search algorithms for pathfinding in grid-based environments. The algorithms tested include BFS, DFS, GBFS, A*, IDDFS, Beam Search with multiple beam widths, and the memory-bounded IDA* and SMA*.')
         
         # Add test summary section
         doc.add_heading('Test Case Summary', level=1)
@@ -209,73 +227,23 @@ class TestSuite:
         # Add note about test distribution
         doc.add_paragraph(f'A total of {total_tests} test cases were generated with a distribution designed to test algorithms under different conditions. Each algorithm was tested on all grids, with Beam Search additionally tested with multiple width parameters.')
         
-        # Load the workbook if not provided
-        if workbook is None:
+        # Read the totals back from the results file if not provided
+        if stats is None:
             try:
-                import openpyxl
-                workbook = openpyxl.load_workbook(self.output_file)
+                stats = ResultStats.from_rows(ResultFile(self.output_file).rows())
             except:
                 doc.add_paragraph("No test results found. Please run tests first.")
                 doc.save("Algorithm_Analysis_Report.docx")
                 return "Algorithm_Analysis_Report.docx"
         
-        # Extract data from workbook
-        results_sheet = workbook["Search Results"]
-        
         # Same structure as in algorithm_analysis to organize data
         test_types = set(self.test_types.values())
         algorithms = self.algorithms
         
-        # Extract performance data
+        # Performance data per test type, aggregated while the results arrived
         performance_by_type = {}
         for test_type in test_types:
-            performance_by_type[test_type] = {}
-            for algo in algorithms:
-                performance_by_type[test_type][algo.upper()] = {
-                    "runs": 0, 
-                    "successes": 0, 
-                    "total_time": 0.0,
-                    "total_nodes": 0, 
-                    "total_path_length": 0,
-                    "total_memory": 0.0
-                }
-        
-        # Extract data from results sheet
-        for row in list(results_sheet.rows)[1:]:  # Skip header
-            test_type = row[1].value
-            algo = row[2].value
-            goal_reached = row[3].value == "Yes"
-            
-            try:
-                nodes = int(row[4].value) if row[4].value not in ["N/A", None] else 0
-                path_length = int(row[5].value) if row[5].value not in ["N/A", None] else 0
-                
-                # Parse execution time
-                time_str = row[6].value
-                time_val = 0.0
-                if time_str and isinstance(time_str, str):
-                    if "ms" in time_str:
-                        time_val = float(time_str.replace("ms", ""))
-                    elif "s" in time_str:
-                        time_val = float(time_str.replace("s", "")) * 1000.0
-
-                # Parse memory usage
-                mem_str = row[8].value
-                memory_val = 0.0
-                if mem_str and isinstance(mem_str, str) and "KB" in mem_str:
-                    memory_val = float(mem_str.split()[0])
-                
-                # Update statistics
-                if test_type in performance_by_type and algo in performance_by_type[test_type]:
-                    performance_by_type[test_type][algo]["runs"] += 1
-                    if goal_reached:
-                        performance_by_type[test_type][algo]["successes"] += 1
-                        performance_by_type[test_type][algo]["total_time"] += time_val
-                        performance_by_type[test_type][algo]["total_nodes"] += nodes
-                        performance_by_type[test_type][algo]["total_path_length"] += path_length
-                        performance_by_type[test_type][algo]["total_memory"] += memory_val
-            except Exception as e:
-                pass  # Skip problematic data
+            performance_by_type[test_type] = {algo.upper(): stats.totals(test_type, algo.upper()) for algo in algorithms}
         
         # Add overall performance section
         doc.add_heading('Overall Algorithm Performance', level=1)
@@ -291,36 +259,17 @@ class TestSuite:
         hdr_cells[4].text = 'Avg Path Length'
         hdr_cells[5].text = 'Avg Memory (KB)'
         
-        # Calculate overall stats
-        overall_stats = {}
-        for algo in [a.upper() for a in algorithms]:
-            overall_stats[algo] = {
-                "runs": 0, "successes": 0, "total_time": 0.0,
-                "total_nodes": 0, "total_path_length": 0, "total_memory": 0.0
-            }
-        
-        # Aggregate stats across all test types
-        for test_type in test_types:
-            for algo in [a.upper() for a in algorithms]:
-                stats = performance_by_type[test_type][algo]
-                overall_stats[algo]["runs"] += stats["runs"]
-                overall_stats[algo]["successes"] += stats["successes"]
-                overall_stats[algo]["total_time"] += stats["total_time"]
-                overall_stats[algo]["total_nodes"] += stats["total_nodes"]
-                overall_stats[algo]["total_path_length"] += stats["total_path_length"]
-                overall_stats[algo]["total_memory"] += stats["total_memory"]
-        
-        # Add rows with overall stats
+        # Add rows with overall stats across all test types
         for algo in sorted([a.upper() for a in algorithms]):
-            stats = overall_stats[algo]
+            overall = stats.overall(algo)
             row_cells = table.add_row().cells
             row_cells[0].text = algo
             
-            success_rate = f"{(stats['successes'] / stats['runs'] * 100):.1f}%" if stats['runs'] > 0 else "N/A" 
-            avg_time = f"{(stats['total_time'] / stats['successes']):.2f}" if stats['successes'] > 0 else "N/A"
-            avg_nodes = f"{(stats['total_nodes'] / stats['successes']):.1f}" if stats['successes'] > 0 else "N/A" 
-            avg_path = f"{(stats['total_path_length'] / stats['successes']):.1f}" if stats['successes'] > 0 else "N/A"
-            avg_memory = f"{(stats['total_memory'] / stats['successes']):.2f}" if stats['successes'] > 0 else "N/A"
+            success_rate = f"{(overall['successes'] / overall['runs'] * 100):.1f}%" if overall['runs'] > 0 else "N/A" 
+            avg_time = f"{(overall['total_time'] / overall['successes']):.2f}" if overall['successes'] > 0 else "N/A"
+            avg_nodes = f"{(overall['total_nodes'] / overall['successes']):.1f}" if overall['successes'] > 0 else "N/A" 
+            avg_path = f"{(overall['total_path_length'] / overall['successes']):.1f}" if overall['successes'] > 0 else "N/A"
+            avg_memory = f"{(overall['total_memory'] / overall['successes']):.2f}" if overall['successes'] > 0 else "N/A"
             
             row_cells[1].text = success_rate
             row_cells[2].text = avg_time
@@ -330,6 +279,27 @@ class TestSuite:
         
         doc.add_paragraph(f'The table above summarizes the overall performance of each algorithm across all test cases. The success rate is capped at {success_rate} which depends on the number of unreachable tests produced.')
         
+        # Add ranking section
+        doc.add_heading('Algorithm Ranking', level=1)
+        doc.add_paragraph('On every test, time, nodes visited and peak memory are divided by the best value any algorithm reached on that test, so small and large grids count the same. The ratios below are geometric means over all tests (1.00 means best on every test) with 95% confidence intervals. A run solves a test when it finds a path, or correctly reports that none exists; unsolved runs count as ten times the worst ratio on their test. The optimality gap is how much longer the paths are than the shortest path found by BFS.')
+
+        table = doc.add_table(rows=1, cols=7)
+        table.style = 'Table Grid'
+        hdr_cells = table.rows[0].cells
+        for cell, title in zip(hdr_cells, ['Rank', 'Algorithm', 'Solved', 'Time Ratio', 'Nodes Ratio', 'Memory Ratio', 'Optimality Gap']):
+            cell.text = title
+
+        ranking = stats.ranking
+        for row in ranking.summary():
+            row_cells = table.add_row().cells
+            row_cells[0].text = str(row['rank'])
+            row_cells[1].text = row['algorithm']
+            row_cells[2].text = ranking.format_interval(row['solved'], 1, percent=True)
+            row_cells[3].text = ranking.format_interval(row['time'])
+            row_cells[4].text = ranking.format_interval(row['nodes'])
+            row_cells[5].text = ranking.format_interval(row['memory'])
+            row_cells[6].text = ranking.format_interval(row['gap'], 1, percent=True)
+
         # Add performance by grid type section
         doc.add_heading('Performance by Grid Type', level=1)
         
@@ -378,73 +348,43 @@ class TestSuite:
             if test_type != "unreachable":
                 doc.add_heading(f'Recommendations for {test_type.upper()} Grids', level=3)
                 
-                # Find best algorithms
-                best_overall = self._find_best_overall(performance_by_type[test_type])
-                fastest = self._find_fastest(performance_by_type[test_type])
-                best_memory = self._find_best_memory(performance_by_type[test_type])
+                # Find best algorithms from the per-test ratios on this grid type
+                best_overall = ranking.best(test_type, "score")
+                fastest = ranking.best(test_type, "time")
+                best_memory = ranking.best(test_type, "memory")
                 
                 # Add recommendation paragraph
                 doc.add_paragraph(f'• Best Overall Algorithm: {best_overall}')
                 doc.add_paragraph(f'• Fastest Algorithm: {fastest}')
                 doc.add_paragraph(f'• Most Memory Efficient: {best_memory}')
         
+        # Add memory-bounded search comparison
+        doc.add_heading('Memory-Bounded Search Comparison', level=1)
+        doc.add_paragraph('IDA* keeps only the current path and SMA* keeps at most a fixed number of nodes, trading re-expanded nodes for bounded memory. This table compares them with A*, which keeps its whole frontier.')
+
+        bounded_data = stats.bounded
+
+        table = doc.add_table(rows=1, cols=4)
+        table.style = 'Table Grid'
+        hdr_cells = table.rows[0].cells
+        hdr_cells[0].text = 'Algorithm'
+        hdr_cells[1].text = 'Success Rate'
+        hdr_cells[2].text = 'Avg Nodes'
+        hdr_cells[3].text = 'Avg Peak Memory (KB)'
+
+        for algo, bounded in bounded_data.items():
+            row_cells = table.add_row().cells
+            row_cells[0].text = algo
+            row_cells[1].text = f"{(bounded['successes'] / bounded['runs'] * 100):.1f}%" if bounded['runs'] > 0 else "N/A"
+            row_cells[2].text = f"{(bounded['total_nodes'] / bounded['successes']):.1f}" if bounded['successes'] > 0 else "N/A"
+            row_cells[3].text = f"{(bounded['total_peak_memory'] / bounded['successes']):.2f}" if bounded['successes'] > 0 else "N/A"
+
         # Add beam search analysis
         doc.add_heading('Beam Search Analysis', level=1)
 
-        # Extract beam search data by beam width
-        beam_data = {}
-        beam_widths = []
-
-        # Parse results for beam search performance data
-        for row in list(results_sheet.rows)[1:]:  # Skip header
-            if row[2].value == "BEAM":
-                width = row[7].value
-                if width not in beam_widths:
-                    beam_widths.append(width)
-                    beam_data[width] = {
-                        "runs": 0,
-                        "successes": 0,
-                        "total_time": 0,
-                        "total_nodes": 0,
-                        "total_path": 0,
-                        "total_memory": 0
-                    }
-                
-                # Update statistics
-                beam_data[width]["runs"] += 1
-                goal_reached = row[3].value == "Yes"
-                
-                if goal_reached:
-                    beam_data[width]["successes"] += 1
-                    
-                    # Extract metrics for successful runs
-                    try:
-                        nodes = int(row[4].value) if row[4].value not in ["N/A", None] else 0
-                        path_length = int(row[5].value) if row[5].value not in ["N/A", None] else 0
-                        
-                        # Time
-                        time_str = row[6].value
-                        time_val = 0.0
-                        if time_str and isinstance(time_str, str):
-                            if "ms" in time_str:
-                                time_val = float(time_str.replace("ms", ""))
-                            elif "s" in time_str:
-                                time_val = float(time_str.replace("s", "")) * 1000.0
-                        
-                        # Memory
-                        mem_str = row[8].value
-                        memory_val = 0.0
-                        if mem_str and isinstance(mem_str, str) and "KB" in mem_str:
-                            memory_val = float(mem_str.split()[0])
-                            
-                        # Update totals
-                        beam_data[width]["total_time"] += time_val
-                        beam_data[width]["total_nodes"] += nodes
-                        beam_data[width]["total_path"] += path_length
-                        beam_data[width]["total_memory"] += memory_val
-                        
-                    except Exception as e:
-                        pass  # Skip problematic data
+        # Beam search data by beam width
+        beam_data = stats.beam
+        beam_widths = list(beam_data)
 
         # Add introduction to beam search
         doc.add_paragraph('Beam Search is a heuristic search algorithm that limits the breadth of the search by keeping only the k most promising nodes at each level, where k is the beam width. This analysis examines how different beam widths affect performance across grid types.')
@@ -465,16 +405,16 @@ class TestSuite:
 
         # Add a row for each beam width
         for width in sorted(beam_widths):
-            stats = beam_data[width]
+            beam = beam_data[width]
             row_cells = table.add_row().cells
             row_cells[0].text = str(width)
             
             # Calculate averages and success rate
-            success_rate = f"{(stats['successes'] / stats['runs'] * 100):.1f}%" if stats['runs'] > 0 else "N/A"
-            avg_time = f"{(stats['total_time'] / stats['successes']):.2f}" if stats['successes'] > 0 else "N/A"
-            avg_nodes = f"{(stats['total_nodes'] / stats['successes']):.1f}" if stats['successes'] > 0 else "N/A"
-            avg_path = f"{(stats['total_path'] / stats['successes']):.1f}" if stats['successes'] > 0 else "N/A"
-            avg_memory = f"{(stats['total_memory'] / stats['successes']):.2f}" if stats['successes'] > 0 else "N/A"
+            success_rate = f"{(beam['successes'] / beam['runs'] * 100):.1f}%" if beam['runs'] > 0 else "N/A"
+            avg_time = f"{(beam['total_time'] / beam['successes']):.2f}" if beam['successes'] > 0 else "N/A"
+            avg_nodes = f"{(beam['total_nodes'] / beam['successes']):.1f}" if beam['successes'] > 0 else "N/A"
+            avg_path = f"{(beam['total_path'] / beam['successes']):.1f}" if beam['successes'] > 0 else "N/A"
+            avg_memory = f"{(beam['total_memory'] / beam['successes']):.2f}" if beam['successes'] > 0 else "N/A"
             
             # Add to table
             row_cells[1].text = success_rate
@@ -486,22 +426,12 @@ class TestSuite:
         # Add beam search recommendations
         doc.add_heading('Beam Search Recommendations', level=2)
 
-        # Find optimal beam width based on success rate and efficiency
+        # Optimal beam width: the width ranked best on the per-test ratios
         optimal_width = None
-        best_score = float('-inf')
-
-        for width in beam_widths:
-            if beam_data[width]["runs"] > 0 and beam_data[width]["successes"] > 0: # Check if the width has been tested
-                success_rate = (beam_data[width]["successes"] / beam_data[width]["runs"]) * 100
-                avg_time = beam_data[width]["total_time"] / beam_data[width]["successes"]
-                avg_memory = beam_data[width]["total_memory"] / beam_data[width]["successes"]
-                
-                # Score balances success rate with time and memory efficiency
-                score = success_rate - (avg_time / 50) - (avg_memory / 100)
-                
-                if score > best_score: # Update best score
-                    best_score = score
-                    optimal_width = width
+        for row in ranking.summary():
+            if row["algorithm"].startswith("BEAM-"):
+                optimal_width = row["algorithm"][len("BEAM-"):]
+                break
 
         if optimal_width:
             doc.add_paragraph(f'• Recommended beam width: {optimal_width}')
@@ -528,6 +458,8 @@ class TestSuite:
         - nodes_visited: Number of nodes explored
         - path_length: Length of the path found
         - execution_time: Time taken to run the algorithm
+        - memory_used: Memory still allocated when the search returned
+        - peak_memory: Peak memory allocated during the search
         """
         try:
             cmd = ["python", "search.py", test_file, algorithm]
@@ -568,6 +500,16 @@ class TestSuite:
                         memory_used = float(memory_str.split()[0])
                     except:
                         pass
+
+            # Extract peak memory
+            peak_memory = 0
+            for line in output.split('\n'):
+                if "Peak memory:" in line:
+                    try:
+                        memory_str = line.split("Peak memory:")[1].strip()
+                        peak_memory = float(memory_str.split()[0])
+                    except:
+                        pass
             
             # Extract path length if goal reached
             path_length = 0
@@ -585,7 +527,8 @@ class TestSuite:
                 "nodes_visited": nodes_visited,
                 "path_length": path_length,
                 "execution_time": f"{execution_time:.3f}ms",
-                "memory_used": f"{memory_used:.2f} KB"
+                "memory_used": f"{memory_used:.2f} KB",
+                "peak_memory": f"{peak_memory:.2f} KB"
             }
             
         except subprocess.TimeoutExpired:
@@ -594,7 +537,8 @@ class TestSuite:
                 "nodes_visited": "N/A",
                 "path_length": "N/A",
                 "execution_time": "30s+",
-                "memory_used": "N/A"
+                "memory_used": "N/A",
+                "peak_memory": "N/A"
             }
         except Exception as e:
             return {
@@ -602,74 +546,69 @@ class TestSuite:
                 "nodes_visited": "N/A",
                 "path_length": "N/A",
                 "execution_time": "Error: " + str(e),
-                "memory_used": "N/A"
+                "memory_used": "N/A",
+                "peak_memory": "N/A"
             }
 
-    def _find_best_overall(self, algorithms_perf):
-        """Find the best overall algorithm balancing success rate, speed, and memory"""
-        candidates = []
-        
-        for algo, perf in algorithms_perf.items():
-            if perf.get("runs", 0) > 0 and perf.get("successes", 0): # Check if the algorithm has been run
-                # Calculate score based on success rate, time, and memory
-                success_rate = perf.get("successes", 0) / perf.get("runs", 1) * 100
-                
-                # Only calculate time and memory if there were successes
-                if perf.get("successes", 0) > 0:
-                    avg_time = perf.get("total_time", 0) / perf.get("successes", 1) # Calculate average time
-                    avg_memory = perf.get("total_memory", 0) / perf.get("successes", 1) # Calculate average memory
-                    
-                    # Lower is better - normalize and weight the score components
-                    score = (
-                        (100 - success_rate) * 0.4 +  # Success rate (40% weight)
-                        (min(avg_time / 100, 1.0)) * 0.3 +  # Time (30% weight)
-                        (min(avg_memory / 1000, 1.0)) * 0.3  # Memory (30% weight)
-                    )
-                    
-                    candidates.append((algo, score))
-        
-        # Return the algorithm with the best (lowest) score
-        if candidates:
-            best_score = float('inf') # Initialize to infinity
-            best_algo = None
-
-            for algo, score in candidates:
-                if score < best_score: # Update if this algorithm has a better score
-                    best_score = score
-                    best_algo = algo
-            
-            return best_algo 
+    def _run_beam_sweep(self, test_file, beam_widths):
+        """
+        Run beam search for all widths in one process, sharing the parsed map, and return
+        a result per width in the same format as _run_algorithm.
+        """
+        try:
+            cmd = ["python", "search.py", test_file, "beam", ",".join(str(width) for width in beam_widths)]
+            process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=30)
+            output = process.stdout
 
-    def _find_fastest(self, algorithms_perf):
-        """Find the fastest algorithm among those with good success rates"""
-        best_time = float('inf') # Initialize to infinity
-        best_algo = None
-        
-        for algo, perf in algorithms_perf.items(): 
-            if perf.get("runs", 0) > 0 and perf.get("successes", 0) > 0: # Check if the algorithm has been run
-                avg_time = perf.get("total_time", 0) / perf.get("successes", 1) # Calculate average time
-                if avg_time < best_time: # Update if this algorithm is faster
-                    best_time = avg_time
-                    best_algo = algo
-        
-        return best_algo
+            results = {}
+            for line in output.split('\n'):
+                if not line.startswith("Beam width "):
+                    continue
+                try:
+                    # Line format: Beam width <w> - Nodes visited: <n> | Execution time: <t> ms | ...
+                    width_str, fields_str = line[len("Beam width "):].split(" - ", 1)
+                    fields = dict(field.split(": ", 1) for field in fields_str.split(" | "))
+                    goal_reached = fields["Goal reached"] != "None"
+                    results[int(width_str)] = {
+                        "goal_reached": "Yes" if goal_reached else "No",
+                        "nodes_visited": fields["Nodes visited"],
+                        "path_length": int(fields["Path length"]) if goal_reached else 0,
+                        "execution_time": f"{float(fields['Execution time'].split()[0]):.3f}ms",
+                        "memory_used": f"{float(fields['Memory used'].split()[0]):.2f} KB",
+                        "peak_memory": f"{float(fields['Peak memory'].split()[0]):.2f} KB"
+                    }
+                except:
+                    pass
 
-    def _find_best_memory(self, algorithms_perf):
-        """Find the algorithm with lowest memory usage among those with good success rates"""
-        best_memory = float('inf') # Initialize to infinity
-        best_algo = None
-        
-        for algo, perf in algorithms_perf.items():
-            if perf.get("runs", 0) > 0 and perf.get("successes", 0) > 0: # Check if the algorithm has been run
-                avg_memory = perf.get("total_memory", 0) / perf.get("successes", 1) # Calculate average memory
-                if avg_memory < best_memory: # Update if this algorithm uses less memory
-                    best_memory = avg_memory
-                    best_algo = algo
-        
-        return best_algo
+            # Widths missing from the output (e.g. the run crashed) are reported as errors
+            for beam_width in beam_widths:
+                if beam_width not in results:
+                    results[beam_width] = {
+                        "goal_reached": "Error: no result",
+                        "nodes_visited": "N/A",
+                        "path_length": "N/A",
+                        "execution_time": "N/A",
+                        "memory_used": "N/A",
+                        "peak_memory": "N/A"
+                    }
+            return results
+
+        except subprocess.TimeoutExpired:
+            return {beam_width: {
+                "goal_reached": "Timeout",
+                "nodes_visited": "N/A",
+                "path_length": "N/A",
+                "execution_time": "30s+",
+                "memory_used": "N/A",
+                "peak_memory": "N/A"
+            } for beam_width in beam_widths}
 
 if __name__ == "__main__":
-    # Create and run a test suite with 10 test cases
-    suite = TestSuite()
-    suite.generate_tests(10)
+    # python testSuites.py [number of tests] [--output=testResult.xlsx|results.csv] [--report=on|off]
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    options = dict(arg[2:].split("=", 1) for arg in sys.argv[1:] if arg.startswith("--") and "=" in arg)
+
+    # Create and run a test suite with 10 test cases by default
+    suite = TestSuite(output_file=options.get("output", "testResult.xlsx"), report=options.get("report", "on") != "off")
+    suite.generate_tests(int(args[0]) if args else 10)
     suite.run_tests()
\ No newline at end of file
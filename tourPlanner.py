@@ -0,0 +1,225 @@
+import time
+from collections import deque
+from aStar import AStar
+from batchSearch import BatchSearch
+from searchAlgorithm import SearchAlgorithm
+
+class TourPlanner(SearchAlgorithm):
+    exact_limit = 10 # Up to this many goals the visiting order is solved exactly
+
+    def __init__(self, grid, start, goals, walls, terrain=None, movement=None):
+        """
+        Visit every reachable goal, in the order that makes the whole path cheapest.
+        - Distances between the start and every goal come from one reverse batch search per
+          goal, which stops once the start and the other goals are reached
+        - The order is solved exactly (Held-Karp dynamic programming) for up to exact_limit
+          goals, otherwise built by nearest neighbour and improved with 2-opt
+        - Each leg is then searched with A* and the legs are joined into one path
+        The tour ends at the last goal, it does not return to the start. Goals in another
+        connected component than the start are skipped and listed in skipped_goals.
+        """
+        super().__init__(grid, start, goals, walls, terrain, movement)
+        self.order = [] # Goals in visiting order
+        self.tour_cost = None
+        self.exact = None # True if the order was solved exactly
+        self.skipped_goals = []
+        self.distances = None # Cost from point i to point j, point 0 is the start and the rest the goals
+        self.timings = {} # Milliseconds spent on distances, ordering and leg paths
+
+    def search(self):
+        self.nodes_visited = 0
+        self.order, self.tour_cost, self.exact, self.distances, self.timings = [], None, None, None, {}
+        targets = list(dict.fromkeys(self.reachable_goals)) # Without duplicates, in file order
+        self.skipped_goals = [goal for goal in dict.fromkeys(self.goals) if goal not in targets]
+        if not targets or not self.is_valid(self.start):
+            return None, self.nodes_visited, [], self.visited_result()
+
+        started = time.perf_counter()
+        points = [self.start] + targets
+        distances, visited = self._distance_matrix(points)
+        self.distances = distances
+        self.timings["distances"] = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        self.exact = len(targets) <= self.exact_limit
+        order = self._exact_order(distances) if self.exact else self._heuristic_order(distances)
+        self.timings["ordering"] = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        path = []
+        for previous, current in zip([0] + order, order):
+            path.extend(self._leg_path(points[previous], points[current]))
+        self.timings["paths"] = (time.perf_counter() - started) * 1000
+
+        self.order = [points[i] for i in order]
+        self.tour_cost = self._order_cost(distances, order)
+        return self.order[-1], self.nodes_visited, path, self.visited_result(visited)
+
+    def _distance_matrix(self, points):
+        """
+        distances[i][j]: cost of the cheapest path from points[i] to points[j], where points[0]
+        is the start. Searching backwards from each goal gives the costs from every point to it.
+        """
+        count = len(points)
+        distances = [[0] * count for _ in range(count)]
+        # With unit step costs paths cost the same both ways, so each goal only needs the points before it
+        symmetric = self.index.max_cost == 1
+        visited = set()
+        for j in range(1, count):
+            starts = points[:j] if symmetric else points
+            if symmetric and not self.diagonal:
+                costs = self._unit_costs(points[j], starts, visited if self.return_visited else None)
+            else:
+                costs = self._batch_costs(points[j], starts, visited if self.return_visited else None)
+            for i, cost in enumerate(costs):
+                distances[i][j] = cost
+                if symmetric and i > 0:
+                    distances[j][i] = cost
+        return distances, visited
+
+    def _batch_costs(self, goal, starts, visited):
+        """Cost from each start to the goal, from one reverse batch search"""
+        run = BatchSearch(self.grid, starts, [goal], self.walls, self.terrain, self.movement)
+        run.memory_tracker = self.memory_tracker
+        run.return_visited = False
+        run.search_all()
+        self.nodes_visited += run.nodes_visited
+        if visited is not None:
+            visited.update(run.costs)
+        return [run.agent_path_cost(start) for start in starts]
+
+    def _unit_costs(self, goal, starts, visited):
+        """
+        Number of moves between the goal and each start on a plain 4-connected map: a BFS over
+        flat cell numbers, as in the component labelling, stopping once every start is reached.
+        """
+        rows, cols, blocked = self.index.rows, self.index.cols, self.blocked
+        source = goal[1] * cols + goal[0]
+        waiting = {y * cols + x for x, y in starts}
+        costs = [-1] * (rows * cols) # Faster to index than an array or a dict
+        costs[source] = 0
+        reached = [source] # Cells given a cost, reported as the visited cells
+        queue = deque([source])
+        waiting.discard(source)
+        settled = 0
+        while queue and waiting:
+            current = queue.popleft()
+            settled += 1
+            self._track(queue, reached, paths=())
+            cost = costs[current] + 1
+            x = current % cols
+            for neighbor, inside in ((current - cols, current >= cols),
+                                     (current + cols, current < (rows - 1) * cols),
+                                     (current - 1, x > 0),
+                                     (current + 1, x < cols - 1)):
+                if inside and not blocked[neighbor] and costs[neighbor] == -1:
+                    costs[neighbor] = cost
+                    reached.append(neighbor)
+                    queue.append(neighbor)
+                    waiting.discard(neighbor)
+        self.nodes_visited += settled
+        if visited is not None:
+            visited.update((cell % cols, cell // cols) for cell in reached)
+        return [costs[y * cols + x] if costs[y * cols + x] != -1 else None for x, y in starts]
+
+    def _exact_order(self, distances):
+        """Cheapest visiting order of the goals (points 1..n) from the start, by Held-Karp"""
+        n = len(distances) - 1
+        infinity = float('inf')
+        full = (1 << n) - 1
+        costs = [[infinity] * n for _ in range(full + 1)] # Goals visited (bit mask), last goal -> cost
+        parents = [[-1] * n for _ in range(full + 1)]
+        for j in range(n):
+            costs[1 << j][j] = distances[0][j + 1]
+
+        for mask in range(1, full + 1):
+            row = costs[mask]
+            for j in range(n):
+                cost = row[j]
+                if cost == infinity:
+                    continue
+                leg = distances[j + 1]
+                for k in range(n):
+                    if mask & (1 << k):
+                        continue
+                    next_mask = mask | (1 << k)
+                    total = cost + leg[k + 1]
+                    if total < costs[next_mask][k]:
+                        costs[next_mask][k] = total
+                        parents[next_mask][k] = j
+
+        last = min(range(n), key=lambda j: costs[full][j])
+        order = []
+        mask = full
+        while last != -1:
+            order.append(last + 1)
+            mask, last = mask & ~(1 << last), parents[mask][last]
+        order.reverse()
+        return order
+
+    def _heuristic_order(self, distances):
+        """Nearest neighbour order from the start, improved by 2-opt until no reversal helps"""
+        return self._two_opt(distances, self._nearest_neighbour_order(distances))
+
+    @staticmethod
+    def _nearest_neighbour_order(distances):
+        """Visit the closest unvisited goal next, starting from the start"""
+        remaining = set(range(1, len(distances)))
+        order = []
+        current = 0
+        while remaining:
+            leg = distances[current]
+            current = min(remaining, key=lambda j: (leg[j], j))
+            remaining.discard(current)
+            order.append(current)
+        return order
+
+    def _two_opt(self, distances, order):
+        """
+        Reverse segments of the tour while that makes it cheaper. Costs can differ by direction
+        (terrain is paid on the cell entered), so the reversed segment is priced from prefix sums
+        of the legs walked backwards.
+        """
+        tour = [0] + order
+        n = len(tour) - 1
+
+        def prefix_costs():
+            # Cost of the tour up to each position, walked forwards and backwards
+            forward, backward = [0], [0]
+            for i in range(n):
+                forward.append(forward[-1] + distances[tour[i]][tour[i + 1]])
+                backward.append(backward[-1] + distances[tour[i + 1]][tour[i]])
+            return forward, backward
+
+        improved = True
+        while improved:
+            improved = False
+            forward, backward = prefix_costs()
+            for i in range(1, n):
+                for j in range(i + 1, n + 1):
+                    # Reverse tour[i..j]: tour[i - 1] -> tour[j] ... tour[i] -> tour[j + 1]
+                    old = distances[tour[i - 1]][tour[i]] + forward[j] - forward[i]
+                    new = distances[tour[i - 1]][tour[j]] + backward[j] - backward[i]
+                    if j < n:
+                        old += distances[tour[j]][tour[j + 1]]
+                        new += distances[tour[i]][tour[j + 1]]
+                    if new < old - 1e-9:
+                        tour[i:j + 1] = tour[i:j + 1][::-1]
+                        forward, backward = prefix_costs()
+                        improved = True
+        return tour[1:]
+
+    @staticmethod
+    def _order_cost(distances, order):
+        return sum(distances[previous][current] for previous, current in zip([0] + order, order))
+
+    def _leg_path(self, start, goal):
+        """Moves of the cheapest path between two tour points"""
+        if start == goal:
+            return []
+        leg = AStar(grid=self.grid, start=start, goals=[goal], walls=self.walls, terrain=self.terrain, movement=self.movement)
+        leg.memory_tracker = self.memory_tracker
+        leg.return_visited = False
+        _, nodes_visited, path, _ = leg.search()
+        self.nodes_visited += nodes_visited
+        return path
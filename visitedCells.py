@@ -0,0 +1,45 @@
+class VisitedCells:
+    def __init__(self, grid, cells=()):
+        """
+        Visited cells of a search result stored as a bitmap, one bit per grid cell in row-major
+        order, instead of a list of (x, y) tuples. Iterating yields the cells as (x, y) tuples
+        in row-major order, so it can be used wherever the list was. Cells outside the grid
+        are left out.
+        """
+        self.rows, self.cols = grid
+        self.bits = bytearray((self.rows * self.cols + 7) // 8)
+
+        bits, rows, cols = self.bits, self.rows, self.cols
+        for x, y in cells:
+            if 0 <= x < cols and 0 <= y < rows:
+                i = y * cols + x
+                bits[i >> 3] |= 1 << (i & 7)
+        self.count = int.from_bytes(bits, "little").bit_count()
+
+    def __contains__(self, pos):
+        x, y = pos
+        if not (0 <= x < self.cols and 0 <= y < self.rows):
+            return False
+        i = y * self.cols + x
+        return bool(self.bits[i >> 3] & (1 << (i & 7)))
+
+    def __iter__(self):
+        """Yield the visited cells lazily, skipping empty bytes of the bitmap"""
+        cols = self.cols
+        for byte_index, byte in enumerate(self.bits):
+            if not byte:
+                continue
+            base = byte_index << 3
+            for bit in range(8):
+                if byte & (1 << bit):
+                    y, x = divmod(base + bit, cols)
+                    yield (x, y)
+
+    def __len__(self):
+        return self.count
+
+    def __bool__(self):
+        return self.count > 0
+
+    def __repr__(self):
+        return f"VisitedCells({self.count} of {self.rows}x{self.cols} cells)"